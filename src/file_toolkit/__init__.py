@@ -3,18 +3,59 @@ File Manager Package
 
 Provides utilities for managing files, directories, compression, synchronization,
 hashing, and monitoring with a progress bar.
+
+Submodules are imported lazily (PEP 562): ``import file_toolkit`` only loads this
+file, and a submodule is imported the first time one of its names is accessed.
 """
 
-from .progress import ProgressPercentage
-from .file_ops import *
-from .zip_ops import *
-from .hash_ops import *
-from .search_ops import *
-from .stats_ops import *
-from .sync_ops import *
-from .monitor_ops import *
-from .temp_file_utils import *
-
-__all__ = [
-    "ProgressPercentage",
-] + file_ops.__all__ + zip_ops.__all__ + hash_ops.__all__ + search_ops.__all__ + stats_ops.__all__ + sync_ops.__all__ + monitor_ops.__all__ + temp_file_utils.__all__
+import importlib
+
+# Public names of each submodule; must match the submodule's __all__
+_SUBMODULE_EXPORTS = {
+    "progress": ["ProgressPercentage"],
+    "log_utils": ["get_logger", "reset_logger", "error_handler", "log_lazy", "log_debug"],
+    "file_ops": [
+        "move_file", "move_directory", "copy_file", "copy_files", "delete_path", "purge_tree", "detach_tree", "rename_file",
+        "file_exists", "get_bytes_by_file_path", "map_file_bytes", "backup_file", "create_directory",
+        "GroupCommit", "write_text_file", "read_text_file", "iter_text_lines", "iter_text_chunks",
+        "write_binary_file", "write_json_file", "read_json_file", "write_jsonl_file", "read_jsonl_file",
+        "JsonArrayWriter", "iter_json_array", "copy_directory", "copy_directory_parallel",
+        "ensure_path_exists", "order_columns_by_schema", "reorder_csv_columns", "reorder_csv_files"
+    ],
+    "zip_ops": ["unzip_file", "zip_file"],
+    "hash_ops": ["get_file_hash", "find_duplicates"],
+    "search_ops": ["list_dir_contents", "get_files_matching_prefix", "search_file_content", "get_file_modified_since"],
+    "stats_ops": ["check_disk_space", "get_largest_files", "get_directory_size", "find_empty_directories"],
+    "sync_ops": ["sync_directories"],
+    "monitor_ops": ["watch_file"],
+    "temp_file_utils": ["create_temp_file", "create_temp_directory"],
+    "io_ops": ["AdaptiveBuffer", "CacheHints", "set_io_hints", "get_io_hints"],
+    "json_codec": ["JsonCodec", "get_json_codec", "set_json_backend", "available_json_backends"],
+    "backup_ops": ["BackupRepository"],
+    "rate_limit": ["TokenBucket", "IOThrottle", "set_io_limit", "clear_io_limits", "get_io_throttle"],
+}
+
+_SUBMODULES = frozenset(_SUBMODULE_EXPORTS) | {"aio"}
+
+_NAME_TO_SUBMODULE = {
+    name: module
+    for module, names in _SUBMODULE_EXPORTS.items()
+    for name in names
+}
+
+__all__ = [name for names in _SUBMODULE_EXPORTS.values() for name in names]
+
+def __getattr__(name: str):
+    module_name = _NAME_TO_SUBMODULE.get(name)
+    if module_name is not None:
+        value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | _SUBMODULES)
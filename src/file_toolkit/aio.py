@@ -0,0 +1,316 @@
+"""
+Asyncio counterparts of the core file_toolkit operations.
+
+Every coroutine runs the blocking implementation on a shared, bounded thread pool.
+Callers are admitted through an asyncio.Semaphore before reaching the pool, so a burst
+of requests waits on the event loop instead of piling up in the executor queue.
+Operations that stream data (copy, move, hash) check for cancellation after every
+chunk and remove partial outputs when the awaiting task is cancelled.
+"""
+
+import os
+import asyncio
+import functools
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+import logging
+
+if __package__:
+    from . import file_ops
+    from . import hash_ops
+    from . import search_ops
+    from . import sync_ops
+    from .progress import ProgressPercentage
+else:
+    import file_ops
+    import hash_ops
+    import search_ops
+    import sync_ops
+    from progress import ProgressPercentage
+
+__all__ = [
+    "configure_executor",
+    "shutdown_executor",
+    "copy_file",
+    "move_file",
+    "read_text_file",
+    "write_json_file",
+    "get_file_hash",
+    "list_dir_contents",
+    "sync_directories"
+]
+
+_DEFAULT_MAX_WORKERS = 8
+
+_executor: Optional[ThreadPoolExecutor] = None
+_max_workers = _DEFAULT_MAX_WORKERS
+_executor_lock = threading.Lock()
+_loop_limits: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+class _Cancelled(Exception):
+    """Raised inside a worker thread when the awaiting task was cancelled."""
+
+def configure_executor(max_workers: int = _DEFAULT_MAX_WORKERS) -> None:
+    """Sets the size of the shared thread pool used by all coroutines.
+
+    The previous pool finishes its running work in the background. The default
+    concurrency limit of each event loop follows the new size.
+
+    Args:
+        max_workers (int, optional): Maximum number of worker threads. Defaults to 8.
+
+    Raises:
+        ValueError: If max_workers is less than 1.
+    """
+    global _executor, _max_workers
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+    with _executor_lock:
+        old, _executor = _executor, None
+        _max_workers = max_workers
+        _loop_limits.clear()
+    if old is not None:
+        old.shutdown(wait=False)
+
+def shutdown_executor(wait: bool = True) -> None:
+    """Shuts down the shared thread pool. It is recreated on the next call.
+
+    Args:
+        wait (bool, optional): Whether to wait for running operations. Defaults to True.
+    """
+    global _executor
+    with _executor_lock:
+        old, _executor = _executor, None
+    if old is not None:
+        old.shutdown(wait=wait)
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=_max_workers, thread_name_prefix="file_toolkit_aio")
+        return _executor
+
+def _default_limit(loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+    limit = _loop_limits.get(loop)
+    if limit is None:
+        limit = _loop_limits[loop] = asyncio.Semaphore(_max_workers)
+    return limit
+
+def _progress_relay(loop: asyncio.AbstractEventLoop, cancel_event: threading.Event, callback):
+    """Builds a worker-side progress callback that honours cancellation.
+
+    A user callback is invoked on the event loop thread; a ProgressPercentage (or any
+    callback built here for the worker) is invoked directly.
+    """
+    def relay(bytes_amount: int):
+        if cancel_event.is_set():
+            raise _Cancelled("Operation cancelled")
+        if callback is None:
+            return
+        if isinstance(callback, ProgressPercentage):
+            callback(bytes_amount)
+            return
+        try:
+            loop.call_soon_threadsafe(callback, bytes_amount)
+        except RuntimeError:
+            # Loop already closed; progress is best effort
+            pass
+    return relay
+
+def _remove_quietly(path: Optional[str]) -> None:
+    if path and os.path.isfile(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+async def _run(func, *args, concurrency: Optional[asyncio.Semaphore] = None,
+               cancel_event: Optional[threading.Event] = None, **kwargs) -> Any:
+    """Runs a blocking callable on the shared pool behind a concurrency limit.
+
+    The slot is released when the worker thread finishes, not when the awaiting task
+    does. On cancellation the worker is signalled through cancel_event and awaited.
+    Without a cancel_event the worker cannot be interrupted: the task is cancelled
+    right away and the worker finishes in the background, still holding its slot.
+    """
+    loop = asyncio.get_running_loop()
+    limit = concurrency or _default_limit(loop)
+    await limit.acquire()
+    try:
+        future = loop.run_in_executor(_get_executor(), functools.partial(func, *args, **kwargs))
+    except BaseException:
+        limit.release()
+        raise
+    future.add_done_callback(lambda _: limit.release())
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        if cancel_event is not None:
+            cancel_event.set()
+            try:
+                await future
+            except (Exception, asyncio.CancelledError):
+                pass
+        raise
+
+async def copy_file(source_file_path: str, destination_path: str, log: Optional[logging.Logger] = None,
+                    progress_callback=None, concurrency: Optional[asyncio.Semaphore] = None, **kwargs) -> str:
+    """Copies a file to another location without blocking the event loop.
+
+    Args:
+        source_file_path (str): Path to the source file.
+        destination_path (str): Path to the destination directory.
+        log (logging.Logger, optional): Logger for auditing. If None, uses get_logger().
+        progress_callback (Optional[callable]): Called on the event loop with bytes per chunk.
+            If None, progress is logged with ProgressPercentage as in file_ops.copy_file.
+        concurrency (Optional[asyncio.Semaphore]): Limit shared by a group of calls. Defaults to
+            one semaphore per event loop sized like the executor.
+        **kwargs: Extra keyword arguments for file_ops.copy_file (engine, clone, ...).
+
+    Returns:
+        str: Path to the copied file in the destination.
+    """
+    logger = log or file_ops.get_logger()
+    loop = asyncio.get_running_loop()
+    cancel_event = threading.Event()
+    if progress_callback is None and os.path.isfile(source_file_path):
+        progress_callback = ProgressPercentage(source_file_path, os.path.getsize(source_file_path), logger)
+    relay = _progress_relay(loop, cancel_event, progress_callback)
+    destination_file_path = os.path.join(destination_path, os.path.basename(source_file_path))
+
+    def work():
+        try:
+            return file_ops.copy_file(source_file_path, destination_path, logger, relay, **kwargs)
+        except _Cancelled:
+            _remove_quietly(destination_file_path)
+            raise
+
+    return await _run(work, concurrency=concurrency, cancel_event=cancel_event)
+
+async def move_file(source_file_path: str, destination_path: str, log: Optional[logging.Logger] = None,
+                    progress_callback=None, concurrency: Optional[asyncio.Semaphore] = None) -> str:
+    """Moves a file without blocking the event loop.
+
+    A cancelled cross-device move leaves the source in place and removes the partial copy.
+
+    Args:
+        source_file_path (str): Source file path.
+        destination_path (str): Destination directory path.
+        log (logging.Logger, optional): Logger for auditing. If None, uses get_logger().
+        progress_callback (Optional[callable]): Called on the event loop with bytes per chunk.
+        concurrency (Optional[asyncio.Semaphore]): Limit shared by a group of calls.
+
+    Returns:
+        str: Path of the moved file in the destination path.
+    """
+    logger = log or file_ops.get_logger()
+    loop = asyncio.get_running_loop()
+    cancel_event = threading.Event()
+    relay = _progress_relay(loop, cancel_event, progress_callback)
+    destination_file_path = os.path.join(destination_path, os.path.basename(source_file_path))
+
+    def work():
+        try:
+            return file_ops.move_file(source_file_path, destination_path, logger, relay)
+        except _Cancelled:
+            if os.path.exists(source_file_path):
+                _remove_quietly(destination_file_path)
+            raise
+
+    return await _run(work, concurrency=concurrency, cancel_event=cancel_event)
+
+async def read_text_file(file_path: str, encoding: str = 'utf-8', log: Optional[logging.Logger] = None,
+                         concurrency: Optional[asyncio.Semaphore] = None) -> str:
+    """Reads the content of a text file without blocking the event loop.
+
+    Args:
+        file_path (str): Path to the text file.
+        encoding (str, optional): File encoding. Defaults to 'utf-8'.
+        log (Optional[logging.Logger], optional): Logger for auditing. If None, a default logger is used.
+        concurrency (Optional[asyncio.Semaphore]): Limit shared by a group of calls.
+
+    Returns:
+        str: Content of the file.
+    """
+    return await _run(file_ops.read_text_file, file_path, encoding, log, concurrency=concurrency)
+
+async def write_json_file(file_path: str, data: Any, log: Optional[logging.Logger] = None,
+                          concurrency: Optional[asyncio.Semaphore] = None, **kwargs) -> str:
+    """Writes JSON data to a file without blocking the event loop.
+
+    Args:
+        file_path (str): Path to the output JSON file.
+        data (Any): Data to be serialized as JSON.
+        log (Optional[logging.Logger], optional): Logger for auditing. If None, a default logger is used.
+        concurrency (Optional[asyncio.Semaphore]): Limit shared by a group of calls.
+        **kwargs: Extra keyword arguments for file_ops.write_json_file (indent, sort_keys, ...).
+
+    Returns:
+        str: Path to the written file.
+    """
+    return await _run(file_ops.write_json_file, file_path, data, log=log, concurrency=concurrency, **kwargs)
+
+async def get_file_hash(file_path: str, algorithm: str = 'sha256', chunk_size: Optional[int] = None,
+                        log: Optional[logging.Logger] = None, progress_callback=None,
+                        concurrency: Optional[asyncio.Semaphore] = None) -> str:
+    """Calculates the hash of a file without blocking the event loop.
+
+    Args:
+        file_path (str): File path.
+        algorithm (str): Hash algorithm (e.g., 'md5', 'sha1', 'sha256').
+        chunk_size (Optional[int]): Fixed read block size, or None for adaptive sizing.
+        log (logging.Logger, optional): Logger for auditing. If None, uses get_logger().
+        progress_callback (Optional[callable]): Called on the event loop with bytes per chunk.
+        concurrency (Optional[asyncio.Semaphore]): Limit shared by a group of calls.
+
+    Returns:
+        str: Hash in hexadecimal.
+    """
+    loop = asyncio.get_running_loop()
+    cancel_event = threading.Event()
+    relay = _progress_relay(loop, cancel_event, progress_callback)
+    return await _run(hash_ops.get_file_hash, file_path, algorithm, chunk_size, log, relay,
+                      concurrency=concurrency, cancel_event=cancel_event)
+
+async def list_dir_contents(directory_path: str, include_dirs: bool = False, recursive: bool = False,
+                            log: Optional[logging.Logger] = None,
+                            concurrency: Optional[asyncio.Semaphore] = None) -> List[Dict[str, Any]]:
+    """Lists files and directories in a path without blocking the event loop.
+
+    Args:
+        directory_path (str): Directory path.
+        include_dirs (bool): Include directories in the result.
+        recursive (bool): Performs a recursive search.
+        log (logging.Logger, optional): Logger for auditing. If None, uses get_logger().
+        concurrency (Optional[asyncio.Semaphore]): Limit shared by a group of calls.
+
+    Returns:
+        List[Dict[str, Any]]: List of file/directory information.
+    """
+    return await _run(search_ops.list_dir_contents, directory_path, include_dirs, recursive, log,
+                      concurrency=concurrency)
+
+async def sync_directories(source_dir: str, target_dir: str, delete: bool = False,
+                           ignore_patterns: Optional[List[str]] = None, log: Optional[logging.Logger] = None,
+                           concurrency: Optional[asyncio.Semaphore] = None) -> Dict[str, int]:
+    """Synchronizes a source directory into a destination without blocking the event loop.
+
+    Cancelling the awaiting task stops waiting but lets the running sync finish.
+
+    Args:
+        source_dir (str): Source directory.
+        target_dir (str): Destination directory.
+        delete (bool): Whether to delete files in the destination that do not exist in the source.
+        ignore_patterns (Optional[List[str]]): File/directory patterns to ignore.
+        log (logging.Logger, optional): Logger for auditing. If None, uses get_logger().
+        concurrency (Optional[asyncio.Semaphore]): Limit shared by a group of calls.
+
+    Returns:
+        Dict[str, int]: Statistics of the operations performed.
+    """
+    return await _run(sync_ops.sync_directories, source_dir, target_dir, delete, ignore_patterns, log,
+                      concurrency=concurrency)
@@ -0,0 +1,354 @@
+import os
+import json
+import time
+import hashlib
+import tempfile
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Union
+if __package__:
+    from .log_utils import get_logger, error_handler, log_debug
+    from .hash_ops import get_file_hash
+    from .file_ops import _copy2
+    from .rate_limit import get_io_throttle
+else:
+    from log_utils import get_logger, error_handler, log_debug
+    from hash_ops import get_file_hash
+    from file_ops import _copy2
+    from rate_limit import get_io_throttle
+import logging
+
+__all__ = [
+    "BackupRepository"
+]
+
+_OBJECTS_DIR = "objects"
+_VERSIONS_DIR = "versions"
+_INDEX_DIR = "index"
+
+def _current_umask() -> int:
+    """
+    Process umask, read without changing it where the platform allows.
+
+    Returns:
+        Permission bits masked out of newly created files
+    """
+    try:
+        with open("/proc/self/status", 'r') as f:
+            for line in f:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError):
+        pass
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+def _path_key(file_path: str) -> str:
+    """
+    Stable directory-safe key for a source path.
+
+    Args:
+        file_path: Absolute source path
+
+    Returns:
+        Hex digest identifying the path
+    """
+    return hashlib.sha1(file_path.encode("utf-8", "surrogateescape")).hexdigest()
+
+class BackupRepository:
+    """Content-addressed backup store with per-path version history.
+
+    Each distinct content is stored once under objects/ by its hash. A backup of a path
+    adds a version file under versions/ that is a hardlink to the object, so identical
+    versions of one or many paths share the same data blocks, and a compact JSON Lines
+    index per path records its versions. A file whose size and mtime match its latest
+    version (or whose hash does) is not stored again.
+
+    Retention is applied per path when it is backed up: a version is kept if it is among
+    the keep_last newest or younger than keep_within; the newest version is always kept.
+    An object is deleted when its last version link is removed (its link count drops to
+    one), so pruning never scans the whole repository. On file systems without hardlinks
+    the version files are plain copies.
+
+    The repository is safe to share between threads of one process, not between processes.
+
+    Args:
+        root (str): Repository directory. Created if missing.
+        algorithm (str, optional): Hash algorithm for content addressing. Defaults to 'sha256'.
+        keep_last (Optional[int], optional): Number of newest versions to keep per path.
+        keep_within (Optional[Union[timedelta, float]], optional): Keep versions newer than this
+            (timedelta or seconds).
+        clone (bool, optional): Try a copy-on-write reflink when storing new objects. Defaults to False.
+        log (Optional[logging.Logger], optional): Logger for auditing. If None, a default logger is used.
+
+    Raises:
+        ValueError: If keep_last is less than 1 or the algorithm is not supported.
+    """
+
+    def __init__(self, root: str, algorithm: str = 'sha256', keep_last: Optional[int] = None,
+                 keep_within: Optional[Union[timedelta, float]] = None, clone: bool = False,
+                 log: Optional[logging.Logger] = None):
+        if keep_last is not None and keep_last < 1:
+            raise ValueError(f"keep_last must be at least 1, got {keep_last}")
+        if algorithm not in hashlib.algorithms_available:
+            raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+
+        self.root = os.path.abspath(root)
+        self.algorithm = algorithm
+        self.keep_last = keep_last
+        self.keep_within = keep_within.total_seconds() if isinstance(keep_within, timedelta) else keep_within
+        self.clone = clone
+        self._log = log or get_logger()
+        self._lock = threading.Lock()
+
+        for name in (_OBJECTS_DIR, _VERSIONS_DIR, _INDEX_DIR):
+            os.makedirs(os.path.join(self.root, name), exist_ok=True)
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.root, _OBJECTS_DIR, digest[:2], digest[2:])
+
+    def _index_path(self, key: str) -> str:
+        return os.path.join(self.root, _INDEX_DIR, key[:2], f"{key}.jsonl")
+
+    def _read_index(self, key: str) -> List[Dict[str, Any]]:
+        index_path = self._index_path(key)
+        if not os.path.isfile(index_path):
+            return []
+        with open(index_path, 'r', encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def _rewrite_index(self, key: str, entries: List[Dict[str, Any]]) -> None:
+        index_path = self._index_path(key)
+        if not entries:
+            os.remove(index_path)
+            return
+        fd, temp_path = tempfile.mkstemp(prefix=".index.", suffix=".tmp", dir=os.path.dirname(index_path))
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                for entry in entries:
+                    f.write(json.dumps(entry, separators=(',', ':')) + '\n')
+            os.replace(temp_path, index_path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    def _store_object(self, file_path: str, digest: str) -> str:
+        """
+        Store the content of a file under its digest unless it is already present.
+
+        The copy draws from the I/O budgets set with rate_limit.set_io_limit, if any.
+
+        Returns:
+            Path of the object
+        """
+        object_path = self._object_path(digest)
+        if os.path.exists(object_path):
+            return object_path
+
+        os.makedirs(os.path.dirname(object_path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix=".object.", dir=os.path.dirname(object_path))
+        os.close(fd)
+        try:
+            throttle = get_io_throttle(file_path, temp_path)
+            if throttle:
+                throttle.acquire(ops=1)
+            _copy2(file_path, temp_path, self.clone, self._log, throttle)
+            os.chmod(temp_path, 0o444)
+            os.replace(temp_path, object_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return object_path
+
+    def _link_version(self, object_path: str, version_path: str) -> None:
+        os.makedirs(os.path.dirname(version_path), exist_ok=True)
+        try:
+            os.link(object_path, version_path)
+        except OSError:
+            _copy2(object_path, version_path, self.clone, self._log)
+
+    def _remove_version(self, key: str, entry: Dict[str, Any]) -> None:
+        version_path = os.path.join(self.root, _VERSIONS_DIR, key, entry['version'])
+        if os.path.exists(version_path):
+            os.remove(version_path)
+        object_path = self._object_path(entry['hash'])
+        try:
+            if os.stat(object_path).st_nlink <= 1:
+                os.remove(object_path)
+                log_debug(self._log, "Removed unreferenced object %s", entry['hash'])
+        except FileNotFoundError:
+            pass
+
+    def _apply_retention(self, key: str, entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        if not entries or (self.keep_last is None and self.keep_within is None):
+            return entries
+
+        now = time.time()
+        newest_first = list(reversed(entries))
+        kept, removed = [], []
+        for position, entry in enumerate(newest_first):
+            keep = position == 0
+            if self.keep_last is not None and position < self.keep_last:
+                keep = True
+            if self.keep_within is not None and now - entry['created'] <= self.keep_within:
+                keep = True
+            (kept if keep else removed).append(entry)
+
+        for entry in removed:
+            self._remove_version(key, entry)
+        if removed:
+            kept.reverse()
+            self._rewrite_index(key, kept)
+            self._log.info(f"Pruned {len(removed)} old versions of {entries[-1]['path']}")
+        return kept if removed else entries
+
+    def backup(self, file_path: str, quick_check: bool = True) -> str:
+        """Backs up a file, reusing stored content when it has not changed.
+
+        Args:
+            file_path (str): File to back up.
+            quick_check (bool, optional): Treat the file as unchanged when its size and mtime match
+                the latest version, without hashing it. Defaults to True.
+
+        Returns:
+            str: Path of the version file holding the backed up content.
+
+        Raises:
+            ValueError: If the file does not exist.
+        """
+        with error_handler(f"Backing up {file_path} to repository {self.root}", self._log):
+            if not os.path.isfile(file_path):
+                raise ValueError(f"File {file_path} does not exist.")
+
+            source = os.path.abspath(file_path)
+            key = _path_key(source)
+            before = os.stat(source)
+
+            with self._lock:
+                entries = self._read_index(key)
+                latest = entries[-1] if entries else None
+                if (quick_check and latest is not None and latest['size'] == before.st_size
+                        and latest['mtime_ns'] == before.st_mtime_ns):
+                    log_debug(self._log, "Unchanged since last backup (size and mtime): %s", source)
+                    return os.path.join(self.root, _VERSIONS_DIR, key, latest['version'])
+
+            digest = get_file_hash(source, self.algorithm, log=self._log)
+            if latest is not None and latest['hash'] == digest:
+                with self._lock:
+                    if self._read_index(key)[-1:] == [latest]:
+                        # Same content with a new mtime: remember it so the quick check hits next time
+                        latest = dict(latest, mtime_ns=before.st_mtime_ns, mode=before.st_mode & 0o7777)
+                        entries[-1] = latest
+                        self._rewrite_index(key, entries)
+                self._log.info(f"Unchanged since last backup: {source}")
+                return os.path.join(self.root, _VERSIONS_DIR, key, latest['version'])
+
+            with self._lock:
+                object_path = self._store_object(source, digest)
+                after = os.stat(source)
+                if (after.st_size, after.st_mtime_ns) != (before.st_size, before.st_mtime_ns):
+                    # The file changed while it was hashed; address the stored copy by its own content
+                    stored = get_file_hash(object_path, self.algorithm, log=self._log)
+                    if stored != digest:
+                        final_path = self._object_path(stored)
+                        os.makedirs(os.path.dirname(final_path), exist_ok=True)
+                        os.replace(object_path, final_path)
+                        object_path, digest = final_path, stored
+
+                _, ext = os.path.splitext(source)
+                version = f"{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}{ext}"
+                version_path = os.path.join(self.root, _VERSIONS_DIR, key, version)
+                self._link_version(object_path, version_path)
+
+                entry = {'path': source, 'version': version, 'hash': digest, 'size': after.st_size,
+                         'mtime_ns': after.st_mtime_ns, 'mode': after.st_mode & 0o7777, 'created': time.time()}
+                index_path = self._index_path(key)
+                os.makedirs(os.path.dirname(index_path), exist_ok=True)
+                with open(index_path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(entry, separators=(',', ':')) + '\n')
+
+                self._apply_retention(key, self._read_index(key))
+
+            self._log.info(f"Created backup: {version_path}")
+            return version_path
+
+    def versions(self, file_path: str) -> List[Dict[str, Any]]:
+        """Lists the stored versions of a path, oldest first.
+
+        Args:
+            file_path (str): Source path that was backed up.
+
+        Returns:
+            List[Dict[str, Any]]: One dict per version with 'version', 'hash', 'size',
+            'mtime_ns', 'mode' (permission bits), 'created' and 'backup_path'.
+        """
+        key = _path_key(os.path.abspath(file_path))
+        with self._lock:
+            entries = self._read_index(key)
+        return [dict(entry, backup_path=os.path.join(self.root, _VERSIONS_DIR, key, entry['version']))
+                for entry in entries]
+
+    def restore(self, file_path: str, destination: Optional[str] = None, version: Optional[str] = None) -> str:
+        """Restores a version of a path.
+
+        The restored file gets the permission bits the version was backed up with
+        (0o644 minus the umask for versions recorded without them).
+
+        Args:
+            file_path (str): Source path that was backed up.
+            destination (Optional[str], optional): Where to write the content. Defaults to file_path.
+            version (Optional[str], optional): Version name from versions(). Defaults to the latest.
+
+        Returns:
+            str: Path of the restored file.
+
+        Raises:
+            ValueError: If the path has no backups or the version does not exist.
+        """
+        with error_handler(f"Restoring {file_path} from repository {self.root}", self._log):
+            entries = self.versions(file_path)
+            if version is not None:
+                entries = [entry for entry in entries if entry['version'] == version]
+            if not entries:
+                raise ValueError(f"No backup of {file_path}" + (f" with version {version}" if version else ""))
+
+            target = destination or file_path
+            directory = os.path.dirname(target)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            _copy2(entries[-1]['backup_path'], target, self.clone, self._log)
+            # Objects are stored read-only; give the file back the mode it was backed up with
+            mode = entries[-1].get('mode')
+            os.chmod(target, mode if mode is not None else 0o644 & ~_current_umask())
+            self._log.info(f"Restored {entries[-1]['backup_path']} to {target}")
+            return target
+
+    def prune(self, file_path: Optional[str] = None) -> int:
+        """Applies the retention policy to one path, or to every path in the repository.
+
+        Backups already apply the policy to the path they back up; call this after changing
+        keep_last or keep_within.
+
+        Args:
+            file_path (Optional[str], optional): Source path. Defaults to None (all paths).
+
+        Returns:
+            int: Number of versions removed.
+        """
+        with error_handler(f"Pruning repository {self.root}", self._log):
+            if file_path is not None:
+                keys = [_path_key(os.path.abspath(file_path))]
+            else:
+                index_root = os.path.join(self.root, _INDEX_DIR)
+                keys = [name[:-len(".jsonl")]
+                        for bucket in os.listdir(index_root)
+                        for name in os.listdir(os.path.join(index_root, bucket)) if name.endswith(".jsonl")]
+
+            removed = 0
+            with self._lock:
+                for key in keys:
+                    entries = self._read_index(key)
+                    removed += len(entries) - len(self._apply_retention(key, entries))
+            return removed
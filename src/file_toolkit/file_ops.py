@@ -1,67 +1,74 @@
 import os
+import re
+import csv
+import sys
+import errno
 import shutil
 import json
+import mmap
+import zlib
+import fnmatch
+import hashlib
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+from operator import itemgetter
 from datetime import datetime
-from typing import List, Dict, Any, Optional
-from progress import ProgressPercentage
-from logging_metrics import configure_basic_logging
+from typing import List, Dict, Any, Optional, Iterable, Tuple, Union, Callable
+# Relative imports inside the package, so that file_toolkit.set_io_limit and friends configure
+# the same module objects these functions use; top-level imports when src/file_toolkit is on sys.path
+if __package__:
+    from .progress import ProgressPercentage
+    from .io_ops import AdaptiveBuffer, CacheHints, _resolve_io_hints
+    from .json_codec import get_json_codec
+    from .rate_limit import IOThrottle, get_io_throttle
+    from .hash_ops import get_file_hash
+    from .log_utils import get_logger, error_handler, log_debug
+else:
+    from progress import ProgressPercentage
+    from io_ops import AdaptiveBuffer, CacheHints, _resolve_io_hints
+    from json_codec import get_json_codec
+    from rate_limit import IOThrottle, get_io_throttle
+    from hash_ops import get_file_hash
+    from log_utils import get_logger, error_handler, log_debug
 import logging
 from contextlib import contextmanager
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, ContextManager, Iterator
 
 __all__ = [
     "move_file",
     "move_directory",
     "copy_file",
+    "copy_files",
     "delete_path",
+    "purge_tree",
+    "detach_tree",
     "rename_file",
     "file_exists",
     "get_bytes_by_file_path",
+    "map_file_bytes",
     "backup_file",
     "create_directory",
+    "GroupCommit",
     "write_text_file",
     "read_text_file",
+    "iter_text_lines",
+    "iter_text_chunks",
     "write_binary_file",
     "write_json_file",
     "read_json_file",
+    "write_jsonl_file",
+    "read_jsonl_file",
+    "JsonArrayWriter",
+    "iter_json_array",
     "copy_directory",
+    "copy_directory_parallel",
     "ensure_path_exists",
-    "order_columns_by_schema"
+    "order_columns_by_schema",
+    "reorder_csv_columns",
+    "reorder_csv_files"
 ]
 
-def get_logger() -> logging.Logger:
-    """Initializes and returns a logger with a printout to the console.
-
-    Returns:
-        logging.Logger: Basic logger.
-    """
-    return configure_basic_logging()
-
-@contextmanager
-def error_handler(operation: str, logger: Optional[logging.Logger] = None, reraise: bool = True):
-    """
-    Context manager for handling errors in file operations.
-
-    Args:
-        operation: Description of the operation being performed
-        logger: Logger for recording errors
-        reraise: Whether to raise exceptions again after logging
-    """
-    try:
-        yield
-    except FileNotFoundError as e:
-        logger.error(f"{operation} failed: File not found - {str(e)}")
-        if reraise:
-            raise
-    except PermissionError as e:
-        logger.error(f"{operation} failed: Permission denied - {str(e)}")
-        if reraise:
-            raise
-    except Exception as e:
-        logger.error(f"{operation} failed: {str(e)}")
-        if reraise:
-            raise
-
 def _format_size(size_bytes: int) -> str:
     """
     Convert bytes to human-readable format.
@@ -77,36 +84,919 @@ def _format_size(size_bytes: int) -> str:
             return f"{size_bytes:.2f} {unit}"
         size_bytes /= 1024
 
+_DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+_DEFAULT_MAX_INFLIGHT_BYTES = 256 * 1024 * 1024
+
+_DEFAULT_RANGE_SIZE = 64 * 1024 * 1024
+
+_DEFAULT_CHECKPOINT_BYTES = 64 * 1024 * 1024
+
+_PARTIAL_SUFFIX = ".partial"
+
+_CSV_CHUNK_ROWS = 10000
+
+_TSV_EXTENSIONS = (".tsv", ".tab")
+
+_VERIFY_MODES = ("none", "sample", "full")
+
+_VERIFY_SAMPLES = 16
+
+_VERIFY_SAMPLE_SIZE = 64 * 1024
+
+_COPY_ENGINES = ("auto", "copy_file_range", "sendfile", "buffered")
+
+# errno values meaning "this kernel/filesystem pair cannot do it", not a real I/O error
+_ENGINE_FALLBACK_ERRNOS = {
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP,
+    errno.ENOTSUP, errno.EBADF, errno.EPERM, errno.ENOTSOCK,
+}
+
+# ioctl request number of FICLONE (linux/fs.h)
+_FICLONE = 0x40049409
+
+_DURABILITY_POLICIES = ("none", "fsync")
+
+def _try_reflink(src, dst) -> bool:
+    """
+    Share the source extents with the destination through the FICLONE ioctl.
+
+    Args:
+        src: Source file object opened in binary read mode
+        dst: Destination file object opened in binary write mode
+
+    Returns:
+        True if the filesystem cloned the file, False if reflinks are not supported
+    """
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        import fcntl
+    except ImportError:
+        return False
+
+    try:
+        fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        return True
+    except OSError as e:
+        if e.errno in _ENGINE_FALLBACK_ERRNOS or e.errno == errno.ENOTTY:
+            return False
+        raise
+
+def _copy_file_contents(source_file_path: str, destination_file_path: str, clone: bool = False, engine: str = "auto",
+                        progress_callback=None, logger: Optional[logging.Logger] = None,
+                        range_workers: Optional[int] = None, range_size: int = _DEFAULT_RANGE_SIZE,
+                        buffer_size: Optional[int] = None, sparse: Optional[bool] = None,
+                        io_hints: Optional[str] = None, throttle: Optional[IOThrottle] = None,
+                        hash_obj=None) -> int:
+    """
+    Copy file data, trying a copy-on-write clone first when requested.
+
+    Args:
+        source_file_path: Source file path
+        destination_file_path: Destination file path (created or truncated)
+        clone: Whether to try a reflink before copying bytes
+        engine: Copy engine used when no clone is made
+        progress_callback: Called with the number of bytes of each chunk
+        logger: Logger for engine selection messages
+        range_workers: Copy ranges of range_size bytes on this many threads when the file is larger than one range
+        range_size: Size of each range in bytes
+        buffer_size: Fixed chunk size in bytes, or None to size chunks adaptively
+        sparse: Copy only data extents and keep holes. None does so when the source has
+            fewer allocated blocks than its size; False always copies every byte
+        io_hints: Page-cache policy for both files ('none', 'sequential', 'dontneed' or None for the default)
+        throttle: Byte budget drawn for every chunk of data copied (holes and clones are free)
+        hash_obj: hashlib object updated with every chunk; the data then goes through the buffered
+            loop, so no clone, sparse or range copy is made
+
+    Returns:
+        Number of bytes copied or cloned (logical bytes for sparse copies)
+    """
+    if hash_obj is not None:
+        clone = False
+        sparse = False
+        range_workers = None
+
+    with open(source_file_path, 'rb') as src, open(destination_file_path, 'wb') as dst:
+        if clone and _try_reflink(src, dst):
+            size = os.fstat(src.fileno()).st_size
+            if logger:
+                log_debug(logger, "Cloned %s with a reflink", source_file_path)
+            if progress_callback:
+                progress_callback(size)
+            return size
+
+        st = os.fstat(src.fileno())
+        size = st.st_size
+        with CacheHints(src.fileno(), io_hints) as src_hints, CacheHints(dst.fileno(), io_hints) as dst_hints:
+            if size and (sparse or (sparse is None and _is_sparse(st))):
+                extents = _data_extents(src.fileno(), size)
+                if extents is not None:
+                    copied = _copy_sparse(src.fileno(), dst.fileno(), size, extents, engine, progress_callback, throttle)
+                    if logger:
+                        log_debug(logger, "Copied %s data extents of %s (%s logical)", len(extents),
+                                  source_file_path, _format_size(size))
+                    return copied
+
+            if throttle:
+                progress_callback = throttle.wrap(progress_callback)
+            if range_workers and range_workers > 1 and size > range_size:
+                # Ranges finish out of order: the pages are only dropped when the hints close
+                return _copy_ranges(src.fileno(), dst.fileno(), size, range_workers, range_size, engine, progress_callback, logger)
+            return _copy_stream(src, dst, engine, buffer_size, src_hints.wrap(dst_hints.wrap(progress_callback)), logger, hash_obj)
+
+def _copy2(source_file_path: str, destination_file_path: str, clone: bool = False, logger: Optional[logging.Logger] = None,
+           throttle: Optional[IOThrottle] = None) -> str:
+    """
+    shutil.copy2 counterpart that tries a reflink first when clone is True, keeps
+    the holes of sparse files and draws every chunk from an I/O budget.
+
+    Args:
+        source_file_path: Source file path
+        destination_file_path: Destination file path
+        clone: Whether to try a reflink before copying bytes
+        logger: Logger for engine selection messages
+        throttle: Byte budget drawn for every chunk of data copied
+
+    Returns:
+        Destination file path
+    """
+    if not clone and throttle is None and not _is_sparse(os.stat(source_file_path)):
+        return shutil.copy2(source_file_path, destination_file_path)
+
+    _copy_file_contents(source_file_path, destination_file_path, clone=clone, logger=logger, throttle=throttle)
+    shutil.copystat(source_file_path, destination_file_path)
+    return destination_file_path
+
+def _engine_chain(engine: str) -> List[str]:
+    """
+    Resolve the copy engine name into the ordered list of engines to try.
+
+    Args:
+        engine: Requested engine ('auto', 'copy_file_range', 'sendfile' or 'buffered')
+
+    Returns:
+        Engines to attempt, always ending with 'buffered'
+    """
+    if engine not in _COPY_ENGINES:
+        raise ValueError(f"Unknown copy engine '{engine}'. Expected one of {_COPY_ENGINES}.")
+
+    chain = []
+    if engine in ("auto", "copy_file_range") and hasattr(os, "copy_file_range"):
+        chain.append("copy_file_range")
+    if engine in ("auto", "sendfile") and hasattr(os, "sendfile") and sys.platform.startswith("linux"):
+        chain.append("sendfile")
+    chain.append("buffered")
+    return chain
+
+def _kernel_copy(engine: str, src_fd: int, dst_fd: int, offset: int, buffer: AdaptiveBuffer, progress_callback=None) -> int:
+    """
+    Copy from offset until EOF inside the kernel with copy_file_range or sendfile.
+
+    Args:
+        engine: 'copy_file_range' or 'sendfile'
+        src_fd: Source file descriptor
+        dst_fd: Destination file descriptor
+        offset: Byte offset to resume from (same for source and destination)
+        buffer: Adaptive sizing state; its size is the maximum bytes per syscall
+        progress_callback: Called with the number of bytes of each chunk
+
+    Returns:
+        Offset reached when EOF was hit
+
+    Raises:
+        OSError: If the engine is not usable for these descriptors
+    """
+    start = offset
+    if engine == "sendfile":
+        os.lseek(dst_fd, offset, os.SEEK_SET)
+
+    while True:
+        if engine == "copy_file_range":
+            copied = os.copy_file_range(src_fd, dst_fd, buffer.size, offset, offset)
+        else:
+            copied = os.sendfile(dst_fd, src_fd, offset, buffer.size)
+
+        if copied == 0:
+            # Some filesystems report 0 instead of failing, and pseudo-files (procfs, sysfs)
+            # report st_size 0 while holding data; let the next engine decide
+            if offset == start:
+                size = os.fstat(src_fd).st_size
+                if size > offset or size == 0:
+                    raise OSError(errno.EOPNOTSUPP, f"{engine} copied no data")
+            return offset
+
+        offset += copied
+        buffer.update(copied)
+        if progress_callback:
+            progress_callback(copied)
+
+def _copy_stream(src, dst, engine: str = "auto", buffer_size: Optional[int] = None, progress_callback=None, logger: Optional[logging.Logger] = None,
+                 hash_obj=None) -> int:
+    """
+    Copy an open source file into an open destination file, trying the zero-copy engines first.
+
+    Args:
+        src: Source file object opened in binary read mode
+        dst: Destination file object opened in binary write mode
+        engine: Copy engine ('auto', 'copy_file_range', 'sendfile' or 'buffered')
+        buffer_size: Fixed chunk size in bytes, or None to size chunks adaptively
+        progress_callback: Called with the number of bytes of each chunk
+        logger: Logger for engine selection messages
+        hash_obj: hashlib object updated with every chunk (tee hashing); forces the buffered loop
+
+    Returns:
+        Number of bytes copied
+    """
+    if buffer_size:
+        buffer = AdaptiveBuffer(initial_size=buffer_size, adaptive=False)
+    else:
+        buffer = AdaptiveBuffer.for_fd(src.fileno())
+
+    offset = 0
+    # Kernel engines never expose the data to user space, so hashing needs the buffered loop
+    for name in _engine_chain("buffered" if hash_obj is not None else engine):
+        if name == "buffered":
+            break
+        try:
+            offset = _kernel_copy(name, src.fileno(), dst.fileno(), offset, buffer, progress_callback)
+            if logger:
+                log_debug(logger, "Copied %s with %s", _format_size(offset), name)
+            return offset
+        except OSError as e:
+            if e.errno not in _ENGINE_FALLBACK_ERRNOS:
+                raise
+            if logger:
+                log_debug(logger, "%s unavailable (%s), falling back", name, e)
+
+    src.seek(offset)
+    dst.seek(offset)
+    while True:
+        chunk = buffer.readinto(src)
+        if not chunk:
+            break
+        dst.write(chunk)
+        if hash_obj is not None:
+            hash_obj.update(chunk)
+        offset += len(chunk)
+        buffer.update(len(chunk))
+        if progress_callback:
+            progress_callback(len(chunk))
+    return offset
+
+def _same_device(path: str, other_path: str) -> bool:
+    """
+    Check whether two existing paths live on the same device (st_dev).
+
+    Args:
+        path: First path
+        other_path: Second path
+
+    Returns:
+        True if both paths report the same device
+    """
+    return os.stat(path).st_dev == os.stat(other_path).st_dev
+
+def _copy_range(src_fd: int, dst_fd: int, start: int, end: int, use_kernel: bool, progress_callback=None) -> int:
+    """
+    Copy bytes [start, end) at the same offsets with positional I/O.
+
+    Args:
+        src_fd: Source file descriptor
+        dst_fd: Destination file descriptor
+        start: First byte of the range
+        end: End of the range (exclusive)
+        use_kernel: Try os.copy_file_range before os.pread/os.pwrite
+        progress_callback: Called with the number of bytes of each chunk
+
+    Returns:
+        Number of bytes copied
+    """
+    offset = start
+    while offset < end:
+        count = min(_DEFAULT_BUFFER_SIZE, end - offset)
+        copied = 0
+        if use_kernel:
+            try:
+                copied = os.copy_file_range(src_fd, dst_fd, count, offset, offset)
+            except OSError as e:
+                if e.errno not in _ENGINE_FALLBACK_ERRNOS:
+                    raise
+                use_kernel = False
+        if not copied:
+            view = memoryview(os.pread(src_fd, count, offset))
+            if not view:
+                break
+            copied = len(view)
+            while view:
+                written = os.pwrite(dst_fd, view, offset + copied - len(view))
+                view = view[written:]
+        offset += copied
+        if progress_callback:
+            progress_callback(copied)
+    return offset - start
+
+def _is_sparse(st: os.stat_result) -> bool:
+    """
+    Check whether a file has fewer allocated blocks than its size implies (holes).
+
+    Args:
+        st: Result of os.stat/os.fstat
+
+    Returns:
+        True if the file looks sparse
+    """
+    blocks = getattr(st, "st_blocks", None)
+    return blocks is not None and blocks * 512 < st.st_size
+
+def _data_extents(fd: int, size: int) -> Optional[List[Tuple[int, int]]]:
+    """
+    Find the data extents of a file with SEEK_DATA/SEEK_HOLE.
+
+    Args:
+        fd: Open file descriptor
+        size: File size in bytes
+
+    Returns:
+        List of (start, end) byte ranges holding data, or None if the platform or
+        file system cannot report holes
+    """
+    if not hasattr(os, "SEEK_DATA"):
+        return None
+    extents = []
+    offset = 0
+    try:
+        while offset < size:
+            try:
+                start = os.lseek(fd, offset, os.SEEK_DATA)
+            except OSError as e:
+                # ENXIO: no data after offset, the rest is a hole
+                if e.errno == errno.ENXIO:
+                    break
+                raise
+            end = min(os.lseek(fd, start, os.SEEK_HOLE), size)
+            extents.append((start, end))
+            offset = end
+    except OSError as e:
+        if e.errno in (errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP):
+            return None
+        raise
+    finally:
+        os.lseek(fd, 0, os.SEEK_SET)
+    return extents
+
+def _copy_sparse(src_fd: int, dst_fd: int, size: int, extents: List[Tuple[int, int]], engine: str = "auto",
+                 progress_callback=None, throttle: Optional[IOThrottle] = None) -> int:
+    """
+    Copy only the data extents of a file and recreate its holes.
+
+    Holes between extents are left unwritten and the trailing hole is restored with
+    ftruncate, so the destination stays sparse. Progress is reported in logical bytes:
+    holes count as copied.
+
+    Args:
+        src_fd: Source file descriptor
+        dst_fd: Destination file descriptor (empty)
+        size: Logical size of the source
+        extents: Data extents from _data_extents
+        engine: Copy engine; kernel copies are used unless it is 'buffered' or 'sendfile'
+        progress_callback: Called with the number of logical bytes of each chunk
+        throttle: Byte budget drawn for the data extents only
+
+    Returns:
+        Logical number of bytes copied (the file size)
+    """
+    use_kernel = "copy_file_range" in _engine_chain(engine)
+    data_callback = throttle.wrap(progress_callback) if throttle else progress_callback
+    position = 0
+    for start, end in extents:
+        if progress_callback and start > position:
+            progress_callback(start - position)
+        _copy_range(src_fd, dst_fd, start, end, use_kernel, data_callback)
+        position = end
+    os.ftruncate(dst_fd, size)
+    if progress_callback and size > position:
+        progress_callback(size - position)
+    return size
+
+def _copy_ranges(src_fd: int, dst_fd: int, size: int, workers: int, range_size: int, engine: str = "auto", progress_callback=None, logger: Optional[logging.Logger] = None) -> int:
+    """
+    Copy a file as independent ranges on a thread pool into a preallocated destination.
+
+    Args:
+        src_fd: Source file descriptor
+        dst_fd: Destination file descriptor
+        size: Number of bytes to copy
+        workers: Number of threads
+        range_size: Size of each range in bytes
+        engine: 'buffered' forces os.pread/os.pwrite, anything else tries os.copy_file_range
+        progress_callback: Thread-safe callback called with the number of bytes of each chunk
+        logger: Logger for debug messages
+
+    Returns:
+        Number of bytes copied
+    """
+    if hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(dst_fd, 0, size)
+        except OSError:
+            pass
+    os.ftruncate(dst_fd, size)
+
+    use_kernel = engine != "buffered" and hasattr(os, "copy_file_range")
+    ranges = [(start, min(start + range_size, size)) for start in range(0, size, range_size)]
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_copy_range, src_fd, dst_fd, start, end, use_kernel, progress_callback)
+                   for start, end in ranges]
+        copied = sum(f.result() for f in futures)
+
+    if logger:
+        log_debug(logger, "Copied %s in %s ranges with %s workers", _format_size(copied), len(ranges), workers)
+    return copied
+
+def _resume_offset(source: str, st: os.stat_result, partial_path: str, checkpoint_path: str,
+                   buffer: AdaptiveBuffer, logger: logging.Logger) -> Tuple[int, int]:
+    """
+    Find where an interrupted resumable copy can continue.
+
+    The checkpoint is only trusted when it was written for the same source path, size and
+    mtime, and the CRC-32 of the partial file's prefix matches the recorded one.
+
+    Args:
+        source: Absolute source path
+        st: Current stat of the source
+        partial_path: Partial destination file
+        checkpoint_path: JSON checkpoint next to the partial file
+        buffer: Buffer used to re-read the prefix
+        logger: Logger for restart messages
+
+    Returns:
+        (offset, crc32) of the verified prefix; (0, 0) when the copy must start over
+    """
+    try:
+        with open(checkpoint_path, 'r', encoding='utf-8') as f:
+            checkpoint = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return 0, 0
+
+    if (checkpoint.get('source') != source or checkpoint.get('size') != st.st_size
+            or checkpoint.get('mtime_ns') != st.st_mtime_ns):
+        logger.info(f"Source {source} changed since the last checkpoint; restarting the copy")
+        return 0, 0
+
+    offset = checkpoint.get('offset', 0)
+    try:
+        if os.path.getsize(partial_path) < offset:
+            raise FileNotFoundError(partial_path)
+    except FileNotFoundError:
+        logger.warning(f"Partial copy {partial_path} is missing or truncated; restarting the copy")
+        return 0, 0
+
+    crc = 0
+    remaining = offset
+    with open(partial_path, 'rb', buffering=0) as f:
+        while remaining:
+            chunk = buffer.readinto(f)[:remaining]
+            if not chunk:
+                break
+            crc = zlib.crc32(chunk, crc)
+            remaining -= len(chunk)
+
+    if remaining or crc != checkpoint.get('crc32'):
+        logger.warning(f"Partial copy {partial_path} does not match its checkpoint; restarting the copy")
+        return 0, 0
+    return offset, crc
+
+def _copy_resumable(source_file_path: str, destination_file_path: str, checkpoint_bytes: int = _DEFAULT_CHECKPOINT_BYTES,
+                    buffer_size: Optional[int] = None, progress_callback=None,
+                    logger: Optional[logging.Logger] = None, io_hints: Optional[str] = None,
+                    throttle: Optional[IOThrottle] = None, checksum: Optional[str] = None) -> Tuple[int, Optional[str]]:
+    """
+    Copy through a .partial file with periodic checkpoints, continuing a previous attempt.
+
+    Every checkpoint_bytes the partial file is flushed to disk with fdatasync and a JSON
+    checkpoint (source path, size and mtime, offset and CRC-32 of the copied prefix) is
+    replaced atomically next to it. When the copy completes, the partial file is renamed onto
+    the destination and the checkpoint removed; on failure both are kept for the next attempt.
+
+    Args:
+        source_file_path: Source file path
+        destination_file_path: Final destination file path
+        checkpoint_bytes: Bytes copied between two checkpoints
+        buffer_size: Fixed chunk size in bytes, or None to size chunks adaptively
+        progress_callback: Called with the number of bytes of each chunk, and once with the resumed prefix
+        logger: Logger for resume messages
+        io_hints: Page-cache policy for both files
+        throttle: Byte budget drawn for every chunk copied and for re-reading the source prefix
+            (not for verifying the partial file)
+        checksum: Hash algorithm of the digest computed over the whole source; on resume the
+            prefix is re-read from the source, so the digest never comes from the partial file
+
+    Returns:
+        Size of the destination file and its digest (None without checksum)
+    """
+    logger = logger or get_logger()
+    partial_path = destination_file_path + _PARTIAL_SUFFIX
+    checkpoint_path = partial_path + ".json"
+    source = os.path.abspath(source_file_path)
+    datasync = getattr(os, "fdatasync", os.fsync)
+
+    with open(source_file_path, 'rb', buffering=0) as src:
+        st = os.fstat(src.fileno())
+        if buffer_size:
+            buffer = AdaptiveBuffer(initial_size=buffer_size, adaptive=False)
+        else:
+            buffer = AdaptiveBuffer.for_fd(src.fileno())
+
+        hash_obj = hashlib.new(checksum) if checksum else None
+        offset, crc = _resume_offset(source, st, partial_path, checkpoint_path, buffer, logger)
+        if offset:
+            logger.info(f"Resuming copy of {source_file_path} at {_format_size(offset)}")
+            if hash_obj is not None:
+                # Hash the source, not the partial copy, so verify='full' still compares two reads
+                remaining = offset
+                while remaining:
+                    chunk = buffer.readinto(src)[:remaining]
+                    if not chunk:
+                        break
+                    hash_obj.update(chunk)
+                    remaining -= len(chunk)
+                    if throttle:
+                        throttle.acquire(len(chunk))
+            if progress_callback:
+                progress_callback(offset)
+
+        def checkpoint(f):
+            json.dump({'source': source, 'size': st.st_size, 'mtime_ns': st.st_mtime_ns,
+                       'offset': offset, 'crc32': crc}, f)
+
+        # No O_TRUNC: the verified prefix is kept and only the tail is rewritten
+        fd = os.open(partial_path, os.O_WRONLY | os.O_CREAT, 0o666)
+        with os.fdopen(fd, 'wb') as dst, CacheHints(src.fileno(), io_hints, offset=offset) as src_hints, \
+                CacheHints(dst.fileno(), io_hints, offset=offset) as dst_hints:
+            dst.truncate(offset)
+            dst.seek(offset)
+            src.seek(offset)
+            checkpointed = offset
+            while chunk := buffer.readinto(src):
+                dst.write(chunk)
+                crc = zlib.crc32(chunk, crc)
+                if hash_obj is not None:
+                    hash_obj.update(chunk)
+                offset += len(chunk)
+                buffer.update(len(chunk))
+                src_hints.advance(len(chunk))
+                dst_hints.advance(len(chunk))
+                if throttle:
+                    throttle.acquire(len(chunk))
+                if progress_callback:
+                    progress_callback(len(chunk))
+                if offset - checkpointed >= checkpoint_bytes:
+                    # The data must be on disk before a checkpoint claims it
+                    dst.flush()
+                    datasync(dst.fileno())
+                    _write_with_policy(checkpoint_path, checkpoint, 'w', encoding='utf-8', atomic=True, durability="fsync")
+                    checkpointed = offset
+            dst.flush()
+            os.fsync(dst.fileno())
+
+    os.replace(partial_path, destination_file_path)
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    log_debug(logger, "Resumable copy of %s finished at %s", source_file_path, _format_size(offset))
+    return offset, hash_obj.hexdigest() if hash_obj is not None else None
+
+def _sample_offsets(size: int) -> List[int]:
+    """
+    Offsets of the blocks compared by a sampled verification.
+
+    Args:
+        size: File size
+
+    Returns:
+        Evenly spaced offsets including the first and last block, or [0] for small files
+    """
+    if size <= _VERIFY_SAMPLES * _VERIFY_SAMPLE_SIZE:
+        return [0]
+    last = size - _VERIFY_SAMPLE_SIZE
+    return [i * last // (_VERIFY_SAMPLES - 1) for i in range(_VERIFY_SAMPLES)]
+
+def _verify_destination(source_file_path: str, destination_file_path: str, verify: str,
+                        digest: Optional[str], algorithm: str) -> bool:
+    """
+    Confirm a finished copy with a fresh read of the destination.
+
+    Args:
+        source_file_path: Source file
+        destination_file_path: Copied file
+        verify: 'sample' compares evenly spaced blocks of both files (the whole file when it is
+            small), 'full' hashes the destination and compares it with digest
+        digest: Source digest computed while copying
+        algorithm: Algorithm of digest
+
+    Returns:
+        True if the copy matches
+    """
+    size = os.path.getsize(source_file_path)
+    if os.path.getsize(destination_file_path) != size:
+        return False
+    if verify == "full":
+        return get_file_hash(destination_file_path, algorithm) == digest
+
+    block = size if size <= _VERIFY_SAMPLES * _VERIFY_SAMPLE_SIZE else _VERIFY_SAMPLE_SIZE
+    with open(source_file_path, 'rb', buffering=0) as src, open(destination_file_path, 'rb', buffering=0) as dst:
+        for offset in _sample_offsets(size):
+            if os.pread(src.fileno(), block, offset) != os.pread(dst.fileno(), block, offset):
+                return False
+    return True
+
+def _check_copy(source_file_path: str, destination_file_path: str, verify: str, digest: Optional[str], algorithm: str) -> None:
+    """
+    Run the requested verification of a finished copy, removing a destination that fails it.
+
+    Raises:
+        OSError: If the destination does not match the source
+    """
+    if verify != "none" and not _verify_destination(source_file_path, destination_file_path, verify, digest, algorithm):
+        os.remove(destination_file_path)
+        raise OSError(errno.EIO, f"Copy of {source_file_path} failed {verify} verification", destination_file_path)
+
+def _copy2_checked(source_file_path: str, destination_file_path: str, checksum: Optional[str], verify: str,
+                   clone: bool = False, logger: Optional[logging.Logger] = None,
+                   throttle: Optional[IOThrottle] = None) -> Optional[str]:
+    """
+    _copy2 counterpart that hashes the data as it is copied and verifies the destination.
+
+    Args:
+        source_file_path: Source file
+        destination_file_path: Destination file
+        checksum: Hash algorithm of the returned digest, or None
+        verify: 'none', 'sample' or 'full' ('full' hashes with SHA-256 when checksum is None)
+        clone: Try a reflink when no digest is needed
+        logger: Logger for engine selection messages
+        throttle: Byte budget drawn for every chunk of data copied
+
+    Returns:
+        Digest of the source as copied, or None without checksum
+
+    Raises:
+        OSError: If the destination does not match the source
+    """
+    algorithm = checksum or 'sha256'
+    if checksum or verify == "full":
+        hash_obj = hashlib.new(algorithm)
+        _copy_file_contents(source_file_path, destination_file_path, logger=logger, throttle=throttle, hash_obj=hash_obj)
+        shutil.copystat(source_file_path, destination_file_path)
+        digest = hash_obj.hexdigest()
+    else:
+        _copy2(source_file_path, destination_file_path, clone, logger, throttle)
+        digest = None
+
+    _check_copy(source_file_path, destination_file_path, verify, digest, algorithm)
+    return digest if checksum else None
+
+def _check_verify_options(checksum: Optional[str], verify: str) -> None:
+    """
+    Validate the checksum and verify arguments of the copy functions.
+
+    Raises:
+        ValueError: If the algorithm is unknown or has a variable-length digest, or the
+            verify mode is unknown
+    """
+    if checksum is not None:
+        try:
+            digest_size = hashlib.new(checksum).digest_size
+        except (ValueError, TypeError):
+            raise ValueError(f"Unsupported hash algorithm: {checksum}")
+        # shake_128/shake_256 need a length for hexdigest(); fail before copying anything
+        if not digest_size:
+            raise ValueError(f"Hash algorithm {checksum} has a variable-length digest; use a fixed-length one")
+    if verify not in _VERIFY_MODES:
+        raise ValueError(f"Unknown verify mode '{verify}'. Expected one of {_VERIFY_MODES}.")
+
 def move_file(source_file_path: str, destination_path: str, log: Optional[logging.Logger] = None, progress_callback=None) -> str:
     """Moves a file from the source path to the destination path.
 
+    When source and destination are on the same device the file is renamed with
+    os.replace; otherwise it is streamed with copy_file and the source is removed.
+
     Args:
         source_file_path (str): Source file path.
         destination_path (str): Destination directory path.
+        log (logging.Logger, optional): Logger for auditing. If None, uses get_logger().
         progress_callback (Optional[callable]): Callback function for progress in bytes.
 
     Returns:
         str: Path of the moved file in the destination path.
+
+    Raises:
+        ValueError: If the source file does not exist.
     """
-    destination_file_path = copy_file(source_file_path, destination_path, progress_callback)
-    os.remove(source_file_path)
     logger = log or get_logger()
-    logger.info(f"Moved {source_file_path} to {destination_path}")
-    return destination_file_path
 
-def move_directory(source_dir_path: str, destination_path: str, log: Optional[logging.Logger] = None) -> str:
+    with error_handler(f"Moving file {source_file_path} to {destination_path}", logger):
+        if not os.path.exists(source_file_path):
+            raise ValueError(f"Source file {source_file_path} does not exist.")
+
+        os.makedirs(destination_path, exist_ok=True)
+
+        if _same_device(source_file_path, destination_path):
+            destination_file_path = os.path.join(destination_path, os.path.basename(source_file_path))
+            size = os.path.getsize(source_file_path)
+            try:
+                os.replace(source_file_path, destination_file_path)
+            except OSError as e:
+                # Bind mounts share st_dev but still refuse cross-mount renames
+                if e.errno != errno.EXDEV:
+                    raise
+            else:
+                if progress_callback:
+                    progress_callback(size)
+                logger.info(f"Moved {source_file_path} to {destination_path} (rename)")
+                return destination_file_path
+
+        destination_file_path = copy_file(source_file_path, destination_path, logger, progress_callback)
+        os.remove(source_file_path)
+        logger.info(f"Moved {source_file_path} to {destination_path}")
+        return destination_file_path
+
+def _merge_rename(source_dir: str, destination_dir: str, replace_dirs: bool, logger: logging.Logger) -> int:
+    """
+    Rename every entry of a directory into another directory on the same device.
+
+    Files replace existing destination entries atomically with os.replace. Directories
+    present on both sides are merged recursively unless replace_dirs is set, in which
+    case the destination directory is deleted first.
+
+    Args:
+        source_dir: Directory whose entries are moved (left empty)
+        destination_dir: Existing destination directory
+        replace_dirs: Replace existing destination directories instead of merging
+        logger: Logger for debug messages
+
+    Returns:
+        Number of entries renamed
+    """
+    renamed = 0
+    with os.scandir(source_dir) as it:
+        entries = list(it)
+
+    for entry in entries:
+        dest_item = os.path.join(destination_dir, entry.name)
+        source_is_dir = entry.is_dir(follow_symlinks=False)
+        dest_is_dir = os.path.isdir(dest_item) and not os.path.islink(dest_item)
+
+        if source_is_dir and dest_is_dir and not replace_dirs:
+            renamed += _merge_rename(entry.path, dest_item, False, logger)
+            os.rmdir(entry.path)
+            continue
+
+        if dest_is_dir:
+            shutil.rmtree(dest_item)
+        elif source_is_dir and os.path.lexists(dest_item):
+            os.remove(dest_item)
+
+        try:
+            os.replace(entry.path, dest_item)
+        except OSError as e:
+            # A mount point inside the source tree
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(entry.path, dest_item)
+        renamed += 1
+        log_debug(logger, "Renamed %s to %s", entry.path, dest_item)
+    return renamed
+
+def _verify_copy(source_file_path: str, destination_file_path: str, verify: str, digest: Optional[str] = None) -> bool:
+    """
+    Check that a copied file matches its source.
+
+    Args:
+        source_file_path: Source file
+        destination_file_path: Copied file
+        verify: 'size' compares sizes, 'hash' also compares SHA-256 digests
+        digest: SHA-256 of the source computed during the copy; hashed from the source if None
+
+    Returns:
+        True if the copy matches
+    """
+    if os.path.getsize(source_file_path) != os.path.getsize(destination_file_path):
+        return False
+    if verify == "hash":
+        return (digest or get_file_hash(source_file_path)) == get_file_hash(destination_file_path)
+    return True
+
+def _move_across_devices(source_dir: str, destination_dir: str, workers: int, verify: str,
+                         replace_dirs: bool, logger: logging.Logger) -> Tuple[int, List[str]]:
+    """
+    Move the contents of a directory to another device with parallel verified copies.
+
+    Each source file is removed only after its copy has been verified; directories are
+    removed afterwards if they ended up empty.
+
+    Returns:
+        Tuple of (files moved, error messages)
+    """
+    files: List[Tuple[str, str]] = []
+    links: List[Tuple[str, str]] = []
+    subdirs: List[str] = []
+
+    for root, dirs, names in os.walk(source_dir):
+        rel = os.path.relpath(root, source_dir)
+        target_root = destination_dir if rel == os.curdir else os.path.join(destination_dir, rel)
+        if rel != os.curdir:
+            subdirs.append(root)
+            if os.path.islink(target_root) or os.path.isfile(target_root):
+                os.remove(target_root)
+            elif replace_dirs and os.sep not in rel and os.path.isdir(target_root):
+                shutil.rmtree(target_root)
+        os.makedirs(target_root, exist_ok=True)
+
+        for name in [d for d in dirs if os.path.islink(os.path.join(root, d))]:
+            dirs.remove(name)
+            links.append((os.path.join(root, name), os.path.join(target_root, name)))
+        for name in names:
+            pair = (os.path.join(root, name), os.path.join(target_root, name))
+            (links if os.path.islink(pair[0]) else files).append(pair)
+
+    errors: List[str] = []
+
+    def clear(dest_item: str):
+        if os.path.isdir(dest_item) and not os.path.islink(dest_item):
+            shutil.rmtree(dest_item)
+        elif os.path.lexists(dest_item):
+            os.remove(dest_item)
+
+    for src_item, dst_item in links:
+        try:
+            clear(dst_item)
+            os.symlink(os.readlink(src_item), dst_item)
+            os.remove(src_item)
+        except OSError as e:
+            errors.append(f"{src_item}: {e}")
+
+    throttle = get_io_throttle(source_dir, destination_dir)
+
+    def move_one(src_item: str, dst_item: str) -> Optional[str]:
+        try:
+            if os.path.isdir(dst_item) and not os.path.islink(dst_item):
+                shutil.rmtree(dst_item)
+            if throttle:
+                throttle.acquire(ops=1)
+            # Hash the source as it streams so verification only re-reads the destination
+            digest = _copy2_checked(src_item, dst_item, 'sha256' if verify == "hash" else None, "none",
+                                    throttle=throttle)
+            if not _verify_copy(src_item, dst_item, verify, digest):
+                return f"{src_item}: copy verification failed"
+            os.remove(src_item)
+            log_debug(logger, "Moved %s to %s", src_item, dst_item)
+        except Exception as e:
+            return f"{src_item}: {e}"
+        return None
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(move_one, src_item, dst_item) for src_item, dst_item in files]
+        errors.extend(error for error in (f.result() for f in futures) if error)
+
+    # os.walk is top-down, so reversed order removes children before their parents
+    for directory in reversed(subdirs):
+        try:
+            os.rmdir(directory)
+        except OSError:
+            pass
+
+    return len(files) + len(links) - len(errors), errors
+
+def move_directory(source_dir_path: str, destination_path: str, log: Optional[logging.Logger] = None,
+                   merge: bool = False, workers: int = 4, verify: str = "hash") -> str:
     """Moves all contents of one directory to another.
 
+    - Destination absent, same device: the whole directory is renamed in one call and
+      an empty source directory is recreated in its place.
+    - Destination present, same device: entries are renamed one by one. Files replace
+      existing files atomically; directories present on both sides are replaced
+      (or merged when merge is True).
+    - Different devices: files are copied in parallel, each copy is verified and only
+      then is the source file removed. Files that fail stay in the source. These copies
+      draw from the I/O budgets set with rate_limit.set_io_limit, if any.
+
     Args:
         source_dir_path (str): Source directory.
         destination_path (str): Destination directory.
         log (logging.Logger, optional): Logger for auditing. If None, uses get_logger().
+        merge (bool, optional): Merge directories that exist on both sides instead of replacing
+            the destination directory, keeping destination files absent from the source.
+            Defaults to False.
+        workers (int, optional): Copy threads for cross-device moves. Defaults to 4.
+        verify (str, optional): Cross-device verification, 'size' or 'hash'. Defaults to 'hash'.
 
     Returns:
         str: Path of the destination directory.
 
     Raises:
-        ValueError: If source does not exist or is not a directory.
+        ValueError: If source does not exist or is not a directory, or verify is unknown.
+        OSError: If any file could not be moved across devices.
     """
     logger = log or get_logger()
 
@@ -117,44 +1007,115 @@ def move_directory(source_dir_path: str, destination_path: str, log: Optional[lo
         if not os.path.isdir(source_dir_path):
             raise ValueError(f"Source path {source_dir_path} is not a directory.")
 
+        if verify not in ("size", "hash"):
+            raise ValueError(f"Unknown verify mode '{verify}'. Expected 'size' or 'hash'.")
+
+        if not os.path.lexists(destination_path):
+            parent = os.path.dirname(os.path.abspath(destination_path))
+            os.makedirs(parent, exist_ok=True)
+            if _same_device(source_dir_path, parent):
+                mode = os.stat(source_dir_path).st_mode & 0o7777
+                try:
+                    os.rename(source_dir_path, destination_path)
+                except OSError as e:
+                    if e.errno != errno.EXDEV:
+                        raise
+                else:
+                    os.mkdir(source_dir_path)
+                    os.chmod(source_dir_path, mode)
+                    logger.info(f"Moved directory contents from {source_dir_path} to {destination_path} (rename)")
+                    return destination_path
+
         os.makedirs(destination_path, exist_ok=True)
 
-        for item in os.listdir(source_dir_path):
-            source_item = os.path.join(source_dir_path, item)
-            dest_item = os.path.join(destination_path, item)
+        if _same_device(source_dir_path, destination_path):
+            renamed = _merge_rename(source_dir_path, destination_path, not merge, logger)
+            logger.info(f"Moved directory contents from {source_dir_path} to {destination_path} ({renamed} renames)")
+            return destination_path
 
-            if os.path.exists(dest_item):
-                if os.path.isdir(dest_item):
-                    shutil.rmtree(dest_item)
-                else:
-                    os.remove(dest_item)
+        moved, errors = _move_across_devices(source_dir_path, destination_path, workers, verify, not merge, logger)
+        for error in errors[:10]:
+            logger.warning(f"Failed to move {error}")
+        if errors:
+            raise OSError(f"Failed to move {len(errors)} files from {source_dir_path}, first error: {errors[0]}")
 
-            shutil.move(source_item, dest_item)
-            logger.debug(f"Moved {source_item} to {dest_item}")
-
-        logger.info(f"Moved directory contents from {source_dir_path} to {destination_path}")
+        logger.info(f"Moved directory contents from {source_dir_path} to {destination_path} ({moved} files copied)")
         return destination_path
 
-def copy_file(source_file_path: str, destination_path: str, log: Optional[logging.Logger] = None, progress_callback=None) -> str:
+def copy_file(source_file_path: str, destination_path: str, log: Optional[logging.Logger] = None, progress_callback=None, engine: str = "auto", clone: bool = False,
+              range_workers: Optional[int] = None, range_size: int = _DEFAULT_RANGE_SIZE,
+              buffer_size: Optional[int] = None, sparse: Optional[bool] = None,
+              io_hints: Optional[str] = None, resume: bool = False,
+              checkpoint_bytes: int = _DEFAULT_CHECKPOINT_BYTES, checksum: Optional[str] = None,
+              verify: str = "none") -> Union[str, Tuple[str, str]]:
     """Copies a file to another location.
 
+    Data is moved inside the kernel with os.copy_file_range when available, then
+    os.sendfile, and finally a buffered read/write loop. Sparse files are copied extent
+    by extent (SEEK_DATA/SEEK_HOLE) so their holes are not allocated at the destination.
+    The copy draws from the I/O budgets set with rate_limit.set_io_limit for the source
+    and destination, if any.
+
     Args:
         source_file_path (str): Path to the source file.
         destination_path (str): Path to the destination directory.
         progress_callback (Optional[callable]): Callback function for progress in bytes.
         log (logging.Logger, optional): Logger for auditing. If None, uses get_logger().
+        engine (str, optional): 'auto', 'copy_file_range', 'sendfile' or 'buffered'. A kernel
+            engine that is not supported falls back to the next one. Defaults to 'auto'.
+        clone (bool, optional): Try a copy-on-write reflink (btrfs, XFS) before copying bytes.
+            Falls back to a normal copy when the filesystem cannot clone. Defaults to False.
+        range_workers (Optional[int], optional): For files larger than range_size, copy fixed-size
+            ranges on this many threads into a preallocated destination. Defaults to None (one stream).
+        range_size (int, optional): Size of each range in bytes. Defaults to 64 MB.
+        buffer_size (Optional[int], optional): Fixed chunk size in bytes. Defaults to None, which
+            starts from the device block size and file size and tunes from measured throughput.
+        sparse (Optional[bool], optional): Copy only data extents and recreate holes. None (default)
+            does so when the source has fewer allocated blocks than its size; False copies every byte.
+            Progress is reported in logical bytes either way.
+        io_hints (Optional[str], optional): Page-cache policy for the source and destination: 'none',
+            'sequential' (POSIX_FADV_SEQUENTIAL) or 'dontneed' (also POSIX_FADV_DONTNEED behind the
+            cursor, so a bulk copy leaves the page cache to other processes). Defaults to None, the
+            default set with io_ops.set_io_hints.
+        resume (bool, optional): Copy into '<destination>.partial' with a JSON checkpoint next to it
+            ('<destination>.partial.json': offset and CRC-32 of the copied prefix, source size and mtime).
+            An interrupted copy called again with resume=True re-reads and verifies the prefix and
+            continues from the checkpoint; if the source changed or the prefix does not match, it starts
+            over. The data passes through a buffered loop, so engine, clone, range_workers and sparse
+            are ignored. Defaults to False.
+        checkpoint_bytes (int, optional): Bytes copied between checkpoints in resume mode. Each checkpoint
+            flushes the partial file to disk. Defaults to 64 MB.
+        checksum (Optional[str], optional): Hash algorithm (e.g. 'sha256') of a digest computed from
+            the data as it streams through the copy, so the source is read only once (a resumed copy
+            also re-reads the source prefix it skips). The data then goes through the buffered loop:
+            engine, clone, range_workers and sparse do not apply. Variable-length algorithms
+            (shake_128, shake_256) are rejected. Defaults to None.
+        verify (str, optional): Check the destination after the copy: 'none', 'sample' (compare 16
+            evenly spaced 64 KB blocks of both files, or the whole file when smaller) or 'full' (hash
+            a fresh read of the destination and compare it with the streamed digest; SHA-256 when
+            checksum is None). A destination that fails is removed. Defaults to 'none'.
 
     Returns:
-        str: Path to the copied file in the destination.
+        Union[str, Tuple[str, str]]: Path to the copied file in the destination, or (path, hex digest)
+        when checksum is set.
 
     Raises:
-        ValueError: If the source file does not exist.
+        ValueError: If the source file does not exist, the engine, I/O hints policy, hash algorithm
+            or verify mode is unknown, or range_size is less than 1.
+        OSError: If the destination fails verification.
     """
     logger = log or get_logger()
     with error_handler(f"Copying file {source_file_path} to {destination_path}", logger):
         if not os.path.exists(source_file_path):
             raise ValueError(f"Source file {source_file_path} does not exist.")
 
+        if engine not in _COPY_ENGINES:
+            raise ValueError(f"Unknown copy engine '{engine}'. Expected one of {_COPY_ENGINES}.")
+        if range_size < 1:
+            raise ValueError(f"range_size must be at least 1, got {range_size}")
+        io_hints = _resolve_io_hints(io_hints)
+        _check_verify_options(checksum, verify)
+
         os.makedirs(destination_path, exist_ok=True)
         destination_file_path = os.path.join(destination_path, os.path.basename(source_file_path))
 
@@ -163,28 +1124,281 @@ def copy_file(source_file_path: str, destination_path: str, log: Optional[loggin
         if progress_callback is None:
             progress_callback = ProgressPercentage(source_file_path, total_size, logger)
 
-        buffer_size = 1024 * 1024
-        with open(source_file_path, 'rb') as src, open(destination_file_path, 'wb') as dst:
-            while True:
-                chunk = src.read(buffer_size)
-                if not chunk:
-                    break
-                dst.write(chunk)
-                if progress_callback:
-                    progress_callback(len(chunk))
+        throttle = get_io_throttle(source_file_path, destination_path)
+        if throttle:
+            throttle.acquire(ops=1)
+
+        algorithm = checksum or 'sha256'
+        hashed = checksum is not None or verify == "full"
+        if resume:
+            _, digest = _copy_resumable(source_file_path, destination_file_path, checkpoint_bytes, buffer_size,
+                                        progress_callback, logger, io_hints, throttle, algorithm if hashed else None)
+        else:
+            hash_obj = hashlib.new(algorithm) if hashed else None
+            _copy_file_contents(source_file_path, destination_file_path, clone=clone, engine=engine,
+                                progress_callback=progress_callback, logger=logger,
+                                range_workers=range_workers, range_size=range_size,
+                                buffer_size=buffer_size, sparse=sparse, io_hints=io_hints,
+                                throttle=throttle, hash_obj=hash_obj)
+            digest = hash_obj.hexdigest() if hash_obj is not None else None
+        _check_copy(source_file_path, destination_file_path, verify, digest, algorithm)
 
         logger.info(f"Copied {source_file_path} to {destination_path}")
+        if checksum:
+            return destination_file_path, digest
         return destination_file_path
 
-def delete_path(file_path: str, log: Optional[logging.Logger] = None) -> bool:
+def copy_files(pairs: Iterable[Tuple[str, str]], workers: int = 4, log: Optional[logging.Logger] = None, progress_callback=None, engine: str = "auto", clone: bool = False) -> List[Dict[str, Any]]:
+    """Copies many files through one shared thread pool.
+
+    Each pair follows copy_file semantics: the source file is copied into the destination
+    directory under its own name. Destination directories are created once per batch and
+    a failing item is reported in its result instead of aborting the batch. Each file draws
+    one operation, and each chunk copied its size, from the I/O budgets set with
+    rate_limit.set_io_limit for its source and destination, if any.
+
+    Args:
+        pairs (Iterable[Tuple[str, str]]): (source_file_path, destination_path) pairs.
+        workers (int, optional): Number of copy threads. Defaults to 4.
+        log (logging.Logger, optional): Logger for auditing. If None, uses get_logger().
+        progress_callback (Optional[callable]): Callback shared by all items, called with bytes per chunk.
+        engine (str, optional): Copy engine, see copy_file. Defaults to 'auto'.
+        clone (bool, optional): Try a copy-on-write reflink before copying bytes. Defaults to False.
+
+    Returns:
+        List[Dict[str, Any]]: One dict per pair, in input order, with 'source', 'destination',
+        'size', 'status' ('copied' or 'failed') and 'error'.
+
+    Raises:
+        ValueError: If workers is less than 1 or the engine is unknown.
+    """
+    logger = log or get_logger()
+
+    with error_handler(f"Copying files with {workers} workers", logger):
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+        if engine not in _COPY_ENGINES:
+            raise ValueError(f"Unknown copy engine '{engine}'. Expected one of {_COPY_ENGINES}.")
+
+        created_dirs = set()
+        # Keeps a huge iterable from being turned into a huge backlog of futures
+        slots = threading.BoundedSemaphore(workers * 4)
+
+        def copy_one(source_file_path: str, destination_path: str) -> Dict[str, Any]:
+            result = {'source': source_file_path, 'destination': None, 'size': 0, 'status': 'copied', 'error': None}
+            try:
+                if not os.path.exists(source_file_path):
+                    raise ValueError(f"Source file {source_file_path} does not exist.")
+                if destination_path not in created_dirs:
+                    os.makedirs(destination_path, exist_ok=True)
+                    created_dirs.add(destination_path)
+
+                destination_file_path = os.path.join(destination_path, os.path.basename(source_file_path))
+                throttle = get_io_throttle(source_file_path, destination_path)
+                if throttle:
+                    throttle.acquire(ops=1)
+                result['size'] = _copy_file_contents(source_file_path, destination_file_path, clone=clone,
+                                                     engine=engine, progress_callback=progress_callback,
+                                                     throttle=throttle)
+                result['destination'] = destination_file_path
+            except Exception as e:
+                result.update(status='failed', error=str(e))
+                logger.warning(f"Failed to copy {source_file_path}: {e}")
+            finally:
+                slots.release()
+            return result
+
+        futures = []
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for source_file_path, destination_path in pairs:
+                slots.acquire()
+                futures.append(pool.submit(copy_one, source_file_path, destination_path))
+
+        results = [f.result() for f in futures]
+
+        failed = sum(1 for r in results if r['status'] == 'failed')
+        total = sum(r['size'] for r in results)
+        logger.info(f"Copied {len(results) - failed} of {len(results)} files ({_format_size(total)}) with {workers} workers")
+        return results
+
+_DIR_FD_PURGE = (os.unlink in os.supports_dir_fd and os.rmdir in os.supports_dir_fd
+                 and os.scandir in os.supports_fd and hasattr(os, "O_DIRECTORY"))
+
+def _purge_entries(directory_path: str) -> Tuple[List[str], int, int, List[str]]:
+    """
+    Remove every non-directory entry of one directory.
+
+    Where the platform supports it, the directory is opened once and entries are
+    unlinked relative to its file descriptor, so no path is resolved per file.
+
+    Args:
+        directory_path: Directory to empty (its subdirectories are left in place)
+
+    Returns:
+        Tuple of (subdirectory paths, files removed, bytes freed, error messages)
+    """
+    subdirs: List[str] = []
+    files = freed = 0
+    errors: List[str] = []
+    fd = None
+    try:
+        if _DIR_FD_PURGE:
+            fd = os.open(directory_path, os.O_RDONLY | os.O_DIRECTORY | getattr(os, "O_NOFOLLOW", 0))
+        with os.scandir(directory_path if fd is None else fd) as it:
+            entries = list(it)
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(os.path.join(directory_path, entry.name))
+                    continue
+                size = entry.stat(follow_symlinks=False).st_size
+                if fd is None:
+                    os.unlink(os.path.join(directory_path, entry.name))
+                else:
+                    os.unlink(entry.name, dir_fd=fd)
+                files += 1
+                freed += size
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                errors.append(f"{os.path.join(directory_path, entry.name)}: {e}")
+    except OSError as e:
+        errors.append(f"{directory_path}: {e}")
+    finally:
+        if fd is not None:
+            os.close(fd)
+    return subdirs, files, freed, errors
+
+def _remove_empty_directory(directory_path: str) -> Optional[str]:
+    """
+    Remove a directory that should be empty by now.
+
+    Returns:
+        Error message, or None on success
+    """
+    try:
+        os.rmdir(directory_path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        return f"{directory_path}: {e}"
+    return None
+
+def purge_tree(directory_path: str, workers: int = 4, log: Optional[logging.Logger] = None) -> Dict[str, int]:
+    """Deletes a directory tree with a thread pool and reports what was removed.
+
+    The tree is processed level by level: the directories of one level are emptied
+    concurrently (files are unlinked relative to an open directory descriptor where
+    supported), then the directories are removed deepest level first. Symbolic links
+    are removed, never followed. Entries that cannot be removed are counted and logged
+    instead of stopping the purge.
+
+    Args:
+        directory_path (str): Directory to delete.
+        workers (int, optional): Number of threads. Defaults to 4.
+        log (Optional[logging.Logger], optional): Logger for auditing. If None, a default logger is used.
+
+    Returns:
+        Dict[str, int]: Counts of 'files' and 'directories' removed, 'bytes' freed (sum of
+        file sizes) and 'errors'.
+
+    Raises:
+        ValueError: If the path is not a directory (or is a symlink) or workers is less than 1.
+    """
+    logger = log or get_logger()
+
+    with error_handler(f"Purging directory {directory_path}", logger):
+        if os.path.islink(directory_path) or not os.path.isdir(directory_path):
+            raise ValueError(f"{directory_path} is not a directory.")
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+
+        stats = {'files': 0, 'directories': 0, 'bytes': 0, 'errors': 0}
+        errors: List[str] = []
+        levels = []
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            level = [directory_path]
+            while level:
+                levels.append(level)
+                next_level: List[str] = []
+                for subdirs, files, freed, errs in pool.map(_purge_entries, level):
+                    next_level.extend(subdirs)
+                    stats['files'] += files
+                    stats['bytes'] += freed
+                    errors.extend(errs)
+                level = next_level
+
+            for level in reversed(levels):
+                for error in pool.map(_remove_empty_directory, level):
+                    if error is None:
+                        stats['directories'] += 1
+                    else:
+                        errors.append(error)
+
+        stats['errors'] = len(errors)
+        for error in errors[:10]:
+            logger.warning(f"Failed to delete {error}")
+
+        logger.info(f"Purged {directory_path}: {stats['files']} files, {stats['directories']} directories, "
+                    f"{_format_size(stats['bytes'])} freed, {stats['errors']} errors")
+        return stats
+
+def detach_tree(directory_path: str, workers: int = 4, log: Optional[logging.Logger] = None) -> "Future[Dict[str, int]]":
+    """Renames a directory aside and deletes it in a background thread.
+
+    The rename happens in the same parent directory, so it is instant and the original
+    path is free as soon as this function returns. The background thread is not a daemon:
+    the interpreter waits for the purge to finish before exiting.
+
+    Args:
+        directory_path (str): Directory to delete.
+        workers (int, optional): Number of threads used by the purge. Defaults to 4.
+        log (Optional[logging.Logger], optional): Logger for auditing. If None, a default logger is used.
+
+    Returns:
+        Future[Dict[str, int]]: Resolves to the purge_tree statistics.
+
+    Raises:
+        ValueError: If the path is not a directory (or is a symlink).
+    """
+    logger = log or get_logger()
+
+    with error_handler(f"Detaching directory {directory_path}", logger):
+        if os.path.islink(directory_path) or not os.path.isdir(directory_path):
+            raise ValueError(f"{directory_path} is not a directory.")
+
+        parent, name = os.path.split(os.path.abspath(directory_path))
+        detached = os.path.join(parent, f".{name}.deleting-{os.urandom(4).hex()}")
+        os.rename(directory_path, detached)
+        logger.info(f"Detached {directory_path} to {detached} for background deletion")
+
+        future: "Future[Dict[str, int]]" = Future()
+        future.set_running_or_notify_cancel()
+
+        def purge():
+            try:
+                future.set_result(purge_tree(detached, workers, logger))
+            except BaseException as e:
+                future.set_exception(e)
+
+        threading.Thread(target=purge, name=f"file_toolkit_purge_{name}").start()
+        return future
+
+def delete_path(file_path: str, log: Optional[logging.Logger] = None, workers: Optional[int] = None,
+                detach: bool = False) -> bool:
     """Deletes a file or directory.
 
     Args:
         file_path (str): Path to be removed.
         log (logging.Logger, optional): Logger for auditing. If None, uses get_logger().
+        workers (Optional[int], optional): Delete a directory with purge_tree and this many threads.
+            Defaults to None (shutil.rmtree).
+        detach (bool, optional): Rename a directory aside and delete it in the background
+            (see detach_tree). Defaults to False.
 
     Returns:
-        bool: True if deleted, False otherwise.
+        bool: True if deleted (or detached for deletion), False otherwise.
     """
     logger = log or get_logger()
     with error_handler(f"Deleting {file_path}", logger, reraise=False):
@@ -193,6 +1407,11 @@ def delete_path(file_path: str, log: Optional[logging.Logger] = None) -> bool:
             logger.info(f"Deleted file {file_path}")
             return True
         elif os.path.isdir(file_path):
+            if detach:
+                detach_tree(file_path, workers or 4, logger)
+                return True
+            if workers:
+                return purge_tree(file_path, workers, logger)['errors'] == 0
             shutil.rmtree(file_path)
             logger.info(f"Deleted directory {file_path}")
             return True
@@ -239,19 +1458,51 @@ def file_exists(file_path: str, log: Optional[logging.Logger] = None) -> bool:
     """
     logger = log or get_logger()
     exists = os.path.isfile(file_path)
-    logger.debug(f"File exists check: {file_path} - {'Exists' if exists else 'Does not exist'}")
+    log_debug(logger, "File exists check: %s - %s", file_path, 'Exists' if exists else 'Does not exist')
     return exists
 
-def get_bytes_by_file_path(file_path: str, log: Optional[logging.Logger] = None) -> bytes:
-    """Reads a file as bytes.
+def _resolve_range(file_size: int, offset: int, length: Optional[int]) -> Tuple[int, int]:
+    """
+    Clamp a byte range to the file size.
+
+    Args:
+        file_size: Size of the file in bytes
+        offset: First byte of the range
+        length: Number of bytes, or None for everything up to the end of the file
+
+    Returns:
+        (offset, length) clamped to the file
+    """
+    if offset < 0:
+        raise ValueError(f"offset must be non-negative, got {offset}")
+    if length is not None and length < 0:
+        raise ValueError(f"length must be non-negative, got {length}")
+    offset = min(offset, file_size)
+    available = file_size - offset
+    return offset, available if length is None else min(length, available)
+
+def get_bytes_by_file_path(file_path: str, log: Optional[logging.Logger] = None, offset: int = 0,
+                           length: Optional[int] = None, use_mmap: bool = False) -> Union[bytes, ContextManager[memoryview]]:
+    """Reads a file, or a byte range of it, as bytes.
 
     Args:
         file_path (str): File path.
         log (logging.Logger, optional): Logger for auditing. If None, uses get_logger().
+        offset (int, optional): First byte to read. Defaults to 0.
+        length (Optional[int], optional): Number of bytes to read. Defaults to None (until the end).
+        use_mmap (bool, optional): Instead of copying the data, return the map_file_bytes context
+            manager, which yields a read-only memoryview over a memory map. Defaults to False.
 
     Returns:
-        bytes: File contents.
+        Union[bytes, ContextManager[memoryview]]: File contents, or a context manager when use_mmap is True.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If offset or length is negative.
     """
+    if use_mmap:
+        return map_file_bytes(file_path, offset, length, log)
+
     logger = log or get_logger()
 
     with error_handler(f"Reading file as bytes: {file_path}", logger):
@@ -259,13 +1510,71 @@ def get_bytes_by_file_path(file_path: str, log: Optional[logging.Logger] = None)
             raise FileNotFoundError(f"File {file_path} does not exist.")
 
         with open(file_path, 'rb') as file:
-            file_content = file.read()
+            if offset or length is not None:
+                offset, length = _resolve_range(os.fstat(file.fileno()).st_size, offset, length)
+                file.seek(offset)
+                file_content = file.read(length)
+            else:
+                file_content = file.read()
             size = len(file_content)
-            logger.debug(f"Read {_format_size(size)} from {file_path}")
+            log_debug(logger, "Read %s from %s", _format_size(size), file_path)
 
         return file_content
 
-def backup_file(file_path: str, backup_dir: Optional[str] = None, timestamp: bool = True, log: Optional[logging.Logger] = None) -> str:
+@contextmanager
+def map_file_bytes(file_path: str, offset: int = 0, length: Optional[int] = None,
+                   log: Optional[logging.Logger] = None) -> Iterator[memoryview]:
+    """Memory-maps a file, or a byte range of it, and yields a read-only memoryview.
+
+    Only the pages that are touched are read from disk, and nothing is copied into Python
+    memory. The mapping is closed when the block exits, so views sliced from the yielded
+    memoryview must not outlive the block.
+
+    Args:
+        file_path (str): File path.
+        offset (int, optional): First byte of the range. Defaults to 0.
+        length (Optional[int], optional): Number of bytes. Defaults to None (until the end).
+        log (logging.Logger, optional): Logger for auditing. If None, uses get_logger().
+
+    Yields:
+        memoryview: Read-only view of the requested range.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If offset or length is negative.
+    """
+    logger = log or get_logger()
+
+    with error_handler(f"Mapping file: {file_path}", logger):
+        if not os.path.isfile(file_path):
+            raise FileNotFoundError(f"File {file_path} does not exist.")
+
+        file = open(file_path, 'rb')
+        try:
+            offset, length = _resolve_range(os.fstat(file.fileno()).st_size, offset, length)
+            if length == 0:
+                mapped = None
+                view = memoryview(b"")
+            else:
+                # mmap offsets must be aligned to the allocation granularity
+                aligned = offset - offset % mmap.ALLOCATIONGRANULARITY
+                mapped = mmap.mmap(file.fileno(), length + offset - aligned, offset=aligned, access=mmap.ACCESS_READ)
+                view = memoryview(mapped)[offset - aligned:]
+            log_debug(logger, "Mapped %s of %s at offset %s", _format_size(length), file_path, offset)
+        except BaseException:
+            file.close()
+            raise
+
+    try:
+        yield view
+    finally:
+        view.release()
+        if mapped is not None:
+            mapped.close()
+        file.close()
+
+def backup_file(file_path: str, backup_dir: Optional[str] = None, timestamp: bool = True, log: Optional[logging.Logger] = None, clone: bool = False,
+                repository: Optional[Any] = None) -> str:
     """Creates a backup of the file.
 
     Args:
@@ -273,12 +1582,28 @@ def backup_file(file_path: str, backup_dir: Optional[str] = None, timestamp: boo
         backup_dir (Optional[str]): Directory to save the backup.
         timestamp (bool): Add timestamp to the name.
         log (logging.Logger, optional): Logger for auditing. If None, uses get_logger().
+        clone (bool, optional): Try a copy-on-write reflink before copying bytes. Defaults to False.
+        repository (Optional[Union[str, BackupRepository]], optional): Store the backup in a
+            deduplicating backup_ops.BackupRepository (or a repository directory, or any object
+            with the same backup method) instead of making a full copy. backup_dir and timestamp
+            are then ignored. Defaults to None.
 
     Returns:
         str: Backup path.
     """
     logger = log or get_logger()
 
+    if repository is not None:
+        # Any object with a backup() method is used as is (file_toolkit.BackupRepository and
+        # backup_ops.BackupRepository may be different classes depending on the import path)
+        if isinstance(repository, (str, os.PathLike)):
+            if __package__:
+                from .backup_ops import BackupRepository
+            else:
+                from backup_ops import BackupRepository
+            repository = BackupRepository(repository, clone=clone, log=logger)
+        return repository.backup(file_path)
+
     with error_handler(f"Creating backup of {file_path}", logger):
         if not os.path.isfile(file_path):
             raise ValueError(f"File {file_path} does not exist.")
@@ -299,7 +1624,7 @@ def backup_file(file_path: str, backup_dir: Optional[str] = None, timestamp: boo
 
         backup_path = os.path.join(backup_dir, backup_name)
 
-        shutil.copy2(file_path, backup_path)
+        _copy2(file_path, backup_path, clone, logger)
         logger.info(f"Created backup: {backup_path}")
 
         return backup_path
@@ -322,11 +1647,205 @@ def create_directory(directory_path: str, mode: int = 0o755, log: Optional[loggi
             os.makedirs(directory_path, mode=mode, exist_ok=True)
             logger.info(f"Created directory {directory_path}")
         else:
-            logger.debug(f"Directory {directory_path} already exists")
+            log_debug(logger, "Directory %s already exists", directory_path)
 
         return directory_path
 
-def write_text_file(file_path: str, content: str, encoding: str = 'utf-8', backup: bool = False, log: Optional[logging.Logger] = None) -> str:
+def _fsync_directory(directory: str) -> None:
+    """
+    Flush a directory entry table so renames inside it survive a crash.
+
+    Args:
+        directory: Directory path
+    """
+    if os.name == 'nt':
+        return
+    fd = os.open(directory or '.', os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+class GroupCommit:
+    """Batches the durability work of many atomic writes into one commit.
+
+    Writes that receive this object as ``durability`` go to temporary files next to their targets and
+    become visible only on commit, which fsyncs every temporary file, renames them
+    into place and then fsyncs each affected directory once. Used as a context manager
+    it commits on success and discards the pending files on error.
+
+    Args:
+        log (logging.Logger, optional): Logger for auditing. If None, uses get_logger().
+    """
+
+    def __init__(self, log: Optional[logging.Logger] = None):
+        self._log = log or get_logger()
+        self._pending: List[Tuple[str, str]] = []
+        self._lock = threading.Lock()
+
+    def add(self, temp_path: str, file_path: str) -> None:
+        """Registers a fully written temporary file to be renamed onto file_path on commit.
+
+        Args:
+            temp_path (str): Temporary file in the same directory as file_path.
+            file_path (str): Final path.
+        """
+        with self._lock:
+            self._pending.append((temp_path, file_path))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def commit(self) -> List[str]:
+        """Makes all pending writes durable and visible.
+
+        If the commit fails, the writes already renamed stay in place and the temporary
+        files of the others are removed.
+
+        Returns:
+            List[str]: Final paths, in the order the writes were added.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+
+        replaced = 0
+        try:
+            with error_handler(f"Committing {len(pending)} writes", self._log):
+                for temp_path, _ in pending:
+                    fd = os.open(temp_path, os.O_RDONLY)
+                    try:
+                        os.fsync(fd)
+                    finally:
+                        os.close(fd)
+
+                directories = []
+                for temp_path, file_path in pending:
+                    os.replace(temp_path, file_path)
+                    replaced += 1
+                    directory = os.path.dirname(file_path) or '.'
+                    if directory not in directories:
+                        directories.append(directory)
+
+                for directory in directories:
+                    _fsync_directory(directory)
+
+                self._log.info(f"Committed {len(pending)} writes across {len(directories)} directories")
+                return [file_path for _, file_path in pending]
+        finally:
+            self._remove_temp_files(pending[replaced:])
+
+    def rollback(self) -> None:
+        """Discards all pending writes and removes their temporary files."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        self._remove_temp_files(pending)
+
+    @staticmethod
+    def _remove_temp_files(pending: List[Tuple[str, str]]) -> None:
+        for temp_path, _ in pending:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+    def __enter__(self) -> "GroupCommit":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+        return False
+
+def _create_temp_file(directory: str, name: str) -> Tuple[int, str]:
+    """
+    Create a uniquely named temporary file next to a target.
+
+    The file is created with mode 0o666 filtered by the process umask at that moment,
+    like a plain open(), instead of the 0600 of tempfile.mkstemp.
+
+    Args:
+        directory: Directory of the target
+        name: Base name of the target
+
+    Returns:
+        Tuple of the open file descriptor (write only) and the temporary path
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    while True:
+        temp_path = os.path.join(directory, f".{name}.{os.urandom(4).hex()}.tmp")
+        try:
+            return os.open(temp_path, flags, 0o666), temp_path
+        except FileExistsError:
+            continue
+
+def _write_with_policy(file_path: str, write: Callable, mode: str, encoding: Optional[str] = None,
+                       atomic: bool = False, durability: Union[str, GroupCommit] = "none") -> None:
+    """
+    Write a file in place or atomically, applying the requested durability policy.
+
+    Args:
+        file_path: Target path
+        write: Callable receiving the open file object
+        mode: 'w' or 'wb'
+        encoding: Text encoding for mode 'w'
+        atomic: Write to a temporary file in the same directory and os.replace it onto the target
+        durability: 'none', 'fsync' (file and directory fsync per write) or a GroupCommit,
+            which implies atomic and defers fsync and rename to its commit
+
+    Raises:
+        ValueError: If the durability policy is unknown
+    """
+    group = durability if isinstance(durability, GroupCommit) else None
+    if group is None and durability not in _DURABILITY_POLICIES:
+        raise ValueError(f"Unknown durability policy '{durability}'. Expected one of {_DURABILITY_POLICIES} or a GroupCommit.")
+    fsync = durability == "fsync"
+
+    directory = os.path.dirname(file_path) or '.'
+    if not atomic and group is None:
+        with open(file_path, mode, encoding=encoding) as f:
+            write(f)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        # The directory entry of a newly created file is only durable once the directory is synced
+        if fsync:
+            _fsync_directory(directory)
+        return
+
+    fd, temp_path = _create_temp_file(directory, os.path.basename(file_path))
+    try:
+        with os.fdopen(fd, mode, encoding=encoding) as f:
+            write(f)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+
+        # A replaced file keeps its permissions; a new one gets what the umask allowed at creation
+        try:
+            os.chmod(temp_path, os.stat(file_path).st_mode & 0o7777)
+        except FileNotFoundError:
+            pass
+
+        if group is not None:
+            group.add(temp_path, file_path)
+            return
+
+        os.replace(temp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+    if fsync:
+        _fsync_directory(directory)
+
+def write_text_file(file_path: str, content: str, encoding: str = 'utf-8', backup: bool = False, log: Optional[logging.Logger] = None,
+                    atomic: bool = False, durability: Union[str, GroupCommit] = "none") -> str:
     """Writes text content to a file.
 
     Args:
@@ -335,6 +1854,10 @@ def write_text_file(file_path: str, content: str, encoding: str = 'utf-8', backu
         encoding (str, optional): File encoding. Defaults to 'utf-8'.
         backup (bool, optional): Whether to create a backup if the file already exists. Defaults to False.
         log (Optional[logging.Logger], optional): Logger for auditing. If None, a default logger is used.
+        atomic (bool, optional): Write to a temporary file and rename it over the target, so readers
+            never see a partial file. Defaults to False.
+        durability (Union[str, GroupCommit], optional): 'none', 'fsync' (fsync file and directory) or a
+            GroupCommit that batches fsyncs and renames until its commit. Defaults to 'none'.
 
     Returns:
         str: Path to the written file.
@@ -349,8 +1872,7 @@ def write_text_file(file_path: str, content: str, encoding: str = 'utf-8', backu
         if backup and os.path.exists(file_path):
             backup_file(file_path)
 
-        with open(file_path, 'w', encoding=encoding) as f:
-            f.write(content)
+        _write_with_policy(file_path, lambda f: f.write(content), 'w', encoding, atomic, durability)
 
         logger.info(f"Wrote {len(content)} characters to {file_path}")
         return file_path
@@ -378,10 +1900,83 @@ def read_text_file(file_path: str, encoding: str = 'utf-8', log: Optional[loggin
         with open(file_path, 'r', encoding=encoding) as f:
             content = f.read()
 
-        logger.debug(f"Read {len(content)} characters from {file_path}")
+        log_debug(logger, "Read %s characters from %s", len(content), file_path)
         return content
 
-def write_binary_file(file_path: str, data: bytes, backup: bool = False, log: Optional[logging.Logger] = None) -> str:
+def iter_text_lines(file_path: str, encoding: str = 'utf-8', errors: str = 'strict', buffer_size: int = _DEFAULT_BUFFER_SIZE,
+                    log: Optional[logging.Logger] = None) -> Iterator[str]:
+    """Yields the lines of a text file one at a time, keeping memory bounded.
+
+    Lines keep their line endings, as when iterating over an open file.
+
+    Args:
+        file_path (str): Path to the text file.
+        encoding (str, optional): File encoding. Defaults to 'utf-8'.
+        errors (str, optional): Decoding error policy ('strict', 'replace', 'ignore', ...). Defaults to 'strict'.
+        buffer_size (int, optional): I/O buffer size in bytes. Defaults to 1 MB.
+        log (Optional[logging.Logger], optional): Logger for auditing. If None, a default logger is used.
+
+    Yields:
+        str: Next line of the file.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    logger = log or get_logger()
+
+    with error_handler(f"Reading text lines from {file_path}", logger):
+        if not os.path.isfile(file_path):
+            raise FileNotFoundError(f"File {file_path} does not exist.")
+
+        lines = 0
+        with open(file_path, 'r', encoding=encoding, errors=errors, buffering=buffer_size) as f:
+            for line in f:
+                lines += 1
+                yield line
+            total = f.buffer.tell()
+
+        log_debug(logger, "Read %s lines (%s) from %s", lines, _format_size(total), file_path)
+
+def iter_text_chunks(file_path: str, chunk_size: int = _DEFAULT_BUFFER_SIZE, encoding: str = 'utf-8', errors: str = 'strict',
+                     log: Optional[logging.Logger] = None) -> Iterator[str]:
+    """Yields the content of a text file in chunks of at most chunk_size characters.
+
+    Args:
+        file_path (str): Path to the text file.
+        chunk_size (int, optional): Maximum number of characters per chunk. Defaults to 1048576.
+        encoding (str, optional): File encoding. Defaults to 'utf-8'.
+        errors (str, optional): Decoding error policy ('strict', 'replace', 'ignore', ...). Defaults to 'strict'.
+        log (Optional[logging.Logger], optional): Logger for auditing. If None, a default logger is used.
+
+    Yields:
+        str: Next chunk of text.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If chunk_size is not positive.
+    """
+    logger = log or get_logger()
+
+    with error_handler(f"Reading text chunks from {file_path}", logger):
+        if not os.path.isfile(file_path):
+            raise FileNotFoundError(f"File {file_path} does not exist.")
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+        chunks = 0
+        with open(file_path, 'r', encoding=encoding, errors=errors) as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                chunks += 1
+                yield chunk
+            total = f.buffer.tell()
+
+        log_debug(logger, "Read %s chunks (%s) from %s", chunks, _format_size(total), file_path)
+
+def write_binary_file(file_path: str, data: bytes, backup: bool = False, log: Optional[logging.Logger] = None,
+                      atomic: bool = False, durability: Union[str, GroupCommit] = "none") -> str:
     """Writes binary data to a file.
 
     Args:
@@ -389,6 +1984,8 @@ def write_binary_file(file_path: str, data: bytes, backup: bool = False, log: Op
         data (bytes): Binary data to write.
         backup (bool, optional): Whether to create a backup if the file already exists. Defaults to False.
         log (Optional[logging.Logger], optional): Logger for auditing. If None, a default logger is used.
+        atomic (bool, optional): Write to a temporary file and rename it over the target. Defaults to False.
+        durability (Union[str, GroupCommit], optional): 'none', 'fsync' or a GroupCommit. Defaults to 'none'.
 
     Returns:
         str: Path to the written file.
@@ -403,16 +2000,20 @@ def write_binary_file(file_path: str, data: bytes, backup: bool = False, log: Op
         if backup and os.path.exists(file_path):
             backup_file(file_path)
 
-        with open(file_path, 'wb') as f:
-            f.write(data)
+        _write_with_policy(file_path, lambda f: f.write(data), 'wb', None, atomic, durability)
 
         size = len(data)
         logger.info(f"Wrote {_format_size(size)} of binary data to {file_path}")
         return file_path
 
-def write_json_file(file_path: str, data: Any, indent: int = 4, sort_keys: bool = False, backup: bool = False, log: Optional[logging.Logger] = None) -> str:
+def write_json_file(file_path: str, data: Any, indent: int = 4, sort_keys: bool = False, backup: bool = False, log: Optional[logging.Logger] = None,
+                    atomic: bool = False, durability: Union[str, GroupCommit] = "none", compact: bool = False,
+                    backend: Optional[str] = None) -> str:
     """Writes JSON data to a file.
 
+    The data is serialized with the codec from json_codec (orjson or ujson when installed)
+    before the file is opened, so a serialization error never leaves a truncated file.
+
     Args:
         file_path (str): Path to the output JSON file.
         data (Any): Data to be serialized as JSON.
@@ -420,6 +2021,13 @@ def write_json_file(file_path: str, data: Any, indent: int = 4, sort_keys: bool
         sort_keys (bool, optional): Whether to sort dictionary keys. Defaults to False.
         backup (bool, optional): Whether to create a backup if the file already exists. Defaults to False.
         log (Optional[logging.Logger], optional): Logger for auditing. If None, a default logger is used.
+        atomic (bool, optional): Write to a temporary file and rename it over the target. A serialization
+            error then leaves the previous file untouched. Defaults to False.
+        durability (Union[str, GroupCommit], optional): 'none', 'fsync' or a GroupCommit. Defaults to 'none'.
+        compact (bool, optional): Write without indentation or spaces after separators. Overrides indent.
+            Defaults to False.
+        backend (Optional[str], optional): JSON backend ('auto', 'orjson', 'ujson', 'json'). Defaults to the
+            json_codec default ('json' unless changed with set_json_backend).
 
     Returns:
         str: Path to the written file.
@@ -434,25 +2042,27 @@ def write_json_file(file_path: str, data: Any, indent: int = 4, sort_keys: bool
         if backup and os.path.exists(file_path):
             backup_file(file_path)
 
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=indent, sort_keys=sort_keys)
+        payload = get_json_codec(backend).dumps(data, indent=indent, sort_keys=sort_keys, compact=compact)
+        _write_with_policy(file_path, lambda f: f.write(payload), 'wb', None, atomic, durability)
 
-        logger.info(f"Wrote JSON data to {file_path}")
+        logger.info(f"Wrote JSON data to {file_path} ({_format_size(len(payload))})")
         return file_path
 
-def read_json_file(file_path: str, log: Optional[logging.Logger] = None) -> Any:
+def read_json_file(file_path: str, log: Optional[logging.Logger] = None, backend: Optional[str] = None) -> Any:
     """Reads and parses a JSON file.
 
     Args:
         file_path (str): Path to the JSON file.
         log (Optional[logging.Logger], optional): Logger for auditing. If None, a default logger is used.
+        backend (Optional[str], optional): JSON backend ('auto', 'orjson', 'ujson', 'json'). Defaults to the
+            json_codec default ('json' unless changed with set_json_backend).
 
     Returns:
         Any: Parsed JSON data.
 
     Raises:
         FileNotFoundError: If the file does not exist.
-        json.JSONDecodeError: If the file is not valid JSON.
+        ValueError: If the file is not valid JSON (json.JSONDecodeError with orjson and the standard library).
     """
     logger = log or get_logger()
 
@@ -460,68 +2070,503 @@ def read_json_file(file_path: str, log: Optional[logging.Logger] = None) -> Any:
         if not os.path.isfile(file_path):
             raise FileNotFoundError(f"File {file_path} does not exist.")
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(file_path, 'rb') as f:
+            data = get_json_codec(backend).loads(f.read())
 
-        logger.debug(f"Read and parsed JSON from {file_path}")
+        log_debug(logger, "Read and parsed JSON from %s", file_path)
         return data
 
-def copy_directory(source_dir: str, destination_dir: str, symlinks: bool = False, ignore_patterns: Optional[List[str]] = None, log: Optional[logging.Logger] = None) -> str:
+def write_jsonl_file(file_path: str, records: Iterable[Any], sort_keys: bool = False, backup: bool = False, log: Optional[logging.Logger] = None,
+                     atomic: bool = False, durability: Union[str, GroupCommit] = "none", backend: Optional[str] = None) -> str:
+    """Writes records as JSON Lines (one compact JSON document per line).
+
+    Records are serialized one at a time, so a generator is never materialized in memory.
+
+    Args:
+        file_path (str): Path to the output file.
+        records (Iterable[Any]): Records to serialize.
+        sort_keys (bool, optional): Whether to sort dictionary keys. Defaults to False.
+        backup (bool, optional): Whether to create a backup if the file already exists. Defaults to False.
+        log (Optional[logging.Logger], optional): Logger for auditing. If None, a default logger is used.
+        atomic (bool, optional): Write to a temporary file and rename it over the target. Defaults to False.
+        durability (Union[str, GroupCommit], optional): 'none', 'fsync' or a GroupCommit. Defaults to 'none'.
+        backend (Optional[str], optional): JSON backend ('auto', 'orjson', 'ujson', 'json'). Defaults to the
+            json_codec default ('json' unless changed with set_json_backend).
+
+    Returns:
+        str: Path to the written file.
+    """
+    logger = log or get_logger()
+
+    with error_handler(f"Writing JSON Lines to {file_path}", logger):
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        if backup and os.path.exists(file_path):
+            backup_file(file_path)
+
+        codec = get_json_codec(backend)
+        count = 0
+
+        def write(f):
+            nonlocal count
+            for record in records:
+                f.write(codec.dumps(record, sort_keys=sort_keys, compact=True))
+                f.write(b'\n')
+                count += 1
+
+        _write_with_policy(file_path, write, 'wb', None, atomic, durability)
+
+        logger.info(f"Wrote {count} JSON Lines records to {file_path}")
+        return file_path
+
+def read_jsonl_file(file_path: str, log: Optional[logging.Logger] = None, backend: Optional[str] = None) -> Iterator[Any]:
+    """Yields the records of a JSON Lines file one at a time. Blank lines are skipped.
+
+    Args:
+        file_path (str): Path to the JSON Lines file.
+        log (Optional[logging.Logger], optional): Logger for auditing. If None, a default logger is used.
+        backend (Optional[str], optional): JSON backend ('auto', 'orjson', 'ujson', 'json'). Defaults to the
+            json_codec default ('json' unless changed with set_json_backend).
+
+    Yields:
+        Any: Next parsed record.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        json.JSONDecodeError: If a line is not valid JSON (the message includes the line number).
+    """
+    logger = log or get_logger()
+
+    with error_handler(f"Reading JSON Lines from {file_path}", logger):
+        if not os.path.isfile(file_path):
+            raise FileNotFoundError(f"File {file_path} does not exist.")
+
+        codec = get_json_codec(backend)
+        count = 0
+        with open(file_path, 'rb') as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = codec.loads(line)
+                except ValueError as e:
+                    raise json.JSONDecodeError(f"Line {line_number}: {getattr(e, 'msg', e)}",
+                                               line.decode('utf-8', 'replace'), getattr(e, 'pos', 0)) from None
+                count += 1
+                yield record
+
+        log_debug(logger, "Read %s JSON Lines records from %s", count, file_path)
+
+class JsonArrayWriter:
+    """Writes a top-level JSON array one element at a time.
+
+    Elements are serialized as they arrive, so the full list never has to be held in
+    memory. The closing bracket is written on close; used as a context manager the
+    array is closed on exit.
+
+    Args:
+        file_path (str): Path to the output JSON file.
+        indent (Optional[int], optional): Indentation of each element. Defaults to None (compact).
+        sort_keys (bool, optional): Whether to sort dictionary keys. Defaults to False.
+        log (Optional[logging.Logger], optional): Logger for auditing. If None, a default logger is used.
+        backend (Optional[str], optional): JSON backend ('auto', 'orjson', 'ujson', 'json'). Defaults to the
+            json_codec default ('json' unless changed with set_json_backend).
+    """
+
+    def __init__(self, file_path: str, indent: Optional[int] = None, sort_keys: bool = False, log: Optional[logging.Logger] = None,
+                 backend: Optional[str] = None):
+        self._log = log or get_logger()
+        self._file_path = file_path
+        self._codec = get_json_codec(backend)
+        self._indent = indent
+        self._sort_keys = sort_keys
+        self._separator = b',' if indent is None else b',\n'
+        self._count = 0
+
+        with error_handler(f"Opening JSON array writer for {file_path}", self._log):
+            directory = os.path.dirname(file_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(file_path, 'wb')
+            self._file.write(b'[' if indent is None else b'[\n')
+
+    @property
+    def count(self) -> int:
+        """Number of elements written so far."""
+        return self._count
+
+    def write(self, record: Any) -> None:
+        """Appends one element to the array.
+
+        Args:
+            record (Any): JSON-serializable element.
+        """
+        chunk = self._codec.dumps(record, indent=self._indent, sort_keys=self._sort_keys, compact=self._indent is None)
+        if self._count:
+            self._file.write(self._separator)
+        self._file.write(chunk)
+        self._count += 1
+
+    def write_many(self, records: Iterable[Any]) -> None:
+        """Appends every element of an iterable to the array.
+
+        Args:
+            records (Iterable[Any]): JSON-serializable elements.
+        """
+        for record in records:
+            self.write(record)
+
+    def close(self) -> str:
+        """Writes the closing bracket and closes the file.
+
+        Returns:
+            str: Path to the written file.
+        """
+        if not self._file.closed:
+            self._file.write(b']' if self._indent is None else b'\n]')
+            self._file.close()
+            self._log.info(f"Wrote JSON array of {self._count} elements to {self._file_path}")
+        return self._file_path
+
+    def __enter__(self) -> "JsonArrayWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+def iter_json_array(file_path: str, buffer_size: int = 64 * 1024, log: Optional[logging.Logger] = None) -> Iterator[Any]:
+    """Yields the elements of a file whose top-level value is a JSON array, one at a time.
+
+    Only the element being decoded and a read buffer are held in memory.
+
+    Args:
+        file_path (str): Path to the JSON file.
+        buffer_size (int, optional): Number of characters read per refill. Defaults to 65536.
+        log (Optional[logging.Logger], optional): Logger for auditing. If None, a default logger is used.
+
+    Yields:
+        Any: Next element of the array.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        json.JSONDecodeError: If the file is not a valid JSON array.
+    """
+    logger = log or get_logger()
+
+    with error_handler(f"Streaming JSON array from {file_path}", logger):
+        if not os.path.isfile(file_path):
+            raise FileNotFoundError(f"File {file_path} does not exist.")
+
+        decoder = json.JSONDecoder()
+        count = 0
+        with open(file_path, 'r', encoding='utf-8') as f:
+            buf = ''
+            pos = 0
+            eof = False
+
+            def fill(size: int) -> bool:
+                nonlocal buf, pos, eof
+                data = f.read(size)
+                if not data:
+                    eof = True
+                    return False
+                buf = buf[pos:] + data
+                pos = 0
+                return True
+
+            def next_token() -> str:
+                nonlocal pos
+                while True:
+                    while pos < len(buf) and buf[pos] in ' \t\n\r':
+                        pos += 1
+                    if pos < len(buf) or not fill(buffer_size):
+                        return buf[pos] if pos < len(buf) else ''
+
+            if next_token() != '[':
+                raise json.JSONDecodeError("Expecting '[' at the start of a JSON array", buf, pos)
+            pos += 1
+
+            expect_value = True
+            while True:
+                token = next_token()
+                if token == ']' and (count == 0 or not expect_value):
+                    break
+                if not expect_value:
+                    if token != ',':
+                        raise json.JSONDecodeError("Expecting ',' delimiter", buf, pos)
+                    pos += 1
+                    expect_value = True
+                    continue
+                if not token:
+                    raise json.JSONDecodeError("Unterminated JSON array", buf, pos)
+
+                read_size = buffer_size
+                while True:
+                    try:
+                        value, end = decoder.raw_decode(buf, pos)
+                        # A number cut by the end of the buffer decodes as a shorter one ('12' of
+                        # '12.5'); only a delimiter after it, or EOF, proves the value is complete
+                        if eof or (end < len(buf) and buf[end] in ' \t\n\r,]'):
+                            break
+                    except json.JSONDecodeError:
+                        if eof:
+                            raise
+                    if not fill(read_size):
+                        continue
+                    read_size *= 2
+
+                pos = end
+                count += 1
+                expect_value = False
+                yield value
+
+        log_debug(logger, "Streamed %s elements from JSON array %s", count, file_path)
+
+def _compile_ignore(ignore_patterns: Optional[List[str]]) -> Optional[Callable[[str], Any]]:
+    """
+    Combine glob patterns into a single compiled matcher.
+
+    Args:
+        ignore_patterns: Glob patterns matched against entry names, as fnmatch.fnmatch does
+
+    Returns:
+        Callable returning a truthy value for an ignored name, or None if there are no patterns
+    """
+    if not ignore_patterns:
+        return None
+    normcase = os.path.normcase
+    regex = re.compile("|".join(fnmatch.translate(normcase(pattern)) for pattern in ignore_patterns))
+    if normcase("A") == "A":
+        return regex.match
+    return lambda name: regex.match(normcase(name))
+
+def copy_directory(source_dir: str, destination_dir: str, symlinks: bool = False, ignore_patterns: Optional[List[str]] = None, log: Optional[logging.Logger] = None, clone: bool = False, workers: Optional[int] = None, max_inflight_bytes: int = _DEFAULT_MAX_INFLIGHT_BYTES,
+                   checksum: Optional[str] = None, verify: str = "none") -> Union[str, Tuple[str, Dict[str, str]]]:
     """Copies a directory and all its contents to a new location.
 
     Args:
         source_dir (str): Path to the source directory.
         destination_dir (str): Path to the destination directory.
+        symlinks (bool, optional): Whether to copy symbolic links (to files or directories) as links. Defaults to False.
+        ignore_patterns (Optional[List[str]], optional): List of glob patterns matched against file and directory
+            names. Matching directories are skipped without being traversed. Defaults to None.
+        log (Optional[logging.Logger], optional): Logger for auditing. If None, a default logger is used.
+        clone (bool, optional): Try a copy-on-write reflink for each file before copying bytes. Defaults to False.
+        workers (Optional[int], optional): Copy files concurrently with this many threads
+            (see copy_directory_parallel). Defaults to None (sequential).
+        max_inflight_bytes (int, optional): Bytes allowed in flight when workers is set.
+        checksum (Optional[str], optional): Hash algorithm of a digest computed for each file while it
+            is copied (see copy_file). Defaults to None.
+        verify (str, optional): 'none', 'sample' or 'full' verification of each copied file (see copy_file).
+            Defaults to 'none'.
+
+    Each file draws one operation, and each chunk copied its size, from the I/O budgets
+    set with rate_limit.set_io_limit for the source and destination, if any.
+
+    Returns:
+        Union[str, Tuple[str, Dict[str, str]]]: Path to the destination directory, or (path, digests)
+        when checksum is set, with digests mapping each copied file's destination path to its digest.
+
+    Raises:
+        ValueError: If the source directory does not exist, or the hash algorithm or verify mode is unknown.
+        OSError: If a file fails verification, or workers is set and any file failed to copy.
+    """
+    logger = log or get_logger()
+
+    if workers:
+        results = copy_directory_parallel(source_dir, destination_dir, workers, max_inflight_bytes,
+                                          symlinks, ignore_patterns, clone, logger, checksum, verify)
+        failed = [r for r in results if r['status'] == 'failed']
+        if failed:
+            raise OSError(f"Failed to copy {len(failed)} of {len(results)} files, first error: {failed[0]['error']}")
+        if checksum:
+            return destination_dir, {r['destination']: r['digest'] for r in results if r['status'] == 'copied'}
+        return destination_dir
+
+    with error_handler(f"Copying directory {source_dir} to {destination_dir}", logger):
+        if not os.path.isdir(source_dir):
+            raise ValueError(f"Source directory {source_dir} does not exist.")
+
+        _check_verify_options(checksum, verify)
+
+        if os.path.exists(destination_dir):
+            logger.warning(f"Destination {destination_dir} already exists, files may be overwritten")
+
+        is_ignored = _compile_ignore(ignore_patterns)
+        os.makedirs(destination_dir, exist_ok=True)
+        throttle = get_io_throttle(source_dir, destination_dir)
+        digests: Dict[str, str] = {}
+
+        # One scandir pass per directory; ignored directories are never descended into
+        copied = 0
+        pending = [(source_dir, destination_dir)]
+        while pending:
+            src_root, dst_root = pending.pop()
+            with os.scandir(src_root) as entries:
+                for entry in entries:
+                    if is_ignored and is_ignored(entry.name):
+                        continue
+                    dst_item = os.path.join(dst_root, entry.name)
+                    if symlinks and entry.is_symlink():
+                        os.symlink(os.readlink(entry.path), dst_item)
+                    elif entry.is_dir():
+                        os.makedirs(dst_item, exist_ok=True)
+                        pending.append((entry.path, dst_item))
+                    else:
+                        if throttle:
+                            throttle.acquire(ops=1)
+                        digest = _copy2_checked(entry.path, dst_item, checksum, verify, clone, logger, throttle)
+                        if digest:
+                            digests[dst_item] = digest
+                        copied += 1
+
+        logger.info(f"Copied directory {source_dir} to {destination_dir} ({copied} files)")
+        if checksum:
+            return destination_dir, digests
+        return destination_dir
+
+class _ByteBudget:
+    """
+    Blocks producers while more than a given number of bytes are in flight.
+
+    A single item larger than the limit is still admitted when nothing else is in flight.
+    """
+
+    def __init__(self, limit: int):
+        self._limit = max(1, limit)
+        self._inflight = 0
+        self._cond = threading.Condition()
+
+    def acquire(self, amount: int):
+        with self._cond:
+            while self._inflight and self._inflight + amount > self._limit:
+                self._cond.wait()
+            self._inflight += amount
+
+    def release(self, amount: int):
+        with self._cond:
+            self._inflight -= amount
+            self._cond.notify_all()
+
+def copy_directory_parallel(source_dir: str, destination_dir: str, workers: int = 4,
+                            max_inflight_bytes: int = _DEFAULT_MAX_INFLIGHT_BYTES, symlinks: bool = False,
+                            ignore_patterns: Optional[List[str]] = None, clone: bool = False,
+                            log: Optional[logging.Logger] = None, checksum: Optional[str] = None,
+                            verify: str = "none") -> List[Dict[str, Any]]:
+    """Copies a directory tree using a thread pool and returns one result per file.
+
+    Directories are created in a first pass, then files are copied concurrently while the
+    total size of files being copied stays under max_inflight_bytes. Every worker draws each
+    chunk it copies from the I/O budgets set with rate_limit.set_io_limit, so they share them.
+
+    Args:
+        source_dir (str): Path to the source directory.
+        destination_dir (str): Path to the destination directory.
+        workers (int, optional): Number of copy threads. Defaults to 4.
+        max_inflight_bytes (int, optional): Upper bound of bytes being copied at once. Defaults to 256 MB.
         symlinks (bool, optional): Whether to copy symbolic links as links. Defaults to False.
         ignore_patterns (Optional[List[str]], optional): List of glob patterns to ignore. Defaults to None.
+        clone (bool, optional): Try a copy-on-write reflink for each file before copying bytes. Defaults to False.
         log (Optional[logging.Logger], optional): Logger for auditing. If None, a default logger is used.
+        checksum (Optional[str], optional): Hash algorithm of a digest computed for each file while it
+            is copied (see copy_file). Defaults to None.
+        verify (str, optional): 'none', 'sample' or 'full' verification of each copied file (see copy_file).
+            A file that fails it is reported as failed. Defaults to 'none'.
 
     Returns:
-        str: Path to the destination directory.
+        List[Dict[str, Any]]: One dict per file with 'source', 'destination', 'size',
+        'status' ('copied', 'linked' or 'failed'), 'error' and, when checksum is set, 'digest'.
 
     Raises:
-        ValueError: If the source directory does not exist.7777                                 Q
+        ValueError: If the source directory does not exist, workers is less than 1, or the hash
+            algorithm or verify mode is unknown.
     """
     logger = log or get_logger()
 
-    with error_handler(f"Copying directory {source_dir} to {destination_dir}", logger):
+    with error_handler(f"Copying directory {source_dir} to {destination_dir} with {workers} workers", logger):
         if not os.path.isdir(source_dir):
             raise ValueError(f"Source directory {source_dir} does not exist.")
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+        _check_verify_options(checksum, verify)
 
         if os.path.exists(destination_dir):
             logger.warning(f"Destination {destination_dir} already exists, files may be overwritten")
 
-        ignore_func = None
-        if ignore_patterns:
-            def ignore_func(src, names):
-                ignored = set()
-                for pattern in ignore_patterns:
-                    import fnmatch
-                    ignored.update(fnmatch.filter(names, pattern))
-                return ignored
+        is_ignored = _compile_ignore(ignore_patterns) or (lambda name: None)
 
-        os.makedirs(destination_dir, exist_ok=True)
+        results: List[Dict[str, Any]] = []
+        files = []
 
-        for item in os.listdir(source_dir):
-            src_item = os.path.join(source_dir, item)
-            dst_item = os.path.join(destination_dir, item)
+        # First pass: build the directory skeleton and collect the files to copy
+        for root, dirs, names in os.walk(source_dir, followlinks=not symlinks):
+            rel = os.path.relpath(root, source_dir)
+            target_root = destination_dir if rel == os.curdir else os.path.join(destination_dir, rel)
+            os.makedirs(target_root, exist_ok=True)
 
-            if ignore_func and item in ignore_func(source_dir, os.listdir(source_dir)):
-                continue
+            dirs[:] = [d for d in dirs if not is_ignored(d)]
+            entries = names
+            if symlinks:
+                entries = entries + [d for d in dirs if os.path.islink(os.path.join(root, d))]
+                dirs[:] = [d for d in dirs if not os.path.islink(os.path.join(root, d))]
 
-            if os.path.isdir(src_item):
-                if not os.path.exists(dst_item):
-                    os.makedirs(dst_item)
-                copy_directory(src_item, dst_item, symlinks, ignore_patterns)
-            else:
+            for name in entries:
+                if is_ignored(name):
+                    continue
+                src_item = os.path.join(root, name)
+                dst_item = os.path.join(target_root, name)
                 if symlinks and os.path.islink(src_item):
-                    linkto = os.readlink(src_item)
-                    os.symlink(linkto, dst_item)
+                    result = {'source': src_item, 'destination': dst_item, 'size': 0, 'status': 'linked', 'error': None}
+                    try:
+                        os.symlink(os.readlink(src_item), dst_item)
+                    except OSError as e:
+                        result.update(status='failed', error=str(e))
+                    results.append(result)
                 else:
-                    shutil.copy2(src_item, dst_item)
-
-        logger.info(f"Copied directory {source_dir} to {destination_dir}")
-        return destination_dir
+                    files.append((src_item, dst_item))
+
+        budget = _ByteBudget(max_inflight_bytes)
+        throttle = get_io_throttle(source_dir, destination_dir)
+
+        def copy_one(src_item: str, dst_item: str, size: int) -> Dict[str, Any]:
+            result = {'source': src_item, 'destination': dst_item, 'size': size, 'status': 'copied', 'error': None}
+            if checksum:
+                result['digest'] = None
+            try:
+                digest = _copy2_checked(src_item, dst_item, checksum, verify, clone, throttle=throttle)
+                if checksum:
+                    result['digest'] = digest
+            except Exception as e:
+                result.update(status='failed', error=str(e))
+                logger.warning(f"Failed to copy {src_item}: {e}")
+            finally:
+                budget.release(size)
+            return result
+
+        futures = []
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for src_item, dst_item in files:
+                try:
+                    size = os.path.getsize(src_item)
+                except OSError:
+                    size = 0
+                budget.acquire(size)
+                if throttle:
+                    throttle.acquire(ops=1)
+                futures.append(pool.submit(copy_one, src_item, dst_item, size))
+
+        results.extend(f.result() for f in futures)
+
+        copied = [r for r in results if r['status'] != 'failed']
+        total = sum(r['size'] for r in copied)
+        logger.info(
+            f"Copied {len(copied)} of {len(results)} files ({_format_size(total)}) "
+            f"from {source_dir} to {destination_dir} with {workers} workers"
+        )
+        return results
 
 def ensure_path_exists(path: str, is_file: bool = False, log: Optional[logging.Logger] = None) -> str:
     """Ensures that the given path exists.
@@ -541,10 +2586,10 @@ def ensure_path_exists(path: str, is_file: bool = False, log: Optional[logging.L
             directory = os.path.dirname(path)
             if directory:
                 os.makedirs(directory, exist_ok=True)
-                logger.debug(f"Created directory structure for file: {path}")
+                log_debug(logger, "Created directory structure for file: %s", path)
         else:
             os.makedirs(path, exist_ok=True)
-            logger.debug(f"Created directory: {path}")
+            log_debug(logger, "Created directory: %s", path)
 
         return path
 
@@ -577,6 +2622,216 @@ def order_columns_by_schema(schema: List[Dict], name_column_order: str, name_col
         ordered_list = sorted(schema, key=lambda d: d[name_column_order])
 
         ordered_columns = [item[name_column] for item in ordered_list]
-        logger.debug(f"Ordered {len(ordered_columns)} columns")
+        log_debug(logger, "Ordered %s columns", len(ordered_columns))
 
         return ordered_columns
+
+def _csv_delimiter(file_path: str, delimiter: Optional[str]) -> str:
+    """
+    Resolve the field delimiter of a CSV/TSV file.
+
+    Args:
+        file_path: File path
+        delimiter: Explicit delimiter, or None to choose from the extension
+
+    Returns:
+        The delimiter; tab for .tsv and .tab files, comma otherwise
+    """
+    if delimiter is not None:
+        return delimiter
+    return '\t' if os.path.splitext(file_path)[1].lower() in _TSV_EXTENSIONS else ','
+
+def _reorder_csv(source_file_path: str, destination_file_path: str, columns: List[str], delimiter: Optional[str] = None,
+                 encoding: str = 'utf-8', chunk_rows: int = _CSV_CHUNK_ROWS, fill_missing: bool = False,
+                 keep_extra: bool = False) -> int:
+    """
+    Rewrite a CSV/TSV file with its columns in the given order, chunk_rows rows at a time.
+
+    Module-level and free of loggers so it can run in a process pool.
+
+    Args:
+        source_file_path: CSV/TSV file with a header row
+        destination_file_path: Output file, written atomically (may be the source itself)
+        columns: Column names in output order
+        delimiter: Field delimiter, or None to choose from the source extension
+        encoding: Text encoding of both files
+        chunk_rows: Rows held in memory at once
+        fill_missing: Write empty values for columns absent from the file instead of failing
+        keep_extra: Append columns absent from columns after them, in their original order
+
+    Returns:
+        Number of data rows written
+
+    Raises:
+        KeyError: If a column is missing from the header and fill_missing is False
+        ValueError: If a row does not have as many fields as the header
+    """
+    delimiter = _csv_delimiter(source_file_path, delimiter)
+    rows_written = 0
+
+    def write(out):
+        nonlocal rows_written
+        with open(source_file_path, 'r', encoding=encoding, newline='') as src:
+            reader = csv.reader(src, delimiter=delimiter)
+            writer = csv.writer(out, delimiter=delimiter, lineterminator='\n')
+            header = next(reader, None)
+            if header is None:
+                return
+
+            positions = {name: i for i, name in enumerate(header)}
+            missing = [name for name in columns if name not in positions]
+            if missing and not fill_missing:
+                raise KeyError(f"Columns {missing} are not in the header of {source_file_path}")
+            output = list(columns)
+            if keep_extra:
+                wanted = set(columns)
+                output += [name for name in header if name not in wanted]
+
+            # Index len(header) points at an empty value appended to each row for missing columns
+            indices = [positions.get(name, len(header)) for name in output]
+            pick = itemgetter(*indices) if len(indices) > 1 else (lambda row: (row[indices[0]],))
+            writer.writerow(output)
+
+            width = len(header)
+
+            def data_rows():
+                for row in reader:
+                    if not row:
+                        # Blank line
+                        continue
+                    if len(row) != width:
+                        raise ValueError(f"Line {reader.line_num} of {source_file_path} has {len(row)} fields, "
+                                         f"its header has {width}")
+                    yield row
+
+            rows = data_rows()
+            while True:
+                if missing:
+                    chunk = [pick(row + ['']) for row in islice(rows, chunk_rows)]
+                else:
+                    chunk = [pick(row) for row in islice(rows, chunk_rows)]
+                if not chunk:
+                    break
+                writer.writerows(chunk)
+                rows_written += len(chunk)
+
+    _write_with_policy(destination_file_path, write, 'w', encoding=encoding, atomic=True)
+    return rows_written
+
+def reorder_csv_columns(source_file_path: str, schema: List[Dict], name_column_order: str,
+                        destination_file_path: Optional[str] = None, name_column: str = 'column_name',
+                        delimiter: Optional[str] = None, encoding: str = 'utf-8', chunk_rows: int = _CSV_CHUNK_ROWS,
+                        fill_missing: bool = False, keep_extra: bool = False,
+                        log: Optional[logging.Logger] = None) -> str:
+    """Rewrites a CSV/TSV file with its columns in schema order, streaming it in chunks.
+
+    The order comes from order_columns_by_schema. Rows are read and written chunk_rows at a
+    time, so memory does not grow with the file. The output goes to a temporary file that
+    replaces the destination once complete, so rewriting in place is safe. Lines end with
+    '\n' and fields are quoted only when needed; blank lines are dropped.
+
+    Args:
+        source_file_path (str): CSV/TSV file with a header row.
+        schema (List[Dict]): Schema metadata, where each item is a dictionary.
+        name_column_order (str): Key in the schema dict used for sorting.
+        destination_file_path (Optional[str], optional): Output file. Defaults to None (rewrite the source).
+        name_column (str, optional): Key in the schema dict containing the column name. Defaults to 'column_name'.
+        delimiter (Optional[str], optional): Field delimiter. Defaults to None: tab for .tsv/.tab files, comma otherwise.
+        encoding (str, optional): Text encoding. Defaults to 'utf-8'.
+        chunk_rows (int, optional): Rows held in memory at once. Defaults to 10000.
+        fill_missing (bool, optional): Write empty values for schema columns absent from the file. Defaults to False.
+        keep_extra (bool, optional): Keep columns absent from the schema after the schema columns. Defaults to
+            False (they are dropped).
+        log (Optional[logging.Logger], optional): Logger for auditing. If None, a default logger is used.
+
+    Returns:
+        str: Path of the rewritten file.
+
+    Raises:
+        ValueError: If the source file does not exist, the schema is empty, chunk_rows is less than 1
+            or a row does not have as many fields as the header.
+        KeyError: If schema items lack the keys, or a column is missing and fill_missing is False.
+    """
+    logger = log or get_logger()
+    destination_file_path = destination_file_path or source_file_path
+
+    with error_handler(f"Reordering columns of {source_file_path}", logger):
+        if not os.path.isfile(source_file_path):
+            raise ValueError(f"Source file {source_file_path} does not exist.")
+        if chunk_rows < 1:
+            raise ValueError(f"chunk_rows must be at least 1, got {chunk_rows}")
+
+        columns = order_columns_by_schema(schema, name_column_order, name_column, logger)
+        if not columns:
+            raise ValueError("Schema is empty: no columns to order by")
+        rows = _reorder_csv(source_file_path, destination_file_path, columns, delimiter, encoding,
+                            chunk_rows, fill_missing, keep_extra)
+        logger.info(f"Reordered {len(columns)} columns of {source_file_path} ({rows} rows) into {destination_file_path}")
+        return destination_file_path
+
+def reorder_csv_files(pairs: Iterable[Tuple[str, Optional[str]]], schema: List[Dict], name_column_order: str,
+                      name_column: str = 'column_name', workers: int = 4, processes: bool = True,
+                      delimiter: Optional[str] = None, encoding: str = 'utf-8', chunk_rows: int = _CSV_CHUNK_ROWS,
+                      fill_missing: bool = False, keep_extra: bool = False,
+                      log: Optional[logging.Logger] = None) -> List[Dict[str, Any]]:
+    """Reorders the columns of many CSV/TSV files in parallel (see reorder_csv_columns).
+
+    The column order is computed from the schema once for the whole batch. CSV parsing holds
+    the GIL, so files are processed in a process pool by default; processes=False uses threads.
+    A failing file is reported in its result instead of aborting the batch.
+
+    Args:
+        pairs (Iterable[Tuple[str, Optional[str]]]): (source_file_path, destination_file_path) pairs;
+            a None destination rewrites the source.
+        schema (List[Dict]): Schema metadata, where each item is a dictionary.
+        name_column_order (str): Key in the schema dict used for sorting.
+        name_column (str, optional): Key in the schema dict containing the column name. Defaults to 'column_name'.
+        workers (int, optional): Number of worker processes or threads. Defaults to 4.
+        processes (bool, optional): Use a process pool rather than threads. Defaults to True.
+        delimiter (Optional[str], optional): Field delimiter, or None to choose from each file's extension.
+        encoding (str, optional): Text encoding. Defaults to 'utf-8'.
+        chunk_rows (int, optional): Rows held in memory at once per file. Defaults to 10000.
+        fill_missing (bool, optional): Write empty values for schema columns absent from a file. Defaults to False.
+        keep_extra (bool, optional): Keep columns absent from the schema. Defaults to False.
+        log (Optional[logging.Logger], optional): Logger for auditing. If None, a default logger is used.
+
+    Returns:
+        List[Dict[str, Any]]: One dict per pair, in input order, with 'source', 'destination',
+        'rows', 'status' ('reordered' or 'failed') and 'error'.
+
+    Raises:
+        ValueError: If workers or chunk_rows is less than 1, or the schema is empty.
+        KeyError: If schema items lack the keys.
+    """
+    logger = log or get_logger()
+
+    with error_handler(f"Reordering CSV columns with {workers} workers", logger):
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+        if chunk_rows < 1:
+            raise ValueError(f"chunk_rows must be at least 1, got {chunk_rows}")
+
+        columns = order_columns_by_schema(schema, name_column_order, name_column, logger)
+        if not columns:
+            raise ValueError("Schema is empty: no columns to order by")
+        pairs = [(source, destination or source) for source, destination in pairs]
+
+        executor = ProcessPoolExecutor if processes else ThreadPoolExecutor
+        with executor(max_workers=workers) as pool:
+            futures = [pool.submit(_reorder_csv, source, destination, columns, delimiter, encoding,
+                                   chunk_rows, fill_missing, keep_extra)
+                       for source, destination in pairs]
+
+        results = []
+        for (source, destination), future in zip(pairs, futures):
+            result = {'source': source, 'destination': destination, 'rows': 0, 'status': 'reordered', 'error': None}
+            try:
+                result['rows'] = future.result()
+            except Exception as e:
+                result.update(status='failed', error=str(e))
+                logger.warning(f"Failed to reorder columns of {source}: {e}")
+            results.append(result)
+
+        failed = sum(1 for r in results if r['status'] == 'failed')
+        logger.info(f"Reordered columns of {len(results) - failed} of {len(results)} files with {workers} workers")
+        return results
@@ -1,9 +1,15 @@
 import os
 import hashlib
 from typing import Dict, List
-from logging_metrics import configure_basic_logging
+if __package__:
+    from .log_utils import get_logger, error_handler, log_debug
+    from .io_ops import AdaptiveBuffer, CacheHints
+    from .rate_limit import get_io_throttle
+else:
+    from log_utils import get_logger, error_handler, log_debug
+    from io_ops import AdaptiveBuffer, CacheHints
+    from rate_limit import get_io_throttle
 import logging
-from contextlib import contextmanager
 from typing import Dict, List, Optional
 
 __all__ = [
@@ -11,53 +17,27 @@ __all__ = [
     "find_duplicates"
 ]
 
-def get_logger() -> logging.Logger:
-    """Initializes and returns a logger with a printout to the console.
-
-    Returns:
-        logging.Logger: Basic logger.
-    """
-    return configure_basic_logging()
-
-@contextmanager
-def error_handler(operation: str, logger: Optional[logging.Logger] = None, reraise: bool = True):
-    """
-    Context manager for handling errors in file operations.
-
-    Args:
-        operation: Description of the operation being performed
-        logger: Logger for recording errors
-        reraise: Whether to raise exceptions again after logging
-    """
-    try:
-        yield
-    except FileNotFoundError as e:
-        logger.error(f"{operation} failed: File not found - {str(e)}")
-        if reraise:
-            raise
-    except PermissionError as e:
-        logger.error(f"{operation} failed: Permission denied - {str(e)}")
-        if reraise:
-            raise
-    except Exception as e:
-        logger.error(f"{operation} failed: {str(e)}")
-        if reraise:
-            raise
-
-def get_file_hash(file_path: str, algorithm: str = 'sha256', chunk_size: int = 8192, log: Optional[logging.Logger] = None) -> str:
+def get_file_hash(file_path: str, algorithm: str = 'sha256', chunk_size: Optional[int] = None, log: Optional[logging.Logger] = None, progress_callback=None,
+                  io_hints: Optional[str] = None) -> str:
     """Calculates the hash of a file.
 
+    Reads draw from the I/O budget set with rate_limit.set_io_limit for the file, if any.
+
     Args:
         file_path (str): File path.
         algorithm (str): Hash algorithm (e.g., 'md5', 'sha1', 'sha256').
-        chunk_size (int): Read block size.
+        chunk_size (Optional[int]): Fixed read block size. If None, the block size starts from the
+            device block size and file size and is tuned from the measured throughput.
         log (logging.Logger, optional): Logger for auditing. If None, uses get_logger().
+        progress_callback (Optional[callable]): Callback function for progress in bytes.
+        io_hints (Optional[str]): Page-cache policy: 'none', 'sequential' or 'dontneed' (drop the pages
+            already hashed). Defaults to None, the default set with io_ops.set_io_hints.
 
     Returns:
         str: Hash in hexadecimal.
 
     Raises:
-        ValueError: If the file does not exist.
+        ValueError: If the file does not exist or the I/O hints policy is unknown.
     """
     logger = log or get_logger()
 
@@ -66,21 +46,36 @@ def get_file_hash(file_path: str, algorithm: str = 'sha256', chunk_size: int = 8
             raise ValueError(f"File {file_path} does not exist.")
 
         hash_obj = hashlib.new(algorithm)
-        with open(file_path, 'rb') as f:
-            while chunk := f.read(chunk_size):
+        throttle = get_io_throttle(file_path)
+        if throttle:
+            throttle.acquire(ops=1)
+        with open(file_path, 'rb', buffering=0) as f, CacheHints(f.fileno(), io_hints) as hints:
+            if chunk_size:
+                buffer = AdaptiveBuffer(initial_size=chunk_size, adaptive=False)
+            else:
+                buffer = AdaptiveBuffer.for_fd(f.fileno())
+            while chunk := buffer.readinto(f):
                 hash_obj.update(chunk)
+                buffer.update(len(chunk))
+                hints.advance(len(chunk))
+                if throttle:
+                    throttle.acquire(len(chunk))
+                if progress_callback:
+                    progress_callback(len(chunk))
 
         file_hash = hash_obj.hexdigest()
-        logger.debug(f"{algorithm} hash for {file_path}: {file_hash}")
+        log_debug(logger, "%s hash for %s: %s", algorithm, file_path, file_hash)
         return file_hash
 
-def find_duplicates(directory: str, recursive: bool = True, log: Optional[logging.Logger] = None) -> Dict[str, List[str]]:
+def find_duplicates(directory: str, recursive: bool = True, log: Optional[logging.Logger] = None,
+                    io_hints: Optional[str] = None) -> Dict[str, List[str]]:
     """Finds duplicate files in a directory based on their contents.
 
     Args:
         directory (str): Directory path.
         recursive (bool): Whether to include subdirectories.
         log (logging.Logger, optional): Logger for auditing. If None, uses get_logger().
+        io_hints (Optional[str]): Page-cache policy for hashing each file (see get_file_hash).
 
     Returns:
         Dict[str, List[str]]: Hash mapping -> list of duplicate files.
@@ -97,7 +92,7 @@ def find_duplicates(directory: str, recursive: bool = True, log: Optional[loggin
 
         def process_file(file_path):
             try:
-                file_hash = get_file_hash(file_path)
+                file_hash = get_file_hash(file_path, io_hints=io_hints)
                 hashes.setdefault(file_hash, []).append(file_path)
             except Exception as e:
                 logger.warning(f"Error processing {file_path}: {e}")
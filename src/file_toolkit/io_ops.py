@@ -0,0 +1,270 @@
+import os
+import time
+import threading
+from typing import Optional
+
+__all__ = [
+    "AdaptiveBuffer",
+    "CacheHints",
+    "set_io_hints",
+    "get_io_hints"
+]
+
+_MIN_BLOCK_SIZE = 64 * 1024
+_START_BLOCK_SIZE = 1024 * 1024
+_MAX_BLOCK_SIZE = 8 * 1024 * 1024
+
+_IO_HINT_POLICIES = ("none", "sequential", "dontneed")
+_DROP_WINDOW = 8 * 1024 * 1024
+
+_default_io_hints = "none"
+_io_hints_lock = threading.Lock()
+
+def _resolve_io_hints(policy: Optional[str]) -> str:
+    """
+    Validate an I/O hints policy, falling back to the global default.
+
+    Args:
+        policy: 'none', 'sequential', 'dontneed' or None for the default
+
+    Returns:
+        Policy name
+    """
+    if policy is None:
+        return _default_io_hints
+    if policy not in _IO_HINT_POLICIES:
+        raise ValueError(f"Unknown I/O hints policy '{policy}'. Expected one of {_IO_HINT_POLICIES}.")
+    return policy
+
+def set_io_hints(policy: str = "none") -> str:
+    """Sets the default page-cache policy of the streaming copy and hash helpers.
+
+    Args:
+        policy (str, optional): 'none' (no advice), 'sequential' (POSIX_FADV_SEQUENTIAL before
+            streaming) or 'dontneed' (sequential, plus POSIX_FADV_DONTNEED behind the cursor).
+            Defaults to 'none'.
+
+    Returns:
+        str: The previous default, so it can be restored.
+
+    Raises:
+        ValueError: If the policy is unknown.
+    """
+    global _default_io_hints
+    policy = _resolve_io_hints(policy)
+    with _io_hints_lock:
+        previous, _default_io_hints = _default_io_hints, policy
+    return previous
+
+def get_io_hints() -> str:
+    """Returns the default page-cache policy set with set_io_hints.
+
+    Returns:
+        str: 'none', 'sequential' or 'dontneed'.
+    """
+    return _default_io_hints
+
+class CacheHints:
+    """Page-cache advice for one pass over an open file descriptor.
+
+    With 'sequential' the kernel is told before streaming that the file is read in order,
+    which doubles its read-ahead. 'dontneed' also releases the pages already consumed:
+    every window bytes behind the cursor and the whole file on close, so hashing or
+    copying large trees does not evict the working set of other processes. Dirty pages
+    are only queued for writeback by the first advice and dropped by a later one. Does
+    nothing where os.posix_fadvise is unavailable.
+
+    Args:
+        fd (int): Open file descriptor.
+        policy (Optional[str], optional): 'none', 'sequential' or 'dontneed'. Defaults to None
+            (the default set with set_io_hints).
+        window (int, optional): Bytes consumed between two POSIX_FADV_DONTNEED calls. Defaults to 8 MB.
+        offset (int, optional): Position of the cursor when streaming starts. Defaults to 0.
+
+    Raises:
+        ValueError: If the policy is unknown.
+    """
+
+    def __init__(self, fd: int, policy: Optional[str] = None, window: int = _DROP_WINDOW, offset: int = 0):
+        self._fd = fd
+        self._policy = _resolve_io_hints(policy)
+        self._window = window
+        self._cursor = offset
+        self._dropped = offset
+        if self._policy != "none":
+            self._advise(0, 0, "POSIX_FADV_SEQUENTIAL")
+
+    @property
+    def policy(self) -> str:
+        """Policy in effect."""
+        return self._policy
+
+    def _advise(self, offset: int, length: int, advice: str) -> None:
+        fadvise = getattr(os, "posix_fadvise", None)
+        if fadvise is None:
+            return
+        try:
+            fadvise(self._fd, offset, length, getattr(os, advice))
+        except OSError:
+            # Advice is best effort (e.g. ESPIPE on pipes)
+            pass
+
+    def advance(self, nbytes: int) -> None:
+        """Moves the cursor forward and drops the pages behind it once a window has passed.
+
+        Args:
+            nbytes (int): Bytes consumed since the previous call.
+        """
+        self._cursor += nbytes
+        if self._policy == "dontneed" and self._cursor - self._dropped >= self._window:
+            self._advise(self._dropped, self._cursor - self._dropped, "POSIX_FADV_DONTNEED")
+            self._dropped = self._cursor
+
+    def wrap(self, progress_callback=None):
+        """Returns a progress callback that also advances the cursor.
+
+        Args:
+            progress_callback (Optional[callable]): Callback to chain, called with the bytes of each chunk.
+
+        Returns:
+            callable: progress_callback itself when the policy needs no cursor.
+        """
+        if self._policy != "dontneed":
+            return progress_callback
+
+        def callback(nbytes):
+            self.advance(nbytes)
+            if progress_callback:
+                progress_callback(nbytes)
+        return callback
+
+    def close(self) -> None:
+        """Drops every cached page of the file under the 'dontneed' policy."""
+        if self._policy == "dontneed":
+            self._advise(0, 0, "POSIX_FADV_DONTNEED")
+            self._dropped = self._cursor
+
+    def __enter__(self) -> "CacheHints":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+class AdaptiveBuffer:
+    """Reusable I/O buffer whose block size adapts to the measured throughput.
+
+    The starting block size is derived from the device block size (st_blksize) and the
+    file size. While data flows, the throughput of each sample window is compared with
+    the previous one: the block doubles while it keeps paying off and settles on the
+    best size once a larger block stops helping. A single bytearray is reused for all
+    reads through readinto, so no bytes object is allocated per chunk.
+
+    Args:
+        file_size (Optional[int]): Size of the file being processed, if known.
+        block_size (Optional[int]): Device block size (st_blksize). Defaults to 4096.
+        initial_size (Optional[int]): Fixed starting size; skips the size heuristics.
+        adaptive (bool, optional): Whether to tune the size from throughput. Defaults to True.
+        max_size (int, optional): Upper bound for the block size. Defaults to 8 MB.
+        sample_reads (int, optional): Number of chunks per throughput sample. Defaults to 4.
+    """
+
+    def __init__(self, file_size: Optional[int] = None, block_size: Optional[int] = None,
+                 initial_size: Optional[int] = None, adaptive: bool = True,
+                 max_size: int = _MAX_BLOCK_SIZE, sample_reads: int = 4):
+        self._max_size = max(max_size, initial_size or 0)
+        self._size = initial_size or self._initial_size(file_size, block_size)
+        self._adaptive = adaptive
+        self._sample_reads = sample_reads
+        self._buffer = None
+        self._view = None
+        self._sample_bytes = 0
+        self._sample_count = 0
+        self._sample_start = None
+        self._best_rate = 0.0
+        self._best_size = self._size
+        self._settled = not adaptive
+
+    @classmethod
+    def for_fd(cls, fd: int, **kwargs) -> "AdaptiveBuffer":
+        """Builds a buffer sized for an open file descriptor.
+
+        Args:
+            fd (int): Open file descriptor.
+            **kwargs: Extra arguments for the constructor.
+
+        Returns:
+            AdaptiveBuffer: Buffer using the descriptor's st_size and st_blksize.
+        """
+        st = os.fstat(fd)
+        return cls(file_size=st.st_size, block_size=getattr(st, "st_blksize", None), **kwargs)
+
+    def _initial_size(self, file_size: Optional[int], block_size: Optional[int]) -> int:
+        block = block_size or 4096
+        floor = max(block, _MIN_BLOCK_SIZE)
+        if not file_size:
+            return max(floor, _START_BLOCK_SIZE)
+        # Aim for at least 16 reads so there is something to tune, rounded to whole device blocks
+        target = file_size // 16
+        size = floor
+        while size * 2 <= min(target, _START_BLOCK_SIZE):
+            size *= 2
+        return min(max(size, floor), self._max_size)
+
+    @property
+    def size(self) -> int:
+        """Current block size in bytes."""
+        return self._size
+
+    def readinto(self, file_obj) -> memoryview:
+        """Reads the next block from a binary file object into the shared buffer.
+
+        The returned view is only valid until the next call.
+
+        Args:
+            file_obj: Binary file object that implements readinto.
+
+        Returns:
+            memoryview: The bytes read; empty at EOF.
+        """
+        if self._buffer is None or len(self._buffer) < self._size:
+            self._buffer = bytearray(self._size)
+            self._view = memoryview(self._buffer)
+        if self._sample_start is None:
+            self._sample_start = time.perf_counter()
+        read = file_obj.readinto(self._view[:self._size]) or 0
+        return self._view[:read]
+
+    def update(self, nbytes: int):
+        """Records that a chunk was fully processed and retunes the block size.
+
+        Args:
+            nbytes (int): Bytes processed since the previous call.
+        """
+        if self._settled:
+            return
+        now = time.perf_counter()
+        if self._sample_start is None:
+            self._sample_start = now
+            return
+
+        self._sample_bytes += nbytes
+        self._sample_count += 1
+        if self._sample_count < self._sample_reads:
+            return
+
+        elapsed = now - self._sample_start
+        rate = self._sample_bytes / elapsed if elapsed > 0 else float("inf")
+        self._sample_bytes = 0
+        self._sample_count = 0
+        self._sample_start = now
+
+        if rate > self._best_rate * 1.1:
+            self._best_rate = rate
+            self._best_size = self._size
+            if self._size * 2 <= self._max_size:
+                self._size *= 2
+            else:
+                self._settled = True
+        else:
+            self._size = self._best_size
+            self._settled = True
@@ -0,0 +1,177 @@
+import json
+import importlib
+import threading
+from typing import Any, Dict, Optional, Tuple, Union
+
+__all__ = [
+    "JsonCodec",
+    "get_json_codec",
+    "set_json_backend",
+    "available_json_backends"
+]
+
+_BACKENDS = ("orjson", "ujson", "json")
+_AUTO = "auto"
+
+# The fast backends change output (NaN as null) and input (large integers as floats),
+# so they are opt-in through set_json_backend or backend=
+_default_backend = "json"
+_codecs: Dict[str, "JsonCodec"] = {}
+_codecs_lock = threading.Lock()
+
+def _import_backend(name: str):
+    """
+    Import a JSON backend module.
+
+    Args:
+        name: 'orjson', 'ujson' or 'json'
+
+    Returns:
+        The module, or None if it is not installed
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+def available_json_backends() -> Tuple[str, ...]:
+    """Lists the JSON backends that can be imported, fastest first.
+
+    Returns:
+        Tuple[str, ...]: Installed backends among 'orjson', 'ujson' and 'json'.
+    """
+    return tuple(name for name in _BACKENDS if _import_backend(name) is not None)
+
+class JsonCodec:
+    """Encodes and decodes JSON with the fastest available backend.
+
+    orjson is preferred, then ujson, then the standard library. Output is always UTF-8
+    bytes so it can be written to a binary file without another encoding pass. A value
+    the fast backend cannot serialize (integers beyond 64 bits, unsupported key types,
+    ...) is encoded with the standard library instead, and a document it rejects (NaN
+    and Infinity literals, ...) is parsed with the standard library, so a payload never
+    fails only because a fast backend is installed. The fast backends are not exact
+    replacements: orjson writes NaN and Infinity as null and parses integers beyond 64
+    bits as floats. orjson only indents by 2 spaces; other indents fall back to ujson
+    or the standard library.
+
+    Args:
+        backend (str, optional): 'auto', 'orjson', 'ujson' or 'json'. Defaults to 'auto'.
+
+    Raises:
+        ValueError: If the backend is unknown.
+        ImportError: If a specific backend was requested but is not installed.
+    """
+
+    def __init__(self, backend: str = _AUTO):
+        if backend != _AUTO and backend not in _BACKENDS:
+            raise ValueError(f"Unknown JSON backend '{backend}'. Expected 'auto' or one of {_BACKENDS}.")
+
+        candidates = _BACKENDS if backend == _AUTO else (backend,)
+        for name in candidates:
+            module = _import_backend(name)
+            if module is not None:
+                self._name = name
+                self._module = module
+                break
+        else:
+            raise ImportError(f"JSON backend '{backend}' is not installed.")
+
+    @property
+    def name(self) -> str:
+        """Name of the backend in use."""
+        return self._name
+
+    def dumps(self, data: Any, indent: Optional[int] = None, sort_keys: bool = False, compact: bool = False) -> bytes:
+        """Serializes data to UTF-8 encoded JSON.
+
+        Args:
+            data (Any): Data to serialize.
+            indent (Optional[int], optional): Spaces per indentation level. Defaults to None.
+            sort_keys (bool, optional): Whether to sort dictionary keys. Defaults to False.
+            compact (bool, optional): No indentation and no spaces after separators. Overrides indent.
+
+        Returns:
+            bytes: Encoded JSON document.
+        """
+        if compact:
+            indent = None
+
+        if self._name == "orjson" and indent in (None, 2):
+            option = self._module.OPT_NON_STR_KEYS
+            if indent:
+                option |= self._module.OPT_INDENT_2
+            if sort_keys:
+                option |= self._module.OPT_SORT_KEYS
+            try:
+                return self._module.dumps(data, option=option)
+            except TypeError:
+                pass
+        elif self._name == "ujson":
+            try:
+                return self._module.dumps(data, indent=indent or 0, sort_keys=sort_keys,
+                                          ensure_ascii=False, escape_forward_slashes=False).encode("utf-8")
+            except (TypeError, OverflowError):
+                pass
+
+        separators = (",", ":") if compact else None
+        return json.dumps(data, indent=indent, sort_keys=sort_keys, separators=separators).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Parses a JSON document.
+
+        Args:
+            data (Union[bytes, str]): UTF-8 bytes or text.
+
+        Returns:
+            Any: Parsed data.
+
+        Raises:
+            json.JSONDecodeError: If the document is not valid JSON.
+        """
+        if self._module is json:
+            return json.loads(data)
+        try:
+            return self._module.loads(data)
+        except ValueError:
+            return json.loads(data)
+
+def get_json_codec(backend: Optional[str] = None) -> JsonCodec:
+    """Returns a shared codec for a backend.
+
+    Args:
+        backend (Optional[str], optional): Backend name; None uses the default set with
+            set_json_backend ('json' unless changed).
+
+    Returns:
+        JsonCodec: Cached codec instance.
+    """
+    name = backend or _default_backend
+    codec = _codecs.get(name)
+    if codec is None:
+        with _codecs_lock:
+            codec = _codecs.get(name)
+            if codec is None:
+                codec = _codecs[name] = JsonCodec(name)
+    return codec
+
+def set_json_backend(backend: str = _AUTO) -> JsonCodec:
+    """Sets the default backend used by the JSON helpers of file_toolkit.
+
+    The standard library is the default. Choosing a fast backend speeds up large documents
+    but changes what round-trips: see JsonCodec.
+
+    Args:
+        backend (str, optional): 'auto', 'orjson', 'ujson' or 'json'. Defaults to 'auto'.
+
+    Returns:
+        JsonCodec: The codec that is now the default.
+
+    Raises:
+        ValueError: If the backend is unknown.
+        ImportError: If the backend is not installed.
+    """
+    global _default_backend
+    codec = get_json_codec(backend)
+    _default_backend = backend
+    return codec
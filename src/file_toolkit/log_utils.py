@@ -0,0 +1,109 @@
+import logging
+import threading
+from typing import Any, Optional
+from logging_metrics import configure_basic_logging
+
+__all__ = [
+    "get_logger",
+    "reset_logger",
+    "error_handler",
+    "log_lazy",
+    "log_debug"
+]
+
+_LEVEL_METHODS = {
+    logging.DEBUG: "debug",
+    logging.INFO: "info",
+    logging.WARNING: "warning",
+    logging.ERROR: "error",
+    logging.CRITICAL: "critical"
+}
+
+_logger: Optional[logging.Logger] = None
+_logger_lock = threading.Lock()
+
+def get_logger() -> logging.Logger:
+    """Returns the shared console logger.
+
+    Logging is configured with configure_basic_logging on the first call only; later
+    calls return the same logger without touching the handlers again.
+
+    Returns:
+        logging.Logger: Basic logger.
+    """
+    global _logger
+    logger = _logger
+    if logger is None:
+        with _logger_lock:
+            if _logger is None:
+                _logger = configure_basic_logging()
+            logger = _logger
+    return logger
+
+def reset_logger() -> None:
+    """Forgets the shared logger so the next get_logger call configures logging again."""
+    global _logger
+    with _logger_lock:
+        _logger = None
+
+def log_lazy(logger: Any, level: int, msg: str, *args: Any) -> None:
+    """Logs a %-style message, formatting it only if the level is enabled.
+
+    Args:
+        logger (Any): logging.Logger or any object with debug/info/warning/error methods.
+        level (int): Logging level (e.g., logging.DEBUG).
+        msg (str): Message with %-style placeholders.
+        *args (Any): Values for the placeholders.
+    """
+    is_enabled = getattr(logger, "isEnabledFor", None)
+    if is_enabled is not None and not is_enabled(level):
+        return
+    getattr(logger, _LEVEL_METHODS.get(level, "info"))(msg % args if args else msg)
+
+def log_debug(logger: Any, msg: str, *args: Any) -> None:
+    """Logs a %-style debug message, formatting it only if DEBUG is enabled.
+
+    Args:
+        logger (Any): logging.Logger or any object with a debug method.
+        msg (str): Message with %-style placeholders.
+        *args (Any): Values for the placeholders.
+    """
+    is_enabled = getattr(logger, "isEnabledFor", None)
+    if is_enabled is None or is_enabled(logging.DEBUG):
+        logger.debug(msg % args if args else msg)
+
+class error_handler:
+    """
+    Context manager for handling errors in file operations.
+
+    Implemented as a plain class rather than a generator-based context manager so
+    entering and leaving it costs a couple of method calls on the success path.
+
+    Args:
+        operation: Description of the operation being performed
+        logger: Logger for recording errors. If None, get_logger() is used when an error occurs
+        reraise: Whether to raise exceptions again after logging
+    """
+
+    __slots__ = ("operation", "logger", "reraise")
+
+    def __init__(self, operation: str, logger: Optional[logging.Logger] = None, reraise: bool = True):
+        self.operation = operation
+        self.logger = logger
+        self.reraise = reraise
+
+    def __enter__(self) -> "error_handler":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is None or not issubclass(exc_type, Exception):
+            return False
+
+        logger = self.logger or get_logger()
+        if issubclass(exc_type, FileNotFoundError):
+            logger.error(f"{self.operation} failed: File not found - {str(exc)}")
+        elif issubclass(exc_type, PermissionError):
+            logger.error(f"{self.operation} failed: Permission denied - {str(exc)}")
+        else:
+            logger.error(f"{self.operation} failed: {str(exc)}")
+        return not self.reraise
@@ -2,48 +2,17 @@ import os
 import time
 import threading
 from typing import Optional, Callable
-from logging_metrics import configure_basic_logging
+if __package__:
+    from .log_utils import get_logger, error_handler, log_debug
+else:
+    from log_utils import get_logger, error_handler, log_debug
 import logging
-from contextlib import contextmanager
 from typing import Dict, List, Optional
 
 __all__ = [
     "watch_file"
 ]
 
-def get_logger() -> logging.Logger:
-    """Initializes and returns a logger with a printout to the console.
-
-    Returns:
-        logging.Logger: Basic logger.
-    """
-    return configure_basic_logging()
-
-@contextmanager
-def error_handler(operation: str, logger: Optional[logging.Logger] = None, reraise: bool = True):
-    """
-    Context manager for handling errors in file operations.
-
-    Args:
-        operation: Description of the operation being performed
-        logger: Logger for recording errors
-        reraise: Whether to raise exceptions again after logging
-    """
-    try:
-        yield
-    except FileNotFoundError as e:
-        logger.error(f"{operation} failed: File not found - {str(e)}")
-        if reraise:
-            raise
-    except PermissionError as e:
-        logger.error(f"{operation} failed: Permission denied - {str(e)}")
-        if reraise:
-            raise
-    except Exception as e:
-        logger.error(f"{operation} failed: {str(e)}")
-        if reraise:
-            raise
-
 def watch_file(file_path: str, callback: Callable[[str], None], interval: float = 1.0,
                max_time: Optional[float] = None, log: Optional[logging.Logger] = None):
     """Monitors changes to a file and calls a callback when changes are detected.
@@ -82,7 +51,7 @@ def watch_file(file_path: str, callback: Callable[[str], None], interval: float
                 try:
                     current_modified = os.path.getmtime(file_path)
                     if current_modified != last_modified:
-                        logger.debug(f"Detected change in {file_path}")
+                        log_debug(logger, "Detected change in %s", file_path)
                         last_modified = current_modified
                         callback(file_path)
                 except Exception as e:
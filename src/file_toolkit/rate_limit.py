@@ -0,0 +1,271 @@
+import os
+import time
+import threading
+from typing import Dict, List, Optional
+
+__all__ = [
+    "TokenBucket",
+    "IOThrottle",
+    "set_io_limit",
+    "clear_io_limits",
+    "get_io_throttle"
+]
+
+_global_throttle: Optional["IOThrottle"] = None
+_path_throttles: Dict[str, "IOThrottle"] = {}
+_device_throttles: Dict[int, "IOThrottle"] = {}
+_limits_lock = threading.Lock()
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Tokens refill at rate per second up to capacity. acquire reserves its tokens at once,
+    letting the balance go negative, and sleeps outside the lock until the debt is repaid:
+    concurrent callers are served in arrival order, and a request larger than the capacity
+    is still granted after a proportionally longer wait.
+
+    Args:
+        rate (float): Tokens added per second.
+        capacity (Optional[float], optional): Maximum balance (the burst). Defaults to rate.
+
+    Raises:
+        ValueError: If rate or capacity is not positive.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        capacity = rate if capacity is None else capacity
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float = 1.0) -> float:
+        """Takes tokens without waiting.
+
+        Args:
+            amount (float, optional): Tokens to take. Defaults to 1.
+
+        Returns:
+            float: Seconds the caller must wait before using them.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= amount
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def acquire(self, amount: float = 1.0) -> float:
+        """Takes tokens, sleeping until they are available.
+
+        Args:
+            amount (float, optional): Tokens to take. Defaults to 1.
+
+        Returns:
+            float: Seconds waited.
+        """
+        delay = self.reserve(amount)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+class IOThrottle:
+    """Byte and operation budgets shared by every caller that draws from them.
+
+    Either budget may be omitted. A throttle returned by get_io_throttle for several paths
+    draws from the buckets of each matching limit and waits for the slowest.
+
+    Args:
+        bytes_per_sec (Optional[float], optional): Throughput budget in bytes per second.
+        ops_per_sec (Optional[float], optional): Budget of file operations (opens, archive
+            members, deletions) per second.
+        burst (float, optional): Seconds of budget that can be spent at once after an idle
+            period. Defaults to 1.0.
+
+    Raises:
+        ValueError: If neither budget is given or a budget is not positive.
+    """
+
+    def __init__(self, bytes_per_sec: Optional[float] = None, ops_per_sec: Optional[float] = None, burst: float = 1.0):
+        if bytes_per_sec is None and ops_per_sec is None:
+            raise ValueError("At least one of bytes_per_sec and ops_per_sec is required")
+        self.bytes_per_sec = bytes_per_sec
+        self.ops_per_sec = ops_per_sec
+        self._byte_buckets: List[TokenBucket] = []
+        self._op_buckets: List[TokenBucket] = []
+        if bytes_per_sec is not None:
+            self._byte_buckets.append(TokenBucket(bytes_per_sec, bytes_per_sec * burst))
+        if ops_per_sec is not None:
+            self._op_buckets.append(TokenBucket(ops_per_sec, ops_per_sec * burst))
+
+    def acquire(self, nbytes: int = 0, ops: int = 0) -> float:
+        """Draws bytes and operations from every budget, sleeping as long as the slowest requires.
+
+        Args:
+            nbytes (int, optional): Bytes read or written. Defaults to 0.
+            ops (int, optional): File operations performed. Defaults to 0.
+
+        Returns:
+            float: Seconds waited.
+        """
+        delay = 0.0
+        if nbytes:
+            for bucket in self._byte_buckets:
+                delay = max(delay, bucket.reserve(nbytes))
+        if ops:
+            for bucket in self._op_buckets:
+                delay = max(delay, bucket.reserve(ops))
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def wrap(self, progress_callback=None):
+        """Returns a progress callback that draws each chunk from the byte budget.
+
+        Args:
+            progress_callback (Optional[callable]): Callback to chain, called with the bytes of each chunk.
+
+        Returns:
+            callable: Throttling callback.
+        """
+        def callback(nbytes):
+            self.acquire(nbytes)
+            if progress_callback:
+                progress_callback(nbytes)
+        return callback
+
+def _combine(throttles: List[IOThrottle]) -> IOThrottle:
+    """
+    Build a throttle drawing from the buckets of several throttles.
+
+    Args:
+        throttles: Distinct throttles
+
+    Returns:
+        Combined throttle
+    """
+    combined = IOThrottle.__new__(IOThrottle)
+    combined.bytes_per_sec = min((t.bytes_per_sec for t in throttles if t.bytes_per_sec is not None), default=None)
+    combined.ops_per_sec = min((t.ops_per_sec for t in throttles if t.ops_per_sec is not None), default=None)
+    combined._byte_buckets = [bucket for t in throttles for bucket in t._byte_buckets]
+    combined._op_buckets = [bucket for t in throttles for bucket in t._op_buckets]
+    return combined
+
+def _device_of(path: str) -> int:
+    """
+    Device (st_dev) of a path, or of its nearest existing parent.
+
+    Args:
+        path: Absolute path
+
+    Returns:
+        Device number
+    """
+    while True:
+        try:
+            return os.stat(path).st_dev
+        except FileNotFoundError:
+            parent = os.path.dirname(path)
+            if parent == path:
+                raise
+            path = parent
+
+def set_io_limit(bytes_per_sec: Optional[float] = None, ops_per_sec: Optional[float] = None,
+                 path: Optional[str] = None, per_device: bool = False, burst: float = 1.0) -> Optional[IOThrottle]:
+    """Sets or removes an I/O budget drawn by copy, sync, zip and hash operations.
+
+    Without path the budget is global and shared by every operation. With path it applies
+    to operations on that path and everything below it; with per_device it applies to every
+    path on the same device (st_dev) as path. Calling it again for the same target replaces
+    the budget, and calling it without rates removes it.
+
+    Args:
+        bytes_per_sec (Optional[float], optional): Throughput budget in bytes per second.
+        ops_per_sec (Optional[float], optional): File operations per second.
+        path (Optional[str], optional): Target path. Defaults to None (global).
+        per_device (bool, optional): Apply the budget to the device of path. Defaults to False.
+        burst (float, optional): Seconds of budget that can be spent at once. Defaults to 1.0.
+
+    Returns:
+        Optional[IOThrottle]: The new throttle, or None when the limit was removed.
+
+    Raises:
+        ValueError: If per_device is set without path or a budget is not positive.
+        FileNotFoundError: If per_device is set and no part of path exists.
+    """
+    global _global_throttle
+    if per_device and path is None:
+        raise ValueError("per_device requires a path")
+
+    throttle = None
+    if bytes_per_sec is not None or ops_per_sec is not None:
+        throttle = IOThrottle(bytes_per_sec, ops_per_sec, burst)
+
+    with _limits_lock:
+        if path is None:
+            _global_throttle = throttle
+            return throttle
+        path = os.path.abspath(path)
+        table, key = (_device_throttles, _device_of(path)) if per_device else (_path_throttles, path)
+        if throttle is None:
+            table.pop(key, None)
+        else:
+            table[key] = throttle
+    return throttle
+
+def clear_io_limits() -> None:
+    """Removes the global, path and device budgets."""
+    global _global_throttle
+    with _limits_lock:
+        _global_throttle = None
+        _path_throttles.clear()
+        _device_throttles.clear()
+
+def get_io_throttle(*paths: str) -> Optional[IOThrottle]:
+    """Returns the throttle for an operation on the given paths.
+
+    The global budget, the budget of the deepest configured path above each path and the
+    budget of each path's device all apply; when several match, the returned throttle draws
+    from all of them.
+
+    Args:
+        *paths (str): Paths read or written by the operation.
+
+    Returns:
+        Optional[IOThrottle]: None when no budget applies.
+    """
+    if _global_throttle is None and not _path_throttles and not _device_throttles:
+        return None
+
+    found = [] if _global_throttle is None else [_global_throttle]
+    for path in paths:
+        path = os.path.abspath(path)
+        if _path_throttles:
+            prefix = path
+            while True:
+                throttle = _path_throttles.get(prefix)
+                if throttle is not None:
+                    found.append(throttle)
+                    break
+                parent = os.path.dirname(prefix)
+                if parent == prefix:
+                    break
+                prefix = parent
+        if _device_throttles:
+            try:
+                throttle = _device_throttles.get(_device_of(path))
+            except OSError:
+                throttle = None
+            if throttle is not None:
+                found.append(throttle)
+
+    distinct = list({id(t): t for t in found}.values())
+    if not distinct:
+        return None
+    return distinct[0] if len(distinct) == 1 else _combine(distinct)
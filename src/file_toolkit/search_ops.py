@@ -3,9 +3,11 @@ import time
 import fnmatch
 import re
 from typing import Any, Dict, List
-from logging_metrics import configure_basic_logging
+if __package__:
+    from .log_utils import get_logger, error_handler, log_debug
+else:
+    from log_utils import get_logger, error_handler, log_debug
 import logging
-from contextlib import contextmanager
 from typing import Dict, List, Optional
 from datetime import datetime
 import stat
@@ -17,39 +19,6 @@ __all__ = [
     "get_file_modified_since"
 ]
 
-def get_logger() -> logging.Logger:
-    """Inicializa e retorna um logger com print no console.
-
-    Returns:
-        logging.Logger: Logger basico.
-    """
-    return configure_basic_logging()
-
-@contextmanager
-def error_handler(operation: str, logger: Optional[logging.Logger] = None, reraise: bool = True):
-    """
-    Context manager for handling errors in file operations.
-
-    Args:
-        operation: Description of the operation being performed
-        logger: Logger for recording errors
-        reraise: Whether to raise exceptions again after logging
-    """
-    try:
-        yield
-    except FileNotFoundError as e:
-        logger.error(f"{operation} failed: File not found - {str(e)}")
-        if reraise:
-            raise
-    except PermissionError as e:
-        logger.error(f"{operation} failed: Permission denied - {str(e)}")
-        if reraise:
-            raise
-    except Exception as e:
-        logger.error(f"{operation} failed: {str(e)}")
-        if reraise:
-            raise
-
 def _format_size(size_bytes: int) -> str:
         """
         Convert bytes to human-readable format.
@@ -250,7 +219,7 @@ def search_file_content(directory: str, search_text: str,
                                     'match': match.group(0)
                                 })
             except Exception as e:
-                logger.debug(f"Error searching in {file_path}: {str(e)}")
+                log_debug(logger, "Error searching in %s: %s", file_path, e)
 
         if recursive:
             for root, _, files in os.walk(directory):
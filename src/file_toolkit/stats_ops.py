@@ -1,9 +1,11 @@
 import os
 import shutil
 from typing import Any, Dict, List, Tuple
-from logging_metrics import configure_basic_logging
+if __package__:
+    from .log_utils import get_logger, error_handler, log_debug
+else:
+    from log_utils import get_logger, error_handler, log_debug
 import logging
-from contextlib import contextmanager
 from typing import Dict, List, Optional
 from datetime import datetime
 import stat
@@ -15,39 +17,6 @@ __all__ = [
     "find_empty_directories"
 ]
 
-def get_logger() -> logging.Logger:
-    """Inicializa e retorna um logger com print no console.
-
-    Returns:
-        logging.Logger: Logger basico.
-    """
-    return configure_basic_logging()
-
-@contextmanager
-def error_handler(operation: str, logger: Optional[logging.Logger] = None, reraise: bool = True):
-    """
-    Context manager for handling errors in file operations.
-
-    Args:
-        operation: Description of the operation being performed
-        logger: Logger for recording errors
-        reraise: Whether to raise exceptions again after logging
-    """
-    try:
-        yield
-    except FileNotFoundError as e:
-        logger.error(f"{operation} failed: File not found - {str(e)}")
-        if reraise:
-            raise
-    except PermissionError as e:
-        logger.error(f"{operation} failed: Permission denied - {str(e)}")
-        if reraise:
-            raise
-    except Exception as e:
-        logger.error(f"{operation} failed: {str(e)}")
-        if reraise:
-            raise
-
 def _format_size(size_bytes: int) -> str:
         """
         Convert bytes to human-readable format.
@@ -159,7 +128,7 @@ def get_largest_files(directory: str, count: int = 10, recursive: bool = True, l
                         file_size = os.path.getsize(file_path)
                         files.append((file_path, file_size))
                     except Exception as e:
-                        logger.debug(f"Error getting size of {file_path}: {str(e)}")
+                        log_debug(logger, "Error getting size of %s: %s", file_path, e)
         else:
             with os.scandir(directory) as entries:
                 for entry in entries:
@@ -167,7 +136,7 @@ def get_largest_files(directory: str, count: int = 10, recursive: bool = True, l
                         try:
                             files.append((entry.path, entry.stat().st_size))
                         except Exception as e:
-                            logger.debug(f"Error getting size of {entry.path}: {str(e)}")
+                            log_debug(logger, "Error getting size of %s: %s", entry.path, e)
 
         files.sort(key=lambda x: x[1], reverse=True)
         largest = files[:count]
@@ -203,7 +172,7 @@ def get_directory_size(directory: str, log: Optional[logging.Logger] = None) ->
                 try:
                     total_size += os.path.getsize(file_path)
                 except Exception as e:
-                    logger.debug(f"Error getting size of {file_path}: {str(e)}")
+                    log_debug(logger, "Error getting size of %s: %s", file_path, e)
 
         logger.info(f"Directory {directory} size: {_format_size(total_size)}")
         return total_size
@@ -2,53 +2,29 @@ import os
 from typing import Dict, List, Optional
 from filecmp import dircmp
 import fnmatch
-from progress import ProgressPercentage
-from file_ops import copy_file, copy_directory, delete_path
-from logging_metrics import configure_basic_logging
+if __package__:
+    from .progress import ProgressPercentage
+    from .file_ops import copy_file, copy_directory, delete_path
+    from .log_utils import get_logger, error_handler
+    from .rate_limit import get_io_throttle
+else:
+    from progress import ProgressPercentage
+    from file_ops import copy_file, copy_directory, delete_path
+    from log_utils import get_logger, error_handler
+    from rate_limit import get_io_throttle
 import logging
-from contextlib import contextmanager
 
 __all__ = [
     "sync_directories"
 ]
 
-def get_logger() -> logging.Logger:
-    """Inicializa e retorna um logger com print no console.
-
-    Returns:
-        logging.Logger: Logger basico.
-    """
-    return configure_basic_logging()
-
-@contextmanager
-def error_handler(operation: str, logger: Optional[logging.Logger] = None, reraise: bool = True):
-    """
-    Context manager for handling errors in file operations.
-
-    Args:
-        operation: Description of the operation being performed
-        logger: Logger for recording errors
-        reraise: Whether to raise exceptions again after logging
-    """
-    try:
-        yield
-    except FileNotFoundError as e:
-        logger.error(f"{operation} failed: File not found - {str(e)}")
-        if reraise:
-            raise
-    except PermissionError as e:
-        logger.error(f"{operation} failed: Permission denied - {str(e)}")
-        if reraise:
-            raise
-    except Exception as e:
-        logger.error(f"{operation} failed: {str(e)}")
-        if reraise:
-            raise
-
 def sync_directories(source_dir: str, target_dir: str, delete: bool = False,
                      ignore_patterns: Optional[List[str]] = None, log: Optional[logging.Logger] = None) -> Dict[str, int]:
     """Synchronizes the contents of a source directory to another destination.
 
+    Copies draw from the I/O budgets set with rate_limit.set_io_limit for the source and
+    target (see copy_file and copy_directory); each deletion draws one operation.
+
     Args:
         source_dir (str): Source directory.
         target_dir (str): Destination directory.
@@ -123,6 +99,9 @@ def sync_directories(source_dir: str, target_dir: str, delete: bool = False,
                         stats['skipped'] += 1
                         continue
 
+                    throttle = get_io_throttle(dst_path)
+                    if throttle:
+                        throttle.acquire(ops=1)
                     delete_path(dst_path)
                     stats['deleted'] += 1
 
@@ -1,9 +1,11 @@
 import os
 import tempfile
 from typing import Optional, Union
-from logging_metrics import configure_basic_logging
+if __package__:
+    from .log_utils import get_logger, error_handler
+else:
+    from log_utils import get_logger, error_handler
 import logging
-from contextlib import contextmanager
 from typing import Dict, List, Optional
 
 __all__ = [
@@ -11,39 +13,6 @@ __all__ = [
     "create_temp_directory"
 ]
 
-def get_logger() -> logging.Logger:
-    """Inicializa e retorna um logger com print no console.
-
-    Returns:
-        logging.Logger: Logger basico.
-    """
-    return configure_basic_logging()
-
-@contextmanager
-def error_handler(operation: str, logger: Optional[logging.Logger] = None, reraise: bool = True):
-    """
-    Context manager for handling errors in file operations.
-
-    Args:
-        operation: Description of the operation being performed
-        logger: Logger for recording errors
-        reraise: Whether to raise exceptions again after logging
-    """
-    try:
-        yield
-    except FileNotFoundError as e:
-        logger.error(f"{operation} failed: File not found - {str(e)}")
-        if reraise:
-            raise
-    except PermissionError as e:
-        logger.error(f"{operation} failed: Permission denied - {str(e)}")
-        if reraise:
-            raise
-    except Exception as e:
-        logger.error(f"{operation} failed: {str(e)}")
-        if reraise:
-            raise
-
 def create_temp_file(prefix: str = "tmp_", suffix: str = "",
                      content: Optional[Union[str, bytes]] = None,
                      directory: Optional[str] = None, log: Optional[logging.Logger] = None) -> str:
@@ -1,10 +1,15 @@
 import os
 import zipfile
 from typing import List
-from progress import ProgressPercentage
-from logging_metrics import configure_basic_logging
+if __package__:
+    from .progress import ProgressPercentage
+    from .log_utils import get_logger, error_handler
+    from .rate_limit import get_io_throttle
+else:
+    from progress import ProgressPercentage
+    from log_utils import get_logger, error_handler
+    from rate_limit import get_io_throttle
 import logging
-from contextlib import contextmanager
 from typing import Dict, List, Optional
 
 
@@ -13,43 +18,96 @@ __all__ = [
     "zip_file"
 ]
 
-def get_logger() -> logging.Logger:
-    """Inicializa e retorna um logger com print no console.
+_THROTTLE_CHUNK_SIZE = 64 * 1024
 
-    Returns:
-        logging.Logger: Logger basico.
+def _copy_throttled(src, dst, throttle) -> None:
+    """
+    Copy between file objects, drawing each chunk from an I/O budget.
+
+    Args:
+        src: File object to read
+        dst: File object to write
+        throttle: rate_limit.IOThrottle
+    """
+    while True:
+        chunk = src.read(_THROTTLE_CHUNK_SIZE)
+        if not chunk:
+            break
+        throttle.acquire(len(chunk))
+        dst.write(chunk)
+
+def _member_target(member: zipfile.ZipInfo, destination_path: str) -> str:
     """
-    return configure_basic_logging()
+    Path a member extracts to, sanitized the way ZipFile.extract does it.
+
+    Drive letters, absolute roots and '.'/'..' components are dropped from the
+    member name, so the result always lies inside destination_path.
+
+    Args:
+        member: Archive member
+        destination_path: Extraction directory
+
+    Returns:
+        str: Target path
 
-@contextmanager
-def error_handler(operation: str, logger: Optional[logging.Logger] = None, reraise: bool = True):
+    Raises:
+        ValueError: If the member name is empty or still resolves outside destination_path
+    """
+    arcname = member.filename.replace('/', os.path.sep)
+    if os.path.altsep:
+        arcname = arcname.replace(os.path.altsep, os.path.sep)
+    arcname = os.path.splitdrive(arcname)[1]
+    invalid_parts = ('', os.path.curdir, os.path.pardir)
+    arcname = os.path.sep.join(part for part in arcname.split(os.path.sep) if part not in invalid_parts)
+    if not arcname and not member.is_dir():
+        raise ValueError(f"Unsafe zip file: empty member name {member.filename!r}")
+    target = os.path.normpath(os.path.join(destination_path, arcname))
+    root = os.path.realpath(destination_path)
+    if os.path.commonpath([root, os.path.realpath(target)]) != root:
+        raise ValueError(f"Unsafe zip file: Contains path traversal attack in {member.filename}")
+    return target
+
+def _extract_throttled(zip_ref: zipfile.ZipFile, member: zipfile.ZipInfo, destination_path: str, throttle) -> None:
     """
-    Context manager for handling errors in file operations.
+    ZipFile.extract counterpart that draws each chunk written from an I/O budget.
 
     Args:
-        operation: Description of the operation being performed
-        logger: Logger for recording errors
-        reraise: Whether to raise exceptions again after logging
+        zip_ref: Open archive
+        member: Member to extract
+        destination_path: Extraction directory
+        throttle: rate_limit.IOThrottle
     """
-    try:
-        yield
-    except FileNotFoundError as e:
-        logger.error(f"{operation} failed: File not found - {str(e)}")
-        if reraise:
-            raise
-    except PermissionError as e:
-        logger.error(f"{operation} failed: Permission denied - {str(e)}")
-        if reraise:
-            raise
-    except Exception as e:
-        logger.error(f"{operation} failed: {str(e)}")
-        if reraise:
-            raise
+    target = _member_target(member, destination_path)
+    if member.is_dir():
+        os.makedirs(target, exist_ok=True)
+        return
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    with zip_ref.open(member) as src, open(target, 'wb') as dst:
+        _copy_throttled(src, dst, throttle)
+
+def _write_throttled(zipf: zipfile.ZipFile, file_path: str, arcname: str, throttle) -> None:
+    """
+    ZipFile.write counterpart that draws each chunk read from an I/O budget.
 
+    Args:
+        zipf: Archive open for writing
+        file_path: File to add
+        arcname: Name in the archive
+        throttle: rate_limit.IOThrottle
+    """
+    info = zipfile.ZipInfo.from_file(file_path, arcname)
+    # Same compression settings ZipFile.write applies
+    info.compress_type = zipf.compression
+    info._compresslevel = zipf.compresslevel
+    with open(file_path, 'rb') as src, zipf.open(info, 'w') as dst:
+        _copy_throttled(src, dst, throttle)
 
 def unzip_file(zip_file_path: str, destination_path: str, log: Optional[logging.Logger] = None) -> List[str]:
     """Extracts the contents of a ZIP file to the specified directory.
 
+    Each member draws one operation, and each chunk extracted its size, from the I/O
+    budgets set with rate_limit.set_io_limit for the archive and destination, if any.
+
     Args:
         zip_file_path(str): Path to the ZIP file.
         destination_path(str): Directory to extract the files.
@@ -81,9 +139,14 @@ def unzip_file(zip_file_path: str, destination_path: str, log: Optional[logging.
             total_files = len(zip_ref.namelist())
             processed = 0
             progress = ProgressPercentage(zip_file_path, total_files, logger)
+            throttle = get_io_throttle(zip_file_path, destination_path)
 
             for member in zip_ref.infolist():
-                zip_ref.extract(member, destination_path)
+                if throttle:
+                    throttle.acquire(ops=1)
+                    _extract_throttled(zip_ref, member, destination_path, throttle)
+                else:
+                    zip_ref.extract(member, destination_path)
                 processed += 1
                 progress(1)
 
@@ -94,6 +157,9 @@ def unzip_file(zip_file_path: str, destination_path: str, log: Optional[logging.
 def zip_file(source_path: str, zip_file_path: str, compression_level: int = 9, log: Optional[logging.Logger] = None) -> str:
     """Compresses a file or directory in ZIP format.
 
+    Each file draws one operation, and each chunk read its size, from the I/O budgets
+    set with rate_limit.set_io_limit for the source and archive, if any.
+
     Args:
         source_path (str): Path of the file or directory to be compressed.
         zip_file_path (str): Path of the ZIP file to be created.
@@ -115,6 +181,8 @@ def zip_file(source_path: str, zip_file_path: str, compression_level: int = 9, l
         if zip_dir:
             os.makedirs(zip_dir, exist_ok=True)
 
+        throttle = get_io_throttle(source_path, zip_file_path)
+
         with zipfile.ZipFile(zip_file_path, 'w', compression=zipfile.ZIP_DEFLATED,
                              compresslevel=compression_level) as zipf:
             if os.path.isdir(source_path):
@@ -128,11 +196,19 @@ def zip_file(source_path: str, zip_file_path: str, compression_level: int = 9, l
                     for file in files:
                         file_path = os.path.join(root, file)
                         arcname = os.path.relpath(file_path, base_path)
-                        zipf.write(file_path, arcname)
+                        if throttle:
+                            throttle.acquire(ops=1)
+                            _write_throttled(zipf, file_path, arcname, throttle)
+                        else:
+                            zipf.write(file_path, arcname)
                         processed += 1
                         progress(1)
             else:
-                zipf.write(source_path, os.path.basename(source_path))
+                if throttle:
+                    throttle.acquire(ops=1)
+                    _write_throttled(zipf, source_path, os.path.basename(source_path), throttle)
+                else:
+                    zipf.write(source_path, os.path.basename(source_path))
 
         size_bytes = os.path.getsize(zip_file_path)
         size_mb = size_bytes / (1024 * 1024)
@@ -0,0 +1,122 @@
+import os
+import json
+import asyncio
+import hashlib
+import shutil
+import threading
+import pytest
+import aio
+
+def test_copy_file_async(temp_dir, big_file):
+    seen = []
+
+    async def main():
+        loop_thread = threading.get_ident()
+        def on_progress(n):
+            # Callback do usuário roda na thread do event loop
+            assert threading.get_ident() == loop_thread
+            seen.append(n)
+        return await aio.copy_file(big_file, os.path.join(temp_dir, "out"), progress_callback=on_progress)
+
+    copied = asyncio.run(main())
+    with open(copied, "rb") as f1, open(big_file, "rb") as f2:
+        assert f1.read() == f2.read()
+    assert sum(seen) == os.path.getsize(big_file)
+
+def test_operacoes_basicas_async(temp_dir, temp_file):
+    async def main():
+        text = await aio.read_text_file(temp_file)
+        json_path = await aio.write_json_file(os.path.join(temp_dir, "d.json"), {"a": 1})
+        digest = await aio.get_file_hash(temp_file, "md5")
+        listing = await aio.list_dir_contents(temp_dir)
+        origem = os.path.join(temp_dir, "origem")
+        os.makedirs(origem)
+        shutil.copy(temp_file, origem)
+        shutil.copy(json_path, origem)
+        stats = await aio.sync_directories(origem, os.path.join(temp_dir, "sync"))
+        moved = await aio.move_file(temp_file, os.path.join(temp_dir, "moved"))
+        return text, json_path, digest, listing, stats, moved
+
+    text, json_path, digest, listing, stats, moved = asyncio.run(main())
+    assert text == "abc123"
+    with open(json_path) as f:
+        assert json.load(f) == {"a": 1}
+    assert digest == hashlib.md5(b"abc123").hexdigest()
+    assert {item["name"] for item in listing} == {"test.txt", "d.json"}
+    assert stats["copied"] == 2
+    assert os.path.isfile(moved) and not os.path.exists(temp_file)
+    assert sorted(os.listdir(os.path.join(temp_dir, "sync"))) == ["d.json", "test.txt"]
+
+def test_concurrency_limit(temp_dir, temp_file):
+    async def main():
+        limit = asyncio.Semaphore(2)
+        active = []
+        peak = []
+        orig = aio.file_ops.read_text_file
+
+        def slow_read(*args, **kwargs):
+            active.append(1)
+            peak.append(len(active))
+            import time
+            time.sleep(0.05)
+            active.pop()
+            return orig(*args, **kwargs)
+
+        aio.file_ops.read_text_file = slow_read
+        try:
+            await asyncio.gather(*(aio.read_text_file(temp_file, concurrency=limit) for _ in range(6)))
+        finally:
+            aio.file_ops.read_text_file = orig
+        return max(peak)
+
+    assert asyncio.run(main()) <= 2
+
+def test_cancelamento_remove_parcial(temp_dir, big_file):
+    dest = os.path.join(temp_dir, "out")
+
+    async def main():
+        started = asyncio.Event()
+
+        def on_progress(n):
+            started.set()
+
+        task = asyncio.ensure_future(aio.copy_file(big_file, dest, progress_callback=on_progress,
+                                                   engine="buffered", buffer_size=4096))
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    assert not os.path.exists(os.path.join(dest, "big.bin"))
+
+def test_cancelamento_sem_interrupcao_mantem_vaga(temp_file):
+    liberar = threading.Event()
+    orig = aio.file_ops.read_text_file
+
+    def leitura_presa(*args, **kwargs):
+        liberar.wait(5)
+        return orig(*args, **kwargs)
+
+    async def main():
+        limit = asyncio.Semaphore(1)
+        task = asyncio.ensure_future(aio.read_text_file(temp_file, concurrency=limit))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # A thread continua lendo: a vaga só volta quando ela termina
+        assert limit.locked()
+        liberar.set()
+        return await asyncio.wait_for(aio.read_text_file(temp_file, concurrency=limit), 5)
+
+    aio.file_ops.read_text_file = leitura_presa
+    try:
+        assert asyncio.run(main()) == "abc123"
+    finally:
+        liberar.set()
+        aio.file_ops.read_text_file = orig
+
+def test_configure_executor_invalido():
+    with pytest.raises(ValueError):
+        aio.configure_executor(0)
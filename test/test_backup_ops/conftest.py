@@ -0,0 +1,31 @@
+"""
+Configurações compartilhadas para todos os testes do backup_ops.
+"""
+
+import sys
+import os
+import pytest
+import tempfile
+import shutil
+
+# Testa os módulos de src/file_toolkit, não cópias locais
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "src", "file_toolkit"))
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+@pytest.fixture
+def temp_dir():
+    d = tempfile.mkdtemp()
+    yield d
+    shutil.rmtree(d, onerror=lambda func, path, exc: (os.chmod(path, 0o755), func(path)))
+
+@pytest.fixture
+def config_file(temp_dir):
+    file_path = os.path.join(temp_dir, "config.json")
+    with open(file_path, "w") as f:
+        f.write('{"versao": 1}')
+    return file_path
+
+@pytest.fixture
+def repo_dir(temp_dir):
+    return os.path.join(temp_dir, "repo")
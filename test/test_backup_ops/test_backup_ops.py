@@ -0,0 +1,157 @@
+import os
+import time
+import pytest
+from datetime import timedelta
+
+from backup_ops import BackupRepository
+from file_ops import backup_file
+
+def _alterar(file_path, conteudo):
+    with open(file_path, "w") as f:
+        f.write(conteudo)
+    # Garante mtime diferente mesmo em sistemas de arquivos com resolução baixa
+    st = os.stat(file_path)
+    os.utime(file_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+def _objetos(repo_dir):
+    return [os.path.join(r, n) for r, _, ns in os.walk(os.path.join(repo_dir, "objects")) for n in ns]
+
+def test_backup_sem_mudanca_nao_duplica(config_file, repo_dir):
+    repo = BackupRepository(repo_dir)
+    primeiro = repo.backup(config_file)
+    for _ in range(5):
+        assert repo.backup(config_file) == primeiro
+    assert len(repo.versions(config_file)) == 1
+    assert len(_objetos(repo_dir)) == 1
+    with open(primeiro) as f:
+        assert f.read() == '{"versao": 1}'
+
+def test_mesmo_conteudo_com_mtime_novo(config_file, repo_dir):
+    repo = BackupRepository(repo_dir)
+    primeiro = repo.backup(config_file)
+    _alterar(config_file, '{"versao": 1}')
+    assert repo.backup(config_file) == primeiro
+    assert repo.versions(config_file)[-1]["mtime_ns"] == os.stat(config_file).st_mtime_ns
+
+def test_conteudo_identico_entre_caminhos_usa_hardlink(temp_dir, repo_dir):
+    repo = BackupRepository(repo_dir)
+    a, b = os.path.join(temp_dir, "a.txt"), os.path.join(temp_dir, "b.txt")
+    for p in (a, b):
+        with open(p, "w") as f:
+            f.write("igual")
+    va, vb = repo.backup(a), repo.backup(b)
+    assert va != vb
+    assert os.stat(va).st_ino == os.stat(vb).st_ino
+    assert len(_objetos(repo_dir)) == 1
+
+def test_keep_last_remove_versoes_e_objetos(config_file, repo_dir):
+    repo = BackupRepository(repo_dir, keep_last=2)
+    for i in range(5):
+        _alterar(config_file, f'{{"versao": {i}}}')
+        repo.backup(config_file)
+    versoes = repo.versions(config_file)
+    assert len(versoes) == 2
+    assert all(os.path.exists(v["backup_path"]) for v in versoes)
+    assert len(_objetos(repo_dir)) == 2
+    with open(versoes[-1]["backup_path"]) as f:
+        assert f.read() == '{"versao": 4}'
+
+def test_objeto_compartilhado_sobrevive_a_retencao(temp_dir, repo_dir):
+    repo = BackupRepository(repo_dir, keep_last=1)
+    a, b = os.path.join(temp_dir, "a.txt"), os.path.join(temp_dir, "b.txt")
+    for p in (a, b):
+        with open(p, "w") as f:
+            f.write("compartilhado")
+    repo.backup(a)
+    vb = repo.backup(b)
+    _alterar(a, "novo")
+    repo.backup(a)
+    # O objeto antigo de a ainda é referenciado pela versão de b
+    with open(vb) as f:
+        assert f.read() == "compartilhado"
+    assert len(_objetos(repo_dir)) == 2
+
+def test_keep_within_e_prune(config_file, repo_dir):
+    repo = BackupRepository(repo_dir)
+    for i in range(3):
+        _alterar(config_file, f"v{i}")
+        repo.backup(config_file)
+    assert len(repo.versions(config_file)) == 3
+
+    time.sleep(0.2)
+    repo.keep_within = timedelta(seconds=0.1).total_seconds()
+    assert repo.prune() == 2
+    assert len(repo.versions(config_file)) == 1
+
+def test_restore(config_file, repo_dir, temp_dir):
+    repo = BackupRepository(repo_dir)
+    repo.backup(config_file)
+    primeira = repo.versions(config_file)[0]["version"]
+    _alterar(config_file, "estragado")
+    repo.backup(config_file)
+
+    destino = repo.restore(config_file, os.path.join(temp_dir, "restaurado.json"), version=primeira)
+    with open(destino) as f:
+        assert f.read() == '{"versao": 1}'
+    repo.restore(config_file)
+    with open(config_file) as f:
+        assert f.read() == "estragado"
+    with pytest.raises(ValueError):
+        repo.restore(os.path.join(temp_dir, "nunca.txt"))
+
+def test_restore_preserva_permissoes(temp_dir, repo_dir):
+    segredo = os.path.join(temp_dir, "segredo.txt")
+    script = os.path.join(temp_dir, "script.sh")
+    for caminho, modo in ((segredo, 0o600), (script, 0o750)):
+        with open(caminho, "w") as f:
+            f.write(caminho)
+        os.chmod(caminho, modo)
+    repo = BackupRepository(repo_dir)
+    repo.backup(segredo)
+    repo.backup(script)
+    assert repo.versions(segredo)[0]["mode"] == 0o600
+
+    assert os.stat(repo.restore(segredo, os.path.join(temp_dir, "r1"))).st_mode & 0o7777 == 0o600
+    assert os.stat(repo.restore(script, os.path.join(temp_dir, "r2"))).st_mode & 0o7777 == 0o750
+
+def test_restore_indice_sem_modo_usa_umask(config_file, repo_dir, temp_dir):
+    repo = BackupRepository(repo_dir)
+    repo.backup(config_file)
+    # Índices gravados antes do registro do modo
+    chave = os.path.basename(os.path.dirname(repo.versions(config_file)[0]["backup_path"]))
+    index_path = repo._index_path(chave)
+    with open(index_path) as f:
+        linhas = f.read().replace(',"mode":', ',"_modo":')
+    with open(index_path, "w") as f:
+        f.write(linhas)
+    antiga = os.umask(0o077)
+    try:
+        destino = repo.restore(config_file, os.path.join(temp_dir, "restaurado.json"))
+    finally:
+        os.umask(antiga)
+    assert os.stat(destino).st_mode & 0o7777 == 0o600
+
+def test_backup_file_com_repositorio(config_file, repo_dir):
+    caminho = backup_file(config_file, repository=repo_dir)
+    assert caminho.startswith(repo_dir)
+    assert backup_file(config_file, repository=BackupRepository(repo_dir)) == caminho
+
+def test_backup_file_repositorio_de_outra_importacao(config_file, repo_dir):
+    # file_toolkit.BackupRepository e backup_ops.BackupRepository podem ser classes distintas
+    import importlib.util
+    import pathlib
+    import backup_ops
+    spec = importlib.util.spec_from_file_location("outra_copia_backup_ops", backup_ops.__file__)
+    outra_copia = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(outra_copia)
+    caminho = backup_file(config_file, repository=outra_copia.BackupRepository(repo_dir))
+    assert caminho.startswith(repo_dir)
+    assert backup_file(config_file, repository=pathlib.Path(repo_dir)) == caminho
+
+def test_parametros_invalidos(repo_dir, temp_dir):
+    with pytest.raises(ValueError):
+        BackupRepository(repo_dir, keep_last=0)
+    with pytest.raises(ValueError):
+        BackupRepository(repo_dir, algorithm="nao_existe")
+    with pytest.raises(ValueError):
+        BackupRepository(repo_dir).backup(os.path.join(temp_dir, "nao_existe.txt"))
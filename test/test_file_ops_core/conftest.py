@@ -0,0 +1,41 @@
+"""
+Configurações compartilhadas para os testes do file_ops atual (src/file_toolkit).
+"""
+
+import os
+import sys
+import pytest
+import tempfile
+import shutil
+
+# Testa os módulos de src/file_toolkit, não cópias locais
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "src", "file_toolkit"))
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+@pytest.fixture
+def temp_dir():
+    d = tempfile.mkdtemp()
+    yield d
+    shutil.rmtree(d)
+
+@pytest.fixture
+def temp_file(temp_dir):
+    file_path = os.path.join(temp_dir, "test.txt")
+    with open(file_path, "w") as f:
+        f.write("abc123")
+    return file_path
+
+class MockLogger:
+    """Logger simulado para testes que não precisam de logging real."""
+    def __init__(self):
+        self.debug_calls, self.info_calls, self.warning_calls, self.error_calls = [], [], [], []
+    def debug(self, msg): self.debug_calls.append(msg)
+    def info(self, msg): self.info_calls.append(msg)
+    def warning(self, msg): self.warning_calls.append(msg)
+    def error(self, msg): self.error_calls.append(msg)
+
+@pytest.fixture
+def mock_logger():
+    """Fixture que fornece um mock logger."""
+    return MockLogger()
@@ -0,0 +1,1035 @@
+import os
+import errno
+import shutil
+import tempfile
+import json
+import threading
+import pytest
+import file_ops
+
+from file_ops import (
+    get_bytes_by_file_path, backup_file, write_text_file, read_text_file, write_binary_file,
+    write_json_file, read_json_file, copy_directory,
+)
+from file_ops import copy_file, copy_files, copy_directory_parallel, move_file, move_directory, GroupCommit, map_file_bytes
+from file_ops import iter_text_lines, iter_text_chunks
+from file_ops import write_jsonl_file, read_jsonl_file, JsonArrayWriter, iter_json_array
+from file_ops import delete_path, purge_tree, detach_tree
+from file_ops import reorder_csv_columns, reorder_csv_files
+
+# Copy engines
+
+@pytest.mark.parametrize("engine", ["auto", "copy_file_range", "sendfile", "buffered"])
+def test_copy_file_engines(temp_dir, engine):
+    src = os.path.join(temp_dir, "big.bin")
+    data = os.urandom(3 * 1024 * 1024 + 123)
+    with open(src, "wb") as f:
+        f.write(data)
+    dest_dir = os.path.join(temp_dir, "out")
+    seen = []
+    copied = copy_file(src, dest_dir, progress_callback=seen.append, engine=engine)
+    with open(copied, "rb") as f:
+        assert f.read() == data
+    assert sum(seen) == len(data)
+
+def test_copy_file_engine_fallback(temp_dir, temp_file, monkeypatch):
+    import errno
+
+    def fail(*args, **kwargs):
+        raise OSError(errno.EXDEV, "cross-device")
+
+    monkeypatch.setattr(os, "copy_file_range", fail, raising=False)
+    monkeypatch.setattr(os, "sendfile", fail, raising=False)
+    copied = copy_file(temp_file, os.path.join(temp_dir, "out"))
+    with open(copied) as f:
+        assert f.read() == "abc123"
+
+def test_copy_file_engine_invalido(temp_dir, temp_file):
+    with pytest.raises(ValueError):
+        copy_file(temp_file, os.path.join(temp_dir, "out"), engine="nope")
+
+@pytest.mark.skipif(not os.path.exists("/proc/version"), reason="requer procfs")
+@pytest.mark.parametrize("engine", ["auto", "copy_file_range", "sendfile"])
+def test_copy_file_pseudo_arquivo_tamanho_zero(temp_dir, engine, monkeypatch):
+    # Arquivos do procfs têm st_size 0, mas não estão vazios; alguns kernels copiam 0 bytes deles
+    assert os.stat("/proc/version").st_size == 0
+    monkeypatch.setattr(os, "copy_file_range", lambda *args: 0, raising=False)
+    monkeypatch.setattr(os, "sendfile", lambda *args: 0, raising=False)
+    copied = copy_file("/proc/version", os.path.join(temp_dir, "out"), engine=engine)
+    with open("/proc/version", "rb") as f:
+        esperado = f.read()
+    with open(copied, "rb") as f:
+        assert f.read() == esperado != b""
+
+def test_copy_file_vazio(temp_dir):
+    src = os.path.join(temp_dir, "vazio.bin")
+    open(src, "wb").close()
+    copied = copy_file(src, os.path.join(temp_dir, "out"))
+    assert os.path.getsize(copied) == 0
+
+# Clone (reflink) mode
+
+def test_copy_file_clone_fallback(temp_dir, temp_file):
+    copied = copy_file(temp_file, os.path.join(temp_dir, "out"), clone=True)
+    with open(copied) as f:
+        assert f.read() == "abc123"
+
+def test_copy_file_clone_tenta_reflink(temp_dir, temp_file, monkeypatch):
+    import errno
+    import fcntl
+    calls = []
+
+    def fake_ioctl(fd, request, arg):
+        calls.append(request)
+        raise OSError(errno.EOPNOTSUPP, "not supported")
+
+    monkeypatch.setattr(fcntl, "ioctl", fake_ioctl)
+    copied = copy_file(temp_file, os.path.join(temp_dir, "out"), clone=True)
+    assert calls == [0x40049409]
+    with open(copied) as f:
+        assert f.read() == "abc123"
+
+def test_backup_file_clone(temp_file, temp_dir):
+    backup_path = backup_file(temp_file, os.path.join(temp_dir, "bkp"), timestamp=False, clone=True)
+    assert os.path.getmtime(backup_path) == os.path.getmtime(temp_file)
+    with open(backup_path) as f:
+        assert f.read() == "abc123"
+
+def test_copy_directory_clone(temp_dir):
+    src_dir = os.path.join(temp_dir, "src")
+    os.makedirs(os.path.join(src_dir, "sub"))
+    with open(os.path.join(src_dir, "sub", "a.txt"), "w") as f:
+        f.write("dataa")
+    dst_dir = os.path.join(temp_dir, "dst")
+    copy_directory(src_dir, dst_dir, clone=True)
+    with open(os.path.join(dst_dir, "sub", "a.txt")) as f:
+        assert f.read() == "dataa"
+
+# Parallel copy_directory
+
+def _make_tree(base):
+    os.makedirs(os.path.join(base, "a", "b"))
+    os.makedirs(os.path.join(base, "vazio"))
+    os.makedirs(os.path.join(base, "skip"))
+    files = {
+        "top.txt": b"top",
+        os.path.join("a", "one.bin"): os.urandom(5000),
+        os.path.join("a", "b", "two.bin"): os.urandom(70000),
+        os.path.join("a", "ignore.log"): b"log",
+        os.path.join("skip", "x.txt"): b"x",
+    }
+    for rel, data in files.items():
+        with open(os.path.join(base, rel), "wb") as f:
+            f.write(data)
+    return files
+
+def test_copy_directory_parallel_results(temp_dir):
+    src_dir = os.path.join(temp_dir, "src")
+    files = _make_tree(src_dir)
+    dst_dir = os.path.join(temp_dir, "dst")
+    results = copy_directory_parallel(src_dir, dst_dir, workers=3, max_inflight_bytes=10000,
+                                      ignore_patterns=["*.log", "skip"])
+    assert sorted(os.path.relpath(r["source"], src_dir) for r in results) == sorted(
+        rel for rel in files if not rel.endswith(".log") and not rel.startswith("skip"))
+    assert all(r["status"] == "copied" and r["error"] is None for r in results)
+    for r in results:
+        with open(r["source"], "rb") as f1, open(r["destination"], "rb") as f2:
+            assert f1.read() == f2.read()
+    assert os.path.isdir(os.path.join(dst_dir, "vazio"))
+    assert not os.path.exists(os.path.join(dst_dir, "skip"))
+
+def test_copy_directory_workers(temp_dir):
+    src_dir = os.path.join(temp_dir, "src")
+    _make_tree(src_dir)
+    dst_dir = os.path.join(temp_dir, "dst")
+    assert copy_directory(src_dir, dst_dir, workers=2) == dst_dir
+    assert os.path.isfile(os.path.join(dst_dir, "a", "b", "two.bin"))
+
+def test_copy_directory_parallel_workers_invalido(temp_dir):
+    with pytest.raises(ValueError):
+        copy_directory_parallel(temp_dir, os.path.join(temp_dir, "dst"), workers=0)
+
+# Same-device rename fast path
+
+def test_move_file_rename_mesmo_device(temp_dir, temp_file):
+    inode = os.stat(temp_file).st_ino
+    seen = []
+    moved = move_file(temp_file, os.path.join(temp_dir, "dest"), progress_callback=seen.append)
+    assert os.stat(moved).st_ino == inode
+    assert not os.path.exists(temp_file)
+    assert seen == [6]
+
+def test_move_file_cross_device_exdev(temp_dir, temp_file, monkeypatch):
+    import errno
+
+    def exdev(src, dst):
+        raise OSError(errno.EXDEV, "cross-device")
+
+    monkeypatch.setattr(os, "replace", exdev)
+    moved = move_file(temp_file, os.path.join(temp_dir, "dest"))
+    with open(moved) as f:
+        assert f.read() == "abc123"
+    assert not os.path.exists(temp_file)
+
+def test_move_file_inexistente(temp_dir):
+    with pytest.raises(ValueError):
+        move_file(os.path.join(temp_dir, "nope.txt"), os.path.join(temp_dir, "dest"))
+
+def test_move_directory_substitui_itens(temp_dir):
+    src_dir = os.path.join(temp_dir, "src")
+    os.makedirs(os.path.join(src_dir, "sub"))
+    with open(os.path.join(src_dir, "a.txt"), "w") as f:
+        f.write("new")
+    with open(os.path.join(src_dir, "sub", "b.txt"), "w") as f:
+        f.write("b")
+    dest_dir = os.path.join(temp_dir, "dst")
+    os.makedirs(os.path.join(dest_dir, "sub"))
+    with open(os.path.join(dest_dir, "a.txt"), "w") as f:
+        f.write("old")
+    with open(os.path.join(dest_dir, "sub", "stale.txt"), "w") as f:
+        f.write("stale")
+    inode = os.stat(os.path.join(src_dir, "a.txt")).st_ino
+    move_directory(src_dir, dest_dir)
+    assert os.stat(os.path.join(dest_dir, "a.txt")).st_ino == inode
+    assert os.listdir(os.path.join(dest_dir, "sub")) == ["b.txt"]
+    assert not os.listdir(src_dir)
+
+# Batch copy
+
+def test_copy_files_batch(temp_dir):
+    pairs = []
+    for i in range(20):
+        path = os.path.join(temp_dir, f"f{i}.txt")
+        with open(path, "w") as f:
+            f.write(str(i) * (i + 1))
+        pairs.append((path, os.path.join(temp_dir, "out", str(i % 3))))
+    seen = []
+    results = copy_files(pairs, workers=4, progress_callback=seen.append)
+    assert [r["source"] for r in results] == [p[0] for p in pairs]
+    assert all(r["status"] == "copied" for r in results)
+    for i, r in enumerate(results):
+        with open(r["destination"]) as f:
+            assert f.read() == str(i) * (i + 1)
+    assert sum(seen) == sum(r["size"] for r in results)
+
+def test_copy_files_erro_por_item(temp_dir, temp_file):
+    missing = os.path.join(temp_dir, "nope.txt")
+    results = copy_files([(missing, temp_dir + "/out"), (temp_file, temp_dir + "/out")], workers=2)
+    assert results[0]["status"] == "failed" and "does not exist" in results[0]["error"]
+    assert results[1]["status"] == "copied"
+    assert os.path.isfile(os.path.join(temp_dir, "out", "test.txt"))
+
+# Parallel ranged copy
+
+@pytest.mark.parametrize("engine", ["auto", "buffered"])
+def test_copy_file_range_workers(temp_dir, engine):
+    src = os.path.join(temp_dir, "big.bin")
+    data = os.urandom(1024 * 1024 + 777)
+    with open(src, "wb") as f:
+        f.write(data)
+    seen = []
+    copied = copy_file(src, os.path.join(temp_dir, "out"), progress_callback=seen.append,
+                       engine=engine, range_workers=4, range_size=100_000)
+    with open(copied, "rb") as f:
+        assert f.read() == data
+    assert sum(seen) == len(data)
+
+@pytest.mark.parametrize("range_size", [0, -1])
+def test_copy_file_range_size_invalido(temp_dir, temp_file, range_size):
+    with pytest.raises(ValueError, match="range_size"):
+        copy_file(temp_file, os.path.join(temp_dir, "out"), range_workers=4, range_size=range_size)
+    assert not os.path.exists(os.path.join(temp_dir, "out"))
+
+# Atomic writes and durability
+
+def test_write_atomico_sem_temporarios(temp_dir):
+    file_path = os.path.join(temp_dir, "out", "a.txt")
+    write_text_file(file_path, "one", atomic=True)
+    write_text_file(file_path, "two", atomic=True, durability="fsync")
+    assert read_text_file(file_path) == "two"
+    assert os.listdir(os.path.dirname(file_path)) == ["a.txt"]
+    plain = os.path.join(temp_dir, "plain.txt")
+    write_text_file(plain, "x")
+    assert os.stat(file_path).st_mode == os.stat(plain).st_mode
+
+def test_write_atomico_respeita_umask_atual(temp_dir):
+    # A umask vale no momento da escrita, não na importação do módulo
+    anterior = os.umask(0o077)
+    try:
+        write_text_file(os.path.join(temp_dir, "privado.txt"), "x", atomic=True)
+    finally:
+        os.umask(anterior)
+    assert os.stat(os.path.join(temp_dir, "privado.txt")).st_mode & 0o777 == 0o600
+
+def test_write_json_atomico_preserva_original_em_erro(temp_dir):
+    file_path = os.path.join(temp_dir, "data.json")
+    write_json_file(file_path, {"ok": True}, atomic=True)
+    with pytest.raises(TypeError):
+        write_json_file(file_path, {"bad": object()}, atomic=True)
+    assert read_json_file(file_path) == {"ok": True}
+    assert os.listdir(temp_dir) == ["data.json"]
+
+def test_durability_fsync_por_arquivo(temp_dir, monkeypatch):
+    calls = []
+    real_fsync = os.fsync
+    monkeypatch.setattr(os, "fsync", lambda fd: (calls.append(fd), real_fsync(fd)))
+    write_binary_file(os.path.join(temp_dir, "a.bin"), b"abc", atomic=True, durability="fsync")
+    assert len(calls) == 2  # arquivo + diretório
+
+def test_durability_fsync_sem_atomic_sincroniza_diretorio(temp_dir, monkeypatch):
+    calls = []
+    real_fsync = os.fsync
+    monkeypatch.setattr(os, "fsync", lambda fd: (calls.append(os.readlink(f"/proc/self/fd/{fd}")), real_fsync(fd)))
+    file_path = os.path.join(temp_dir, "novo.txt")
+    write_text_file(file_path, "abc", durability="fsync")
+    assert calls == [os.path.realpath(file_path), os.path.realpath(temp_dir)]
+
+def test_group_commit(temp_dir, monkeypatch):
+    calls = []
+    real_fsync = os.fsync
+    monkeypatch.setattr(os, "fsync", lambda fd: (calls.append(fd), real_fsync(fd)))
+    with GroupCommit() as group:
+        for i in range(5):
+            write_text_file(os.path.join(temp_dir, f"p{i}.txt"), str(i), durability=group)
+        write_binary_file(os.path.join(temp_dir, "p.bin"), b"b", durability=group)
+        # Nada visível antes do commit
+        assert not any(name.startswith("p") for name in os.listdir(temp_dir))
+        assert len(group) == 6
+    assert sorted(os.listdir(temp_dir)) == ["p.bin"] + [f"p{i}.txt" for i in range(5)]
+    assert len(calls) == 7  # 6 arquivos + 1 diretório
+
+def test_group_commit_rollback(temp_dir):
+    with pytest.raises(RuntimeError):
+        with GroupCommit() as group:
+            write_text_file(os.path.join(temp_dir, "a.txt"), "a", durability=group)
+            raise RuntimeError("boom")
+    assert os.listdir(temp_dir) == []
+
+def test_group_commit_falha_remove_temporarios(temp_dir, monkeypatch):
+    real_replace = os.replace
+
+    def replace_falha_no_segundo(src, dst):
+        if dst.endswith("b.txt"):
+            raise OSError(errno.EIO, "falha simulada")
+        real_replace(src, dst)
+
+    group = GroupCommit()
+    for name in ("a.txt", "b.txt", "c.txt"):
+        write_text_file(os.path.join(temp_dir, name), name, durability=group)
+    monkeypatch.setattr(os, "replace", replace_falha_no_segundo)
+    with pytest.raises(OSError):
+        group.commit()
+    # O que já foi renomeado fica; os demais temporários são removidos
+    assert os.listdir(temp_dir) == ["a.txt"]
+    assert len(group) == 0
+
+def test_durability_invalida(temp_dir):
+    with pytest.raises(ValueError):
+        write_text_file(os.path.join(temp_dir, "a.txt"), "a", durability="sometimes")
+
+# Byte ranges and memory-mapped reads
+
+@pytest.fixture
+def data_file(temp_dir):
+    file_path = os.path.join(temp_dir, "data.bin")
+    data = os.urandom(200_000)
+    with open(file_path, "wb") as f:
+        f.write(data)
+    return file_path, data
+
+def test_get_bytes_by_file_path_range(data_file):
+    file_path, data = data_file
+    assert get_bytes_by_file_path(file_path, offset=100, length=50) == data[100:150]
+    assert get_bytes_by_file_path(file_path, offset=199_990) == data[199_990:]
+    assert get_bytes_by_file_path(file_path, offset=500_000, length=10) == b""
+    with pytest.raises(ValueError):
+        get_bytes_by_file_path(file_path, offset=-1)
+
+def test_map_file_bytes_range_desalinhado(data_file):
+    file_path, data = data_file
+    with map_file_bytes(file_path, offset=70_001, length=1000) as view:
+        assert view.readonly
+        assert view.tobytes() == data[70_001:71_001]
+    with map_file_bytes(file_path) as view:
+        assert view[:4] == data[:4] and view[-4:] == data[-4:]
+    with pytest.raises(ValueError):
+        view.tobytes()  # liberado ao sair do bloco
+
+def test_get_bytes_by_file_path_use_mmap(data_file, temp_dir):
+    file_path, data = data_file
+    with get_bytes_by_file_path(file_path, use_mmap=True, length=16) as view:
+        assert bytes(view) == data[:16]
+    empty = os.path.join(temp_dir, "empty.bin")
+    open(empty, "wb").close()
+    with map_file_bytes(empty) as view:
+        assert len(view) == 0
+
+# Streaming text iterators
+
+def test_iter_text_lines(temp_dir, mock_logger):
+    file_path = os.path.join(temp_dir, "log.txt")
+    lines = [f"linha {i} çã\n" for i in range(1000)]
+    with open(file_path, "w", encoding="utf-8") as f:
+        f.writelines(lines)
+    assert list(iter_text_lines(file_path, buffer_size=64, log=mock_logger)) == lines
+    assert any(str(len(lines)) in msg and "KB" in msg for msg in mock_logger.debug_calls)
+
+def test_iter_text_chunks(temp_dir):
+    file_path = os.path.join(temp_dir, "big.txt")
+    content = "abcdefghij" * 1001
+    with open(file_path, "w") as f:
+        f.write(content)
+    chunks = list(iter_text_chunks(file_path, chunk_size=1000))
+    assert all(len(c) <= 1000 for c in chunks)
+    assert "".join(chunks) == content
+
+def test_iter_text_erros_de_decodificacao(temp_dir):
+    file_path = os.path.join(temp_dir, "bad.txt")
+    with open(file_path, "wb") as f:
+        f.write(b"ok\n\xff\xfe\n")
+    with pytest.raises(UnicodeDecodeError):
+        list(iter_text_lines(file_path))
+    assert list(iter_text_lines(file_path, errors="replace")) == ["ok\n", "\ufffd\ufffd\n"]
+
+def test_iter_text_lines_inexistente(temp_dir):
+    with pytest.raises(FileNotFoundError):
+        next(iter_text_lines(os.path.join(temp_dir, "nope.txt")))
+
+# JSON Lines e arrays incrementais
+
+def test_jsonl_ida_e_volta(temp_dir):
+    file_path = os.path.join(temp_dir, "dados.jsonl")
+    registros = ({"id": i, "nome": f"item {i}"} for i in range(100))
+    write_jsonl_file(file_path, registros, atomic=True)
+    lidos = list(read_jsonl_file(file_path))
+    assert len(lidos) == 100
+    assert lidos[42] == {"id": 42, "nome": "item 42"}
+
+def test_read_jsonl_linha_invalida(temp_dir):
+    file_path = os.path.join(temp_dir, "ruim.jsonl")
+    with open(file_path, "w") as f:
+        f.write('{"a": 1}\n\n{"a": \n')
+    with pytest.raises(json.JSONDecodeError, match="Line 3"):
+        list(read_jsonl_file(file_path))
+
+def test_json_array_writer_e_iter_json_array(temp_dir):
+    file_path = os.path.join(temp_dir, "array.json")
+    registros = [{"id": i, "valor": i * 1234567.5, "tags": ["a", "b"]} for i in range(500)] + [123456789, None, "fim"]
+    with JsonArrayWriter(file_path) as writer:
+        writer.write_many(registros)
+    with open(file_path) as f:
+        assert json.load(f) == registros
+    # Buffers pequenos cortam números e objetos entre leituras
+    for buffer_size in (1, 7, 64):
+        assert list(iter_json_array(file_path, buffer_size=buffer_size)) == registros
+
+@pytest.mark.parametrize("conteudo", ["[9193569392.10688]", "[1, 12.5, -3e10, 7]", "[ 12.5 ,\n 1e-3 ]"])
+def test_iter_json_array_numero_cortado_entre_leituras(temp_dir, conteudo):
+    file_path = os.path.join(temp_dir, "numeros.json")
+    with open(file_path, "w") as f:
+        f.write(conteudo)
+    for buffer_size in (1, 2, 3, 5):
+        assert list(iter_json_array(file_path, buffer_size=buffer_size)) == json.loads(conteudo)
+
+def test_json_array_writer_indentado_e_vazio(temp_dir):
+    file_path = os.path.join(temp_dir, "vazio.json")
+    with JsonArrayWriter(file_path, indent=2):
+        pass
+    assert json.load(open(file_path)) == []
+    assert list(iter_json_array(file_path)) == []
+    with JsonArrayWriter(file_path, indent=2) as writer:
+        writer.write({"a": 1})
+        writer.write({"b": 2})
+    assert list(iter_json_array(file_path)) == [{"a": 1}, {"b": 2}]
+
+def test_iter_json_array_invalido(temp_dir):
+    file_path = os.path.join(temp_dir, "invalido.json")
+    for conteudo in ('{"a": 1}', '[1, 2', '[1 2]', '[1,]', '[12x]'):
+        with open(file_path, "w") as f:
+            f.write(conteudo)
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_json_array(file_path, buffer_size=2))
+
+# Padrões de ignore compilados em copy_directory
+
+def test_copy_directory_ignore_patterns(temp_dir, monkeypatch):
+    src_dir = os.path.join(temp_dir, "src")
+    for rel in ("a.txt", "b.log", "sub/c.txt", "sub/d.tmp", "cache/e.txt", "cache/deep/f.txt", "sub/cache/g.txt"):
+        os.makedirs(os.path.dirname(os.path.join(src_dir, rel)), exist_ok=True)
+        with open(os.path.join(src_dir, rel), "w") as f:
+            f.write(rel)
+
+    visitados = []
+    scandir_original = os.scandir
+    def scandir_registrando(path):
+        visitados.append(os.path.relpath(path, src_dir))
+        return scandir_original(path)
+    monkeypatch.setattr(os, "scandir", scandir_registrando)
+
+    dst_dir = os.path.join(temp_dir, "dst")
+    copy_directory(src_dir, dst_dir, ignore_patterns=["*.log", "*.tmp", "cache"])
+
+    copiados = sorted(os.path.relpath(os.path.join(r, n), dst_dir) for r, _, ns in os.walk(dst_dir) for n in ns)
+    assert copiados == ["a.txt", os.path.join("sub", "c.txt")]
+    # Diretórios ignorados não são percorridos
+    assert not any(v.startswith("cache") or "cache" in v.split(os.sep) for v in visitados)
+
+def test_copy_directory_muitas_entradas(temp_dir):
+    src_dir = os.path.join(temp_dir, "src")
+    os.makedirs(src_dir)
+    for i in range(3000):
+        with open(os.path.join(src_dir, f"f{i}.{'tmp' if i % 3 == 0 else 'dat'}"), "w") as f:
+            f.write("x")
+    dst_dir = os.path.join(temp_dir, "dst")
+    copy_directory(src_dir, dst_dir, ignore_patterns=["*.tmp", "*.bak", "~*"])
+    assert len(os.listdir(dst_dir)) == 2000
+
+def test_copy_directory_symlink_de_diretorio(temp_dir):
+    src_dir = os.path.join(temp_dir, "src")
+    os.makedirs(os.path.join(src_dir, "real"))
+    with open(os.path.join(src_dir, "real", "x.txt"), "w") as f:
+        f.write("x")
+    os.symlink("real", os.path.join(src_dir, "link"))
+    dst_dir = os.path.join(temp_dir, "dst")
+    copy_directory(src_dir, dst_dir, symlinks=True)
+    assert os.path.islink(os.path.join(dst_dir, "link"))
+    assert os.readlink(os.path.join(dst_dir, "link")) == "real"
+
+# Remoção paralela de árvores
+
+def _criar_arvore(raiz, largura=4, profundidade=3, arquivos=5):
+    total = 0
+    niveis = [raiz]
+    os.makedirs(raiz)
+    for _ in range(profundidade):
+        proximos = []
+        for d in niveis:
+            for i in range(arquivos):
+                with open(os.path.join(d, f"f{i}.bin"), "wb") as f:
+                    f.write(b"x" * 100)
+                total += 1
+            for j in range(largura):
+                sub = os.path.join(d, f"d{j}")
+                os.makedirs(sub)
+                proximos.append(sub)
+        niveis = proximos
+    return total
+
+def test_purge_tree_estatisticas(temp_dir):
+    raiz = os.path.join(temp_dir, "scratch")
+    total = _criar_arvore(raiz)
+    alvo_externo = os.path.join(temp_dir, "externo.txt")
+    with open(alvo_externo, "w") as f:
+        f.write("não apagar")
+    os.symlink(alvo_externo, os.path.join(raiz, "link"))
+    os.symlink(temp_dir, os.path.join(raiz, "d0", "link_dir"))
+
+    stats = purge_tree(raiz, workers=3)
+    assert not os.path.exists(raiz)
+    assert os.path.exists(alvo_externo)
+    assert stats["files"] == total + 2
+    assert stats["bytes"] >= total * 100
+    assert stats["directories"] == 1 + 4 + 16 + 64
+    assert stats["errors"] == 0
+
+def test_purge_tree_invalido(temp_dir):
+    with pytest.raises(ValueError):
+        purge_tree(os.path.join(temp_dir, "nao_existe"))
+    with pytest.raises(ValueError):
+        purge_tree(temp_dir, workers=0)
+
+def test_delete_path_workers(temp_dir):
+    raiz = os.path.join(temp_dir, "scratch")
+    _criar_arvore(raiz, largura=2, profundidade=2)
+    assert delete_path(raiz, workers=2) is True
+    assert not os.path.exists(raiz)
+
+def test_detach_tree(temp_dir):
+    raiz = os.path.join(temp_dir, "scratch")
+    total = _criar_arvore(raiz, largura=2, profundidade=2)
+    future = detach_tree(raiz, workers=2)
+    assert not os.path.exists(raiz)
+    stats = future.result(timeout=30)
+    assert stats["files"] == total
+    assert os.listdir(temp_dir) == []
+
+def test_delete_path_detach(temp_dir):
+    raiz = os.path.join(temp_dir, "scratch")
+    _criar_arvore(raiz, largura=1, profundidade=1)
+    assert delete_path(raiz, detach=True) is True
+    assert not os.path.exists(raiz)
+    for thread in threading.enumerate():
+        if thread.name.startswith("file_toolkit_purge_"):
+            thread.join(timeout=30)
+    assert os.listdir(temp_dir) == []
+
+# Engine de move_directory
+
+def _arvore_para_mover(src_dir):
+    os.makedirs(os.path.join(src_dir, "sub", "deep"))
+    for rel, conteudo in (("a.txt", "new"), ("sub/b.txt", "b"), ("sub/deep/c.txt", "c")):
+        with open(os.path.join(src_dir, rel), "w") as f:
+            f.write(conteudo)
+
+def test_move_directory_renomeia_diretorio_inteiro(temp_dir):
+    src_dir = os.path.join(temp_dir, "src")
+    _arvore_para_mover(src_dir)
+    inode = os.stat(src_dir).st_ino
+    dest_dir = os.path.join(temp_dir, "staging", "dst")
+    move_directory(src_dir, dest_dir)
+    assert os.stat(dest_dir).st_ino == inode
+    assert os.path.isdir(src_dir) and not os.listdir(src_dir)
+    assert open(os.path.join(dest_dir, "sub", "deep", "c.txt")).read() == "c"
+
+def test_move_directory_merge(temp_dir):
+    src_dir = os.path.join(temp_dir, "src")
+    _arvore_para_mover(src_dir)
+    dest_dir = os.path.join(temp_dir, "dst")
+    os.makedirs(os.path.join(dest_dir, "sub"))
+    with open(os.path.join(dest_dir, "a.txt"), "w") as f:
+        f.write("old")
+    with open(os.path.join(dest_dir, "sub", "stale.txt"), "w") as f:
+        f.write("stale")
+    inode = os.stat(os.path.join(src_dir, "sub", "b.txt")).st_ino
+    move_directory(src_dir, dest_dir, merge=True)
+    assert open(os.path.join(dest_dir, "a.txt")).read() == "new"
+    assert sorted(os.listdir(os.path.join(dest_dir, "sub"))) == ["b.txt", "deep", "stale.txt"]
+    assert os.stat(os.path.join(dest_dir, "sub", "b.txt")).st_ino == inode
+    assert not os.listdir(src_dir)
+
+def test_move_directory_entre_dispositivos(temp_dir, monkeypatch):
+    monkeypatch.setattr(file_ops, "_same_device", lambda a, b: False)
+    src_dir = os.path.join(temp_dir, "src")
+    _arvore_para_mover(src_dir)
+    os.symlink("a.txt", os.path.join(src_dir, "link"))
+    dest_dir = os.path.join(temp_dir, "dst")
+    os.makedirs(os.path.join(dest_dir, "sub"))
+    with open(os.path.join(dest_dir, "sub", "stale.txt"), "w") as f:
+        f.write("stale")
+    move_directory(src_dir, dest_dir, workers=3, merge=True)
+    assert open(os.path.join(dest_dir, "sub", "deep", "c.txt")).read() == "c"
+    assert os.path.exists(os.path.join(dest_dir, "sub", "stale.txt"))
+    assert os.readlink(os.path.join(dest_dir, "link")) == "a.txt"
+    assert os.path.isdir(src_dir) and not os.listdir(src_dir)
+
+def test_move_directory_entre_dispositivos_substitui_por_padrao(temp_dir, monkeypatch):
+    monkeypatch.setattr(file_ops, "_same_device", lambda a, b: False)
+    src_dir = os.path.join(temp_dir, "src")
+    _arvore_para_mover(src_dir)
+    dest_dir = os.path.join(temp_dir, "dst")
+    os.makedirs(os.path.join(dest_dir, "sub"))
+    with open(os.path.join(dest_dir, "sub", "stale.txt"), "w") as f:
+        f.write("stale")
+    move_directory(src_dir, dest_dir)
+    assert sorted(os.listdir(os.path.join(dest_dir, "sub"))) == ["b.txt", "deep"]
+
+def test_move_directory_verificacao_falha_mantem_origem(temp_dir, monkeypatch):
+    monkeypatch.setattr(file_ops, "_same_device", lambda a, b: False)
+    verify_original = file_ops._verify_copy
+    monkeypatch.setattr(file_ops, "_verify_copy",
+                        lambda s, d, v, digest=None: not s.endswith("b.txt") and verify_original(s, d, v, digest))
+    src_dir = os.path.join(temp_dir, "src")
+    _arvore_para_mover(src_dir)
+    with pytest.raises(OSError, match="1 files"):
+        move_directory(src_dir, os.path.join(temp_dir, "dst"), verify="size")
+    assert os.path.exists(os.path.join(src_dir, "sub", "b.txt"))
+    assert not os.path.exists(os.path.join(src_dir, "a.txt"))
+    assert not os.path.exists(os.path.join(src_dir, "sub", "deep"))
+
+def test_move_directory_verify_invalido(temp_dir):
+    src_dir = os.path.join(temp_dir, "src")
+    os.makedirs(src_dir)
+    with pytest.raises(ValueError):
+        move_directory(src_dir, os.path.join(temp_dir, "dst"), verify="crc")
+
+# Cópia de arquivos esparsos
+
+def _arquivo_esparso(file_path, tamanho=64 * 1024 * 1024):
+    with open(file_path, "wb") as f:
+        f.truncate(tamanho)
+        f.seek(tamanho // 8)
+        f.write(b"inicio" * 1000)
+        f.seek(tamanho * 5 // 8)
+        f.write(b"meio" * 1000)
+    st = os.stat(file_path)
+    if not hasattr(os, "SEEK_DATA") or st.st_blocks * 512 >= st.st_size:
+        pytest.skip("sistema de arquivos sem suporte a arquivos esparsos")
+    return tamanho
+
+def test_copy_file_esparso(temp_dir):
+    src = os.path.join(temp_dir, "imagem.raw")
+    tamanho = _arquivo_esparso(src)
+    progresso = []
+    dst = copy_file(src, os.path.join(temp_dir, "dst"), progress_callback=progresso.append)
+    assert os.path.getsize(dst) == tamanho
+    assert sum(progresso) == tamanho
+    assert os.stat(dst).st_blocks * 512 < 1024 * 1024
+    with open(src, "rb") as a, open(dst, "rb") as b:
+        while True:
+            x, y = a.read(4 * 1024 * 1024), b.read(4 * 1024 * 1024)
+            assert x == y
+            if not x:
+                break
+
+def test_copy_file_esparso_desabilitado(temp_dir):
+    src = os.path.join(temp_dir, "imagem.raw")
+    tamanho = _arquivo_esparso(src, 8 * 1024 * 1024)
+    dst = copy_file(src, os.path.join(temp_dir, "dst"), sparse=False, engine="buffered")
+    assert os.path.getsize(dst) == tamanho
+    assert os.stat(dst).st_blocks * 512 >= tamanho
+
+def test_copy_file_somente_buraco(temp_dir):
+    src = os.path.join(temp_dir, "vazio.raw")
+    with open(src, "wb") as f:
+        f.truncate(5 * 1024 * 1024)
+    dst = copy_file(src, os.path.join(temp_dir, "dst"), sparse=True)
+    assert os.path.getsize(dst) == 5 * 1024 * 1024
+    with open(dst, "rb") as f:
+        assert f.read() == b"\0" * (5 * 1024 * 1024)
+
+def test_copy_directory_preserva_esparsos(temp_dir):
+    src_dir = os.path.join(temp_dir, "src")
+    os.makedirs(src_dir)
+    _arquivo_esparso(os.path.join(src_dir, "imagem.raw"))
+    copy_directory(src_dir, os.path.join(temp_dir, "dst"))
+    assert os.stat(os.path.join(temp_dir, "dst", "imagem.raw")).st_blocks * 512 < 1024 * 1024
+
+# Page-cache hints
+
+@pytest.mark.parametrize("engine", ["auto", "buffered"])
+def test_copy_file_io_hints_dontneed(temp_dir, engine, monkeypatch):
+    import io_ops
+    chamadas = []
+    fadvise = os.posix_fadvise
+    def registrar(fd, offset, length, advice):
+        chamadas.append(advice)
+        fadvise(fd, offset, length, advice)
+    monkeypatch.setattr(io_ops.os, "posix_fadvise", registrar)
+    src = os.path.join(temp_dir, "big.bin")
+    data = os.urandom(20 * 1024 * 1024)
+    with open(src, "wb") as f:
+        f.write(data)
+    seen = []
+    copied = copy_file(src, os.path.join(temp_dir, "out"), progress_callback=seen.append,
+                       engine=engine, io_hints="dontneed")
+    with open(copied, "rb") as f:
+        assert f.read() == data
+    assert sum(seen) == len(data)
+    assert chamadas.count(os.POSIX_FADV_SEQUENTIAL) == 2
+    # Liberação atrás do cursor durante a cópia e no fechamento de origem e destino
+    assert chamadas.count(os.POSIX_FADV_DONTNEED) > 2
+
+def test_copy_file_io_hints_invalido(temp_dir, temp_file):
+    with pytest.raises(ValueError):
+        copy_file(temp_file, os.path.join(temp_dir, "out"), io_hints="willneed")
+    assert not os.path.exists(os.path.join(temp_dir, "out"))
+
+# Resumable copy
+
+class _Interrompido(Exception):
+    pass
+
+def _copia_interrompida(src, dest_dir, limite):
+    copiados = [0]
+    def progresso(n):
+        copiados[0] += n
+        if copiados[0] >= limite:
+            raise _Interrompido()
+    with pytest.raises(_Interrompido):
+        copy_file(src, dest_dir, progress_callback=progresso, resume=True,
+                  checkpoint_bytes=256 * 1024, buffer_size=64 * 1024)
+
+@pytest.fixture
+def arquivo_resumivel(temp_dir):
+    src = os.path.join(temp_dir, "grande.bin")
+    data = os.urandom(2 * 1024 * 1024 + 77)
+    with open(src, "wb") as f:
+        f.write(data)
+    return src, data
+
+def test_copy_file_resume_sem_interrupcao(temp_dir, arquivo_resumivel):
+    src, data = arquivo_resumivel
+    dest_dir = os.path.join(temp_dir, "out")
+    copied = copy_file(src, dest_dir, resume=True, checkpoint_bytes=256 * 1024)
+    with open(copied, "rb") as f:
+        assert f.read() == data
+    assert sorted(os.listdir(dest_dir)) == ["grande.bin"]
+
+def test_copy_file_resume_continua_do_checkpoint(temp_dir, arquivo_resumivel):
+    src, data = arquivo_resumivel
+    dest_dir = os.path.join(temp_dir, "out")
+    _copia_interrompida(src, dest_dir, 1024 * 1024 + 100)
+    destino = os.path.join(dest_dir, "grande.bin")
+    assert not os.path.exists(destino)
+    with open(destino + ".partial.json") as f:
+        checkpoint = json.load(f)
+    assert checkpoint["offset"] == 1024 * 1024
+    assert checkpoint["size"] == len(data)
+
+    seen = []
+    copied = copy_file(src, dest_dir, progress_callback=seen.append, resume=True, buffer_size=64 * 1024)
+    with open(copied, "rb") as f:
+        assert f.read() == data
+    # O prefixo verificado é reportado de uma vez e não é copiado novamente
+    assert seen[0] == checkpoint["offset"]
+    assert sum(seen) == len(data)
+    assert sorted(os.listdir(dest_dir)) == ["grande.bin"]
+
+def test_copy_file_resume_prefixo_corrompido(temp_dir, arquivo_resumivel):
+    src, data = arquivo_resumivel
+    dest_dir = os.path.join(temp_dir, "out")
+    _copia_interrompida(src, dest_dir, 1024 * 1024 + 100)
+    with open(os.path.join(dest_dir, "grande.bin.partial"), "r+b") as f:
+        f.seek(1000)
+        f.write(b"\x00" * 16)
+
+    seen = []
+    copied = copy_file(src, dest_dir, progress_callback=seen.append, resume=True, buffer_size=64 * 1024)
+    with open(copied, "rb") as f:
+        assert f.read() == data
+    assert seen[0] == 64 * 1024
+
+def test_copy_file_resume_origem_alterada(temp_dir, arquivo_resumivel):
+    src, _ = arquivo_resumivel
+    dest_dir = os.path.join(temp_dir, "out")
+    _copia_interrompida(src, dest_dir, 1024 * 1024 + 100)
+    novo = os.urandom(1024 * 1024)
+    with open(src, "wb") as f:
+        f.write(novo)
+
+    seen = []
+    copied = copy_file(src, dest_dir, progress_callback=seen.append, resume=True, buffer_size=64 * 1024)
+    with open(copied, "rb") as f:
+        assert f.read() == novo
+    assert sum(seen) == len(novo)
+    assert seen[0] == 64 * 1024
+
+# Copy with checksum and verification
+
+def _sha256(file_path):
+    import hashlib
+    with open(file_path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+@pytest.mark.parametrize("verify", ["none", "sample", "full"])
+def test_copy_file_checksum_retorna_digest(temp_dir, verify):
+    src = os.path.join(temp_dir, "big.bin")
+    with open(src, "wb") as f:
+        f.write(os.urandom(2 * 1024 * 1024 + 5))
+    seen = []
+    copied, digest = copy_file(src, os.path.join(temp_dir, "out"), progress_callback=seen.append,
+                               checksum="sha256", verify=verify)
+    assert digest == _sha256(src) == _sha256(copied)
+    assert sum(seen) == os.path.getsize(src)
+
+def test_copy_file_checksum_le_origem_uma_vez(temp_dir, monkeypatch):
+    src = os.path.join(temp_dir, "big.bin")
+    with open(src, "wb") as f:
+        f.write(os.urandom(1024 * 1024))
+    import hashlib
+    hashes = []
+    def registrar(path, algorithm="sha256", *args, **kwargs):
+        hashes.append(path)
+        with open(path, "rb") as f:
+            return hashlib.new(algorithm, f.read()).hexdigest()
+    monkeypatch.setattr(file_ops, "get_file_hash", registrar)
+    copied, digest = copy_file(src, os.path.join(temp_dir, "out"), checksum="md5", verify="full")
+    # Só o destino é relido; a origem foi hasheada durante a cópia
+    assert hashes == [copied]
+    with open(src, "rb") as f:
+        assert digest == hashlib.md5(f.read()).hexdigest()
+
+def test_copy_file_verify_sem_checksum_retorna_caminho(temp_dir, temp_file):
+    copied = copy_file(temp_file, os.path.join(temp_dir, "out"), verify="full")
+    assert isinstance(copied, str)
+    with open(copied) as f:
+        assert f.read() == "abc123"
+
+@pytest.mark.parametrize("verify", ["sample", "full"])
+def test_copy_file_verify_detecta_corrupcao(temp_dir, verify, monkeypatch):
+    src = os.path.join(temp_dir, "big.bin")
+    with open(src, "wb") as f:
+        f.write(os.urandom(512 * 1024))
+    original = file_ops._copy_stream
+    def corromper(src_f, dst_f, *args, **kwargs):
+        copied = original(src_f, dst_f, *args, **kwargs)
+        dst_f.seek(0)
+        dst_f.write(b"\xff" * 8)
+        return copied
+    monkeypatch.setattr(file_ops, "_copy_stream", corromper)
+    with pytest.raises(OSError, match="verification"):
+        copy_file(src, os.path.join(temp_dir, "out"), engine="buffered", checksum="sha256", verify=verify)
+    assert not os.path.exists(os.path.join(temp_dir, "out", "big.bin"))
+
+def test_copy_file_checksum_com_resume(temp_dir, arquivo_resumivel):
+    src, data = arquivo_resumivel
+    dest_dir = os.path.join(temp_dir, "out")
+    _copia_interrompida(src, dest_dir, 1024 * 1024 + 100)
+    _, digest = copy_file(src, dest_dir, resume=True, checksum="sha256", verify="full")
+    assert digest == _sha256(src)
+
+def test_copy_file_resume_digest_vem_da_origem(temp_dir, arquivo_resumivel):
+    import zlib
+    src, data = arquivo_resumivel
+    dest_dir = os.path.join(temp_dir, "out")
+    _copia_interrompida(src, dest_dir, 1024 * 1024 + 100)
+    # Corrompe a cópia parcial e ajusta o checkpoint para que ela seja aceita
+    partial = os.path.join(dest_dir, os.path.basename(src)) + ".partial"
+    with open(partial + ".json") as f:
+        checkpoint = json.load(f)
+    with open(partial, "r+b") as f:
+        f.write(b"\xff" * 8)
+        f.seek(0)
+        checkpoint["crc32"] = zlib.crc32(f.read(checkpoint["offset"]))
+    with open(partial + ".json", "w") as f:
+        json.dump(checkpoint, f)
+    with pytest.raises(OSError, match="verification"):
+        copy_file(src, dest_dir, resume=True, checksum="sha256", verify="full")
+
+def test_copy_file_checksum_invalido(temp_dir, temp_file):
+    with pytest.raises(ValueError):
+        copy_file(temp_file, os.path.join(temp_dir, "out"), checksum="nada")
+    with pytest.raises(ValueError):
+        copy_file(temp_file, os.path.join(temp_dir, "out"), verify="hash")
+    # Digest de tamanho variável é recusado antes de copiar
+    with pytest.raises(ValueError, match="variable-length"):
+        copy_file(temp_file, os.path.join(temp_dir, "out"), checksum="shake_128")
+    assert not os.path.exists(os.path.join(temp_dir, "out"))
+
+@pytest.mark.parametrize("workers", [None, 3])
+def test_copy_directory_checksum(temp_dir, workers):
+    src_dir = os.path.join(temp_dir, "src")
+    os.makedirs(os.path.join(src_dir, "sub"))
+    for nome in ("a.bin", os.path.join("sub", "b.bin")):
+        with open(os.path.join(src_dir, nome), "wb") as f:
+            f.write(os.urandom(100 * 1024))
+    dst_dir = os.path.join(temp_dir, "dst")
+    resultado, digests = copy_directory(src_dir, dst_dir, workers=workers, checksum="sha256", verify="sample")
+    assert resultado == dst_dir
+    assert digests == {
+        os.path.join(dst_dir, "a.bin"): _sha256(os.path.join(src_dir, "a.bin")),
+        os.path.join(dst_dir, "sub", "b.bin"): _sha256(os.path.join(src_dir, "sub", "b.bin")),
+    }
+
+def test_copy_directory_parallel_digest_por_arquivo(temp_dir):
+    src_dir = os.path.join(temp_dir, "src")
+    os.makedirs(src_dir)
+    with open(os.path.join(src_dir, "a.txt"), "w") as f:
+        f.write("conteudo")
+    results = copy_directory_parallel(src_dir, os.path.join(temp_dir, "dst"), checksum="sha256", verify="full")
+    assert results[0]["digest"] == _sha256(os.path.join(src_dir, "a.txt"))
+    assert "digest" not in copy_directory_parallel(src_dir, os.path.join(temp_dir, "dst2"))[0]
+
+# Streaming CSV column reordering
+
+
+SCHEMA_CSV = [
+    {"column_name": "nome", "order": 2},
+    {"column_name": "id", "order": 1},
+    {"column_name": "valor", "order": 3},
+]
+
+def _escrever_csv(file_path, linhas, delimiter=","):
+    import csv
+    with open(file_path, "w", newline="", encoding="utf-8") as f:
+        csv.writer(f, delimiter=delimiter).writerows(linhas)
+
+def _ler_csv(file_path, delimiter=","):
+    import csv
+    with open(file_path, newline="", encoding="utf-8") as f:
+        return list(csv.reader(f, delimiter=delimiter))
+
+def test_reorder_csv_columns_em_blocos(temp_dir):
+    src = os.path.join(temp_dir, "dados.csv")
+    linhas = [["valor", "id", "nome"]] + [[str(i * 1.5), str(i), f"nome, {i}"] for i in range(25)]
+    _escrever_csv(src, linhas)
+    dest = reorder_csv_columns(src, SCHEMA_CSV, "order", destination_file_path=os.path.join(temp_dir, "out.csv"), chunk_rows=4)
+    resultado = _ler_csv(dest)
+    assert resultado[0] == ["id", "nome", "valor"]
+    assert resultado[1:] == [[str(i), f"nome, {i}", str(i * 1.5)] for i in range(25)]
+    # A origem não é alterada
+    assert _ler_csv(src) == linhas
+
+def test_reorder_csv_columns_tsv_no_lugar(temp_dir):
+    src = os.path.join(temp_dir, "dados.tsv")
+    _escrever_csv(src, [["nome", "valor", "id"], ["a", "1", "10"]], delimiter="\t")
+    assert reorder_csv_columns(src, SCHEMA_CSV, "order") == src
+    assert _ler_csv(src, delimiter="\t") == [["id", "nome", "valor"], ["10", "a", "1"]]
+
+def test_reorder_csv_columns_faltantes_e_extras(temp_dir):
+    src = os.path.join(temp_dir, "dados.csv")
+    _escrever_csv(src, [["extra", "nome", "id"], ["x", "a", "1"]])
+    with pytest.raises(KeyError):
+        reorder_csv_columns(src, SCHEMA_CSV, "order", destination_file_path=os.path.join(temp_dir, "out.csv"))
+    assert not os.path.exists(os.path.join(temp_dir, "out.csv"))
+
+    dest = reorder_csv_columns(src, SCHEMA_CSV, "order", destination_file_path=os.path.join(temp_dir, "out.csv"),
+                               fill_missing=True, keep_extra=True)
+    assert _ler_csv(dest) == [["id", "nome", "valor", "extra"], ["1", "a", "", "x"]]
+
+def test_reorder_csv_columns_linha_curta(temp_dir):
+    src = os.path.join(temp_dir, "dados.csv")
+    _escrever_csv(src, [["valor", "id", "nome"], ["1", "2", "3"], ["1"]])
+    with pytest.raises(ValueError, match="Line 3"):
+        reorder_csv_columns(src, SCHEMA_CSV, "order")
+    # A escrita é atômica: a origem fica intacta após a falha
+    assert _ler_csv(src)[0] == ["valor", "id", "nome"]
+
+def test_reorder_csv_columns_linha_longa_com_fill_missing(temp_dir):
+    src = os.path.join(temp_dir, "dados.csv")
+    # A linha longa não pode vazar o campo extra para a coluna faltante 'valor'
+    _escrever_csv(src, [["nome", "id"], ["a", "1"], ["b", "2", "vazou"]])
+    with pytest.raises(ValueError, match="Line 3"):
+        reorder_csv_columns(src, SCHEMA_CSV, "order", destination_file_path=os.path.join(temp_dir, "out.csv"),
+                            fill_missing=True)
+    assert not os.path.exists(os.path.join(temp_dir, "out.csv"))
+
+def test_reorder_csv_columns_ignora_linhas_em_branco(temp_dir):
+    src = os.path.join(temp_dir, "dados.csv")
+    with open(src, "w", encoding="utf-8") as f:
+        f.write("valor,id,nome\n1,2,a\n\n3,4,b\n\n")
+    dest = reorder_csv_columns(src, SCHEMA_CSV, "order", destination_file_path=os.path.join(temp_dir, "out.csv"))
+    assert _ler_csv(dest) == [["id", "nome", "valor"], ["2", "a", "1"], ["4", "b", "3"]]
+
+def test_reorder_csv_parametros_invalidos(temp_dir):
+    src = os.path.join(temp_dir, "dados.csv")
+    _escrever_csv(src, [["valor", "id", "nome"], ["1", "2", "3"]])
+    with pytest.raises(ValueError, match="chunk_rows"):
+        reorder_csv_columns(src, SCHEMA_CSV, "order", chunk_rows=0)
+    with pytest.raises(ValueError, match="chunk_rows"):
+        reorder_csv_files([(src, None)], SCHEMA_CSV, "order", chunk_rows=0)
+    with pytest.raises(ValueError, match="empty"):
+        reorder_csv_columns(src, [], "order")
+    with pytest.raises(ValueError, match="empty"):
+        reorder_csv_files([(src, None)], [], "order")
+    assert _ler_csv(src) == [["valor", "id", "nome"], ["1", "2", "3"]]
+
+def test_reorder_csv_columns_memoria_limitada(temp_dir):
+    import tracemalloc
+    src = os.path.join(temp_dir, "grande.csv")
+    with open(src, "w", encoding="utf-8") as f:
+        f.write("valor,id,nome\n")
+        for i in range(200000):
+            f.write(f"{i}.5,{i},nome_{i}\n")
+    tracemalloc.start()
+    try:
+        reorder_csv_columns(src, SCHEMA_CSV, "order", destination_file_path=os.path.join(temp_dir, "out.csv"), chunk_rows=1000)
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert pico < os.path.getsize(src) / 5
+
+@pytest.mark.parametrize("processes", [False, True])
+def test_reorder_csv_files_paralelo(temp_dir, processes):
+    pares = []
+    for i in range(3):
+        src = os.path.join(temp_dir, f"{i}.csv")
+        _escrever_csv(src, [["nome", "valor", "id"], [f"n{i}", "1", str(i)], [f"m{i}", "2", str(i)]])
+        pares.append((src, os.path.join(temp_dir, f"{i}_out.csv")))
+    pares.append((os.path.join(temp_dir, "inexistente.csv"), None))
+
+    results = reorder_csv_files(pares, SCHEMA_CSV, "order", workers=2, processes=processes)
+    assert [r["status"] for r in results] == ["reordered"] * 3 + ["failed"]
+    assert [r["rows"] for r in results[:3]] == [2, 2, 2]
+    assert results[3]["destination"] == pares[3][0]
+    assert _ler_csv(os.path.join(temp_dir, "1_out.csv")) == [["id", "nome", "valor"], ["1", "n1", "1"], ["1", "m1", "2"]]
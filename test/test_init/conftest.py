@@ -0,0 +1,25 @@
+"""
+Configurações compartilhadas para os testes do pacote file_toolkit (__init__).
+
+Os testes importam o pacote em um interpretador novo, para medir exatamente o que
+`import file_toolkit` carrega.
+"""
+
+import os
+import sys
+import subprocess
+import pytest
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+@pytest.fixture
+def run_python():
+    """Executa código em um interpretador novo com o pacote no PYTHONPATH."""
+    def run(code, *flags):
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join([SRC_DIR, os.path.join(SRC_DIR, "file_toolkit")])
+        result = subprocess.run([sys.executable, *flags, "-c", code], env=env,
+                                capture_output=True, text=True, cwd=SRC_DIR)
+        assert result.returncode == 0, result.stderr
+        return result
+    return run
@@ -0,0 +1,65 @@
+def test_import_nao_carrega_submodulos(run_python):
+    run_python(
+        "import sys, file_toolkit\n"
+        "carregados = [m for m in sys.modules if m.startswith('file_toolkit.')]\n"
+        "assert carregados == [], carregados\n"
+        "assert 'zipfile' not in sys.modules and 'filecmp' not in sys.modules\n"
+    )
+
+def test_nome_carrega_apenas_seu_submodulo(run_python):
+    run_python(
+        "import sys, file_toolkit\n"
+        "from file_toolkit import get_file_hash\n"
+        "assert 'file_toolkit.hash_ops' in sys.modules\n"
+        "assert 'file_toolkit.zip_ops' not in sys.modules\n"
+        "assert get_file_hash is file_toolkit.hash_ops.get_file_hash\n"
+    )
+
+def test_tabela_corresponde_ao_all_dos_submodulos(run_python):
+    run_python(
+        "import importlib, file_toolkit\n"
+        "for modulo, nomes in file_toolkit._SUBMODULE_EXPORTS.items():\n"
+        "    assert importlib.import_module('file_toolkit.' + modulo).__all__ == nomes, modulo\n"
+    )
+
+def test_import_estrela_e_dir(run_python):
+    run_python(
+        "import file_toolkit\n"
+        "ns = {}\n"
+        "exec('from file_toolkit import *', ns)\n"
+        "assert set(file_toolkit.__all__) <= set(ns)\n"
+        "assert 'copy_file' in dir(file_toolkit) and 'aio' in dir(file_toolkit)\n"
+    )
+
+def test_nome_inexistente(run_python):
+    run_python(
+        "import file_toolkit\n"
+        "try:\n"
+        "    file_toolkit.nao_existe\n"
+        "except AttributeError:\n"
+        "    pass\n"
+        "else:\n"
+        "    raise AssertionError('esperava AttributeError')\n"
+    )
+
+def test_configuracao_pelo_pacote_vale_para_os_submodulos(run_python, tmp_path):
+    # Os submódulos importam uns aos outros pelo pacote: file_toolkit.set_io_limit e
+    # file_toolkit.copy_file veem o mesmo rate_limit, e não há cópias soltas em sys.modules
+    origem = tmp_path / "dados.bin"
+    origem.write_bytes(b"x" * 10000)
+    run_python(
+        "import sys, file_toolkit\n"
+        f"origem, destino = {str(origem)!r}, {str(tmp_path / 'out')!r}\n"
+        "limite = file_toolkit.set_io_limit(bytes_per_sec=1000, burst=100)\n"
+        "file_toolkit.copy_file(origem, destino)\n"
+        "assert limite._byte_buckets[0]._tokens <= 100000 - 10000\n"
+        "file_toolkit.set_io_hints('dontneed')\n"
+        "assert file_toolkit.file_ops._resolve_io_hints(None) == 'dontneed'\n"
+        "file_toolkit.set_json_backend('auto')\n"
+        "assert file_toolkit.file_ops.get_json_codec() is file_toolkit.get_json_codec('auto')\n"
+        "assert file_toolkit.file_ops.get_logger is file_toolkit.get_logger\n"
+        "assert file_toolkit.backup_ops.BackupRepository is file_toolkit.BackupRepository\n"
+        "file_toolkit.aio\n"
+        "soltos = [m for m in file_toolkit._SUBMODULES if m in sys.modules]\n"
+        "assert soltos == [], soltos\n"
+    )
@@ -0,0 +1,35 @@
+"""
+Benchmark do tempo de import do pacote, a partir da saída de `python -X importtime`.
+
+Executar com: pytest test_init_performance.py -m performance -s
+"""
+
+import pytest
+
+pytestmark = pytest.mark.performance
+
+def _custo_import(run_python, code):
+    """Soma do tempo próprio (us) dos módulos importados por code além da inicialização do interpretador."""
+    def modulos(saida):
+        tempos = {}
+        for linha in saida.splitlines():
+            if not linha.startswith("import time:") or "self [us]" in linha:
+                continue
+            proprio, _, nome = linha[len("import time:"):].split("|")
+            tempos[nome.strip()] = int(proprio)
+        return tempos
+
+    base = modulos(run_python("pass", "-X", "importtime").stderr)
+    medido = modulos(run_python(code, "-X", "importtime").stderr)
+    return sum(t for nome, t in medido.items() if nome not in base)
+
+def test_import_preguicoso_vs_todos_os_submodulos(run_python):
+    # Primeira execução compila os .pyc para não contar a compilação
+    run_python("import file_toolkit\nfor nome in file_toolkit.__all__: getattr(file_toolkit, nome)")
+
+    preguicoso = min(_custo_import(run_python, "import file_toolkit") for _ in range(3))
+    completo = min(_custo_import(run_python, "import file_toolkit\n"
+                                             "for nome in file_toolkit.__all__: getattr(file_toolkit, nome)")
+                   for _ in range(3))
+    print(f"\nimport file_toolkit: {preguicoso / 1000:.2f} ms; com todos os submódulos: {completo / 1000:.2f} ms")
+    assert preguicoso * 5 < completo
@@ -0,0 +1,27 @@
+"""
+Configurações compartilhadas para todos os testes do io_ops.
+"""
+
+import sys
+import pytest
+import tempfile
+import shutil
+import os
+
+# Testa os módulos de src/file_toolkit, não cópias locais
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "src", "file_toolkit"))
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+@pytest.fixture
+def temp_dir():
+    d = tempfile.mkdtemp()
+    yield d
+    shutil.rmtree(d)
+
+@pytest.fixture
+def big_file(temp_dir):
+    file_path = os.path.join(temp_dir, "big.bin")
+    with open(file_path, "wb") as f:
+        f.write(os.urandom(4 * 1024 * 1024 + 321))
+    return file_path
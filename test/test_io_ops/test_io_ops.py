@@ -0,0 +1,121 @@
+import os
+import pytest
+from io_ops import AdaptiveBuffer
+from hash_ops import get_file_hash
+
+def test_adaptive_buffer_le_arquivo_inteiro(big_file):
+    with open(big_file, "rb", buffering=0) as f:
+        buffer = AdaptiveBuffer.for_fd(f.fileno())
+        parts = []
+        while chunk := buffer.readinto(f):
+            parts.append(bytes(chunk))
+            buffer.update(len(chunk))
+    with open(big_file, "rb") as f:
+        assert b"".join(parts) == f.read()
+
+def test_adaptive_buffer_tamanho_inicial(big_file):
+    st = os.stat(big_file)
+    buffer = AdaptiveBuffer.for_fd(os.open(big_file, os.O_RDONLY))
+    assert buffer.size >= max(st.st_blksize, 64 * 1024)
+    assert buffer.size % st.st_blksize == 0
+    # Arquivos pequenos começam com blocos menores
+    assert AdaptiveBuffer(file_size=10_000, block_size=4096).size == 64 * 1024
+    assert AdaptiveBuffer(file_size=10 * 1024 ** 3, block_size=4096).size == 1024 * 1024
+
+def test_adaptive_buffer_reutiliza_bytearray(big_file):
+    with open(big_file, "rb", buffering=0) as f:
+        buffer = AdaptiveBuffer(initial_size=65536, adaptive=False)
+        first = buffer.readinto(f)
+        second = buffer.readinto(f)
+        assert first.obj is second.obj
+        assert buffer.size == 65536
+
+def test_adaptive_buffer_cresce_com_throughput(monkeypatch):
+    import io_ops
+    clock = iter(range(1000))
+    monkeypatch.setattr(io_ops.time, "perf_counter", lambda: next(clock))
+    buffer = AdaptiveBuffer(initial_size=64 * 1024, max_size=256 * 1024, sample_reads=1)
+    buffer.update(0)
+    # Cada amostra leva 1 "segundo": bytes maiores por amostra = mais throughput
+    buffer.update(64 * 1024)
+    assert buffer.size == 128 * 1024
+    buffer.update(128 * 1024)
+    assert buffer.size == 256 * 1024
+    buffer.update(256 * 1024)
+    assert buffer.size == 256 * 1024
+
+def _registrar_fadvise(monkeypatch):
+    import io_ops
+    chamadas = []
+    monkeypatch.setattr(io_ops.os, "posix_fadvise", lambda fd, offset, length, advice: chamadas.append((offset, length, advice)), raising=False)
+    return chamadas
+
+def test_cache_hints_dontneed_atras_do_cursor(monkeypatch):
+    from io_ops import CacheHints
+    chamadas = _registrar_fadvise(monkeypatch)
+    with CacheHints(3, "dontneed", window=100) as hints:
+        hints.advance(60)
+        assert chamadas == [(0, 0, os.POSIX_FADV_SEQUENTIAL)]
+        hints.advance(60)
+        hints.advance(50)
+    assert chamadas[1] == (0, 120, os.POSIX_FADV_DONTNEED)
+    # Ao fechar, o arquivo inteiro é liberado
+    assert chamadas[-1] == (0, 0, os.POSIX_FADV_DONTNEED)
+
+def test_cache_hints_sequential_e_none(monkeypatch):
+    from io_ops import CacheHints
+    chamadas = _registrar_fadvise(monkeypatch)
+    with CacheHints(3, "sequential", window=10) as hints:
+        hints.advance(100)
+    assert chamadas == [(0, 0, os.POSIX_FADV_SEQUENTIAL)]
+    chamadas.clear()
+    callback = lambda n: None
+    with CacheHints(3, "none") as hints:
+        assert hints.wrap(callback) is callback
+        hints.advance(100)
+    assert chamadas == []
+
+def test_cache_hints_wrap_encadeia_progresso(monkeypatch):
+    from io_ops import CacheHints
+    chamadas = _registrar_fadvise(monkeypatch)
+    recebidos = []
+    hints = CacheHints(3, "dontneed", window=10)
+    callback = hints.wrap(recebidos.append)
+    callback(15)
+    assert recebidos == [15]
+    assert (0, 15, os.POSIX_FADV_DONTNEED) in chamadas
+
+def test_set_io_hints_padrao_global():
+    from io_ops import CacheHints, set_io_hints, get_io_hints
+    anterior = set_io_hints("dontneed")
+    try:
+        assert get_io_hints() == "dontneed"
+        assert CacheHints(0).policy == "dontneed"
+        assert CacheHints(0, "none").policy == "none"
+    finally:
+        set_io_hints(anterior)
+    assert get_io_hints() == anterior
+    with pytest.raises(ValueError):
+        set_io_hints("willneed")
+    with pytest.raises(ValueError):
+        CacheHints(0, "willneed")
+
+def test_get_file_hash_adaptativo_igual_fixo(temp_dir):
+    import hashlib
+    file_path = os.path.join(temp_dir, "big.bin")
+    data = os.urandom(3 * 1024 * 1024 + 5)
+    with open(file_path, "wb") as f:
+        f.write(data)
+    expected = hashlib.sha256(data).hexdigest()
+    assert get_file_hash(file_path) == expected
+    assert get_file_hash(file_path, chunk_size=8192) == expected
+
+def test_get_file_hash_io_hints(temp_dir):
+    file_path = os.path.join(temp_dir, "grande.bin")
+    with open(file_path, "wb") as f:
+        f.write(os.urandom(3 * 1024 * 1024))
+    esperado = get_file_hash(file_path)
+    assert get_file_hash(file_path, io_hints="dontneed") == esperado
+    assert get_file_hash(file_path, io_hints="sequential") == esperado
+    with pytest.raises(ValueError):
+        get_file_hash(file_path, io_hints="invalida")
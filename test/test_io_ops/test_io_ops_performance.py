@@ -0,0 +1,108 @@
+"""
+Benchmark do efeito de io_hints no page cache.
+
+Mede a fração de páginas residentes (mincore) de um arquivo depois de
+calcular seu hash e copiá-lo com e sem POSIX_FADV_DONTNEED, e o tempo
+de releitura correspondente.
+
+Executar com: pytest test_io_ops_performance.py -m performance -s
+"""
+
+import os
+import sys
+import time
+import mmap
+import ctypes
+import ctypes.util
+import pytest
+
+from hash_ops import get_file_hash
+from file_ops import copy_file
+
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.skipif(not sys.platform.startswith("linux") or not hasattr(os, "posix_fadvise"),
+                       reason="mincore/posix_fadvise apenas no Linux"),
+]
+
+TAMANHO = 64 * 1024 * 1024
+
+def _residencia(file_path):
+    """Fração das páginas do arquivo presentes no page cache (via mincore)."""
+    libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    libc.mmap.restype = ctypes.c_void_p
+    libc.mmap.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_long]
+    libc.munmap.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+    libc.mincore.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_char_p]
+
+    tamanho = os.path.getsize(file_path)
+    paginas = (tamanho + mmap.PAGESIZE - 1) // mmap.PAGESIZE
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        endereco = libc.mmap(None, tamanho, mmap.PROT_READ, mmap.MAP_SHARED, fd, 0)
+        if endereco in (None, ctypes.c_void_p(-1).value):
+            pytest.skip("mmap indisponível")
+        try:
+            vetor = ctypes.create_string_buffer(paginas)
+            if libc.mincore(endereco, tamanho, vetor) != 0:
+                pytest.skip(f"mincore falhou: {os.strerror(ctypes.get_errno())}")
+            return sum(b & 1 for b in vetor.raw) / paginas
+        finally:
+            libc.munmap(endereco, tamanho)
+    finally:
+        os.close(fd)
+
+def _esfriar(file_path):
+    """Grava as páginas sujas e remove o arquivo do page cache."""
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+def _releitura(file_path):
+    inicio = time.perf_counter()
+    with open(file_path, "rb", buffering=0) as f:
+        while f.read(1024 * 1024):
+            pass
+    return time.perf_counter() - inicio
+
+@pytest.fixture
+def arquivo_frio(temp_dir):
+    file_path = os.path.join(temp_dir, "frio.bin")
+    with open(file_path, "wb") as f:
+        for _ in range(TAMANHO // (1024 * 1024)):
+            f.write(os.urandom(1024 * 1024))
+    _esfriar(file_path)
+    if _residencia(file_path) > 0.1:
+        pytest.skip("o sistema de arquivos não libera o page cache (tmpfs?)")
+    return file_path
+
+def test_hash_residencia_none_vs_dontneed(arquivo_frio):
+    get_file_hash(arquivo_frio, io_hints="none")
+    com_cache = _residencia(arquivo_frio)
+    releitura_quente = _releitura(arquivo_frio)
+
+    _esfriar(arquivo_frio)
+    get_file_hash(arquivo_frio, io_hints="dontneed")
+    sem_cache = _residencia(arquivo_frio)
+    releitura_fria = _releitura(arquivo_frio)
+
+    print(f"\nhash none: {com_cache:.0%} residente, releitura {releitura_quente * 1000:.1f} ms"
+          f"\nhash dontneed: {sem_cache:.0%} residente, releitura {releitura_fria * 1000:.1f} ms")
+    assert sem_cache < 0.1
+    assert sem_cache < com_cache
+
+def test_copy_residencia_none_vs_dontneed(arquivo_frio, temp_dir):
+    destino_none = copy_file(arquivo_frio, os.path.join(temp_dir, "none"), engine="buffered", io_hints="none")
+    origem_none, copia_none = _residencia(arquivo_frio), _residencia(destino_none)
+
+    _esfriar(arquivo_frio)
+    destino_dontneed = copy_file(arquivo_frio, os.path.join(temp_dir, "dontneed"), engine="buffered", io_hints="dontneed")
+    origem_dontneed, copia_dontneed = _residencia(arquivo_frio), _residencia(destino_dontneed)
+
+    print(f"\ncopy none: origem {origem_none:.0%}, destino {copia_none:.0%} residentes"
+          f"\ncopy dontneed: origem {origem_dontneed:.0%}, destino {copia_dontneed:.0%} residentes")
+    assert origem_dontneed < 0.1
+    assert origem_dontneed + copia_dontneed < origem_none + copia_none
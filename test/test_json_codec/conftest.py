@@ -0,0 +1,40 @@
+"""
+Configurações compartilhadas para todos os testes do json_codec.
+"""
+
+import os
+import sys
+import pytest
+import tempfile
+import shutil
+
+# Testa os módulos de src/file_toolkit, não cópias locais
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "src", "file_toolkit"))
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+@pytest.fixture
+def temp_dir():
+    d = tempfile.mkdtemp()
+    yield d
+    shutil.rmtree(d)
+
+@pytest.fixture
+def payload():
+    """Metadados representativos: muitos registros pequenos com strings, números e listas."""
+    return {
+        "dataset": "vendas_diarias",
+        "gerado_em": "2024-05-01T12:00:00Z",
+        "arquivos": [
+            {
+                "caminho": f"/dados/particao={i % 30}/parte-{i:05d}.parquet",
+                "tamanho": 1024 * 1024 + i,
+                "linhas": i * 17,
+                "checksum": f"{i:064x}",
+                "colunas": ["id", "valor", "data", "região"],
+                "estatisticas": {"min": -i * 0.5, "max": i * 1.25, "nulos": i % 7},
+                "ativo": i % 2 == 0,
+            }
+            for i in range(2000)
+        ],
+    }
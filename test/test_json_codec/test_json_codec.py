@@ -0,0 +1,75 @@
+import os
+import json
+import pytest
+
+from json_codec import JsonCodec, get_json_codec, set_json_backend, available_json_backends
+from file_ops import write_json_file, read_json_file
+
+BACKENDS = available_json_backends()
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_ida_e_volta_por_backend(backend, payload):
+    codec = JsonCodec(backend)
+    assert codec.name == backend
+    for kwargs in ({}, {"indent": 2}, {"indent": 4, "sort_keys": True}, {"compact": True}):
+        encoded = codec.dumps(payload, **kwargs)
+        assert isinstance(encoded, bytes)
+        assert codec.loads(encoded) == payload
+        assert json.loads(encoded) == payload
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_fallback_para_stdlib(backend):
+    # Inteiros acima de 64 bits e chaves não-string não são aceitos por todos os backends
+    dados = {"grande": 2 ** 70, 1: "um"}
+    assert json.loads(JsonCodec(backend).dumps(dados)) == {"grande": 2 ** 70, "1": "um"}
+
+def test_compacto_menor_que_indentado(payload):
+    codec = get_json_codec()
+    assert len(codec.dumps(payload, compact=True)) < 0.8 * len(codec.dumps(payload, indent=4))
+
+def test_backend_invalido():
+    with pytest.raises(ValueError):
+        JsonCodec("simdjson")
+
+def test_set_json_backend():
+    assert get_json_codec().name == "json"
+    try:
+        assert set_json_backend("auto").name == BACKENDS[0]
+        assert get_json_codec().name == BACKENDS[0]
+    finally:
+        set_json_backend("json")
+    assert get_json_codec().name == "json"
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_loads_fallback_para_stdlib(backend):
+    # Literais não padrão que só a stdlib aceita
+    dados = JsonCodec(backend).loads(b'{"nan": NaN, "inf": Infinity}')
+    assert dados["nan"] != dados["nan"] and dados["inf"] == float("inf")
+    with pytest.raises(json.JSONDecodeError):
+        JsonCodec(backend).loads(b'{"a": ')
+
+def test_padrao_preserva_nan_e_inteiros_grandes(temp_dir):
+    from file_ops import write_jsonl_file, read_jsonl_file, JsonArrayWriter, iter_json_array
+    dados = [{"grande": 2 ** 70, "inf": float("inf")}, -2 ** 65]
+    json_path = write_json_file(os.path.join(temp_dir, "a.json"), dados)
+    assert read_json_file(json_path) == dados
+    jsonl_path = write_jsonl_file(os.path.join(temp_dir, "a.jsonl"), dados)
+    assert list(read_jsonl_file(jsonl_path)) == dados
+    array_path = os.path.join(temp_dir, "array.json")
+    with JsonArrayWriter(array_path) as writer:
+        writer.write_many(dados)
+    assert list(iter_json_array(array_path)) == dados
+    nan = read_json_file(write_json_file(json_path, {"nan": float("nan")}))["nan"]
+    assert nan != nan
+
+def test_write_json_file_compacto(temp_dir, payload):
+    indentado = write_json_file(os.path.join(temp_dir, "a.json"), payload)
+    compacto = write_json_file(os.path.join(temp_dir, "b.json"), payload, compact=True)
+    assert os.path.getsize(compacto) < os.path.getsize(indentado)
+    assert read_json_file(compacto) == read_json_file(indentado, backend="json") == payload
+
+def test_write_json_file_stdlib_mantem_formato(temp_dir):
+    dados = {"b": [1, 2], "a": "ção"}
+    file_path = write_json_file(os.path.join(temp_dir, "c.json"), dados, backend="json")
+    with open(file_path, encoding="utf-8") as f:
+        assert f.read() == json.dumps(dados, indent=4)
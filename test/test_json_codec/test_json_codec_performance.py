@@ -0,0 +1,41 @@
+"""
+Benchmark de throughput de encode/decode por backend JSON.
+
+Executar com: pytest test_json_codec_performance.py -m performance -s
+"""
+
+import time
+import pytest
+
+from json_codec import JsonCodec, available_json_backends
+
+pytestmark = pytest.mark.performance
+
+def _throughput(func, size, repeticoes=5):
+    """Melhor MB/s entre as repetições."""
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        func()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return size / melhor / (1024 * 1024)
+
+@pytest.mark.parametrize("backend", available_json_backends())
+@pytest.mark.parametrize("modo", ["indent4", "compact"])
+def test_throughput_encode_decode(backend, modo, payload):
+    codec = JsonCodec(backend)
+    kwargs = {"compact": True} if modo == "compact" else {"indent": 4}
+    encoded = codec.dumps(payload, **kwargs)
+
+    encode = _throughput(lambda: codec.dumps(payload, **kwargs), len(encoded))
+    decode = _throughput(lambda: codec.loads(encoded), len(encoded))
+    print(f"\n{backend:7s} {modo:8s} {len(encoded) / 1024:8.1f} KB  encode {encode:8.1f} MB/s  decode {decode:8.1f} MB/s")
+    assert encode > 0 and decode > 0
+
+def test_backend_automatico_nao_e_mais_lento_que_stdlib(payload):
+    auto, stdlib = JsonCodec(), JsonCodec("json")
+    size = len(stdlib.dumps(payload, compact=True))
+    rapido = _throughput(lambda: auto.dumps(payload, compact=True), size)
+    referencia = _throughput(lambda: stdlib.dumps(payload, compact=True), size)
+    print(f"\n{auto.name} compact encode {rapido:.1f} MB/s vs json {referencia:.1f} MB/s")
+    assert rapido >= referencia * 0.8
@@ -0,0 +1,42 @@
+"""
+Configurações compartilhadas para todos os testes do log_utils.
+"""
+
+import os
+import sys
+import pytest
+import tempfile
+import shutil
+
+# Testa os módulos de src/file_toolkit, não cópias locais
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "src", "file_toolkit"))
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from log_utils import reset_logger
+
+@pytest.fixture
+def temp_dir():
+    d = tempfile.mkdtemp()
+    yield d
+    shutil.rmtree(d)
+
+@pytest.fixture(autouse=True)
+def logger_limpo():
+    reset_logger()
+    yield
+    reset_logger()
+
+# Mock logger
+class MockLogger:
+    """Logger simulado para testes que não precisam de logging real."""
+    def __init__(self):
+        self.debug_calls, self.info_calls, self.warning_calls, self.error_calls = [], [], [], []
+    def debug(self, msg): self.debug_calls.append(msg)
+    def info(self, msg): self.info_calls.append(msg)
+    def warning(self, msg): self.warning_calls.append(msg)
+    def error(self, msg): self.error_calls.append(msg)
+
+@pytest.fixture
+def mock_logger():
+    return MockLogger()
@@ -0,0 +1,74 @@
+import logging
+import pytest
+
+import log_utils
+from log_utils import get_logger, reset_logger, error_handler, log_lazy, log_debug
+
+def test_get_logger_configura_uma_vez(monkeypatch):
+    chamadas = []
+    def configure():
+        chamadas.append(1)
+        return logging.getLogger("file_toolkit_teste")
+    monkeypatch.setattr(log_utils, "configure_basic_logging", configure)
+    assert get_logger() is get_logger()
+    assert len(chamadas) == 1
+    reset_logger()
+    get_logger()
+    assert len(chamadas) == 2
+
+def test_log_debug_nao_formata_com_nivel_desabilitado():
+    logger = logging.getLogger("file_toolkit_teste_nivel")
+    logger.setLevel(logging.INFO)
+
+    class Caro:
+        formatado = False
+        def __str__(self):
+            Caro.formatado = True
+            return "caro"
+
+    log_debug(logger, "valor %s", Caro())
+    assert not Caro.formatado
+    logger.setLevel(logging.DEBUG)
+    log_debug(logger, "valor %s", Caro())
+    assert Caro.formatado
+
+def test_log_lazy_logger_simulado(mock_logger):
+    log_debug(mock_logger, "Lidos %s de %s", "1.00 KB", "a.txt")
+    log_lazy(mock_logger, logging.WARNING, "100%% de %s", "b.txt")
+    log_lazy(mock_logger, logging.INFO, "sem argumentos %s")
+    assert mock_logger.debug_calls == ["Lidos 1.00 KB de a.txt"]
+    assert mock_logger.warning_calls == ["100% de b.txt"]
+    assert mock_logger.info_calls == ["sem argumentos %s"]
+
+def test_error_handler_relanca_e_registra(mock_logger):
+    with pytest.raises(FileNotFoundError):
+        with error_handler("Lendo x", mock_logger):
+            raise FileNotFoundError("x")
+    with pytest.raises(PermissionError):
+        with error_handler("Escrevendo y", mock_logger):
+            raise PermissionError("y")
+    with pytest.raises(ValueError):
+        with error_handler("Validando z", mock_logger):
+            raise ValueError("z")
+    assert mock_logger.error_calls == [
+        "Lendo x failed: File not found - x",
+        "Escrevendo y failed: Permission denied - y",
+        "Validando z failed: z",
+    ]
+
+def test_error_handler_sem_reraise(mock_logger):
+    with error_handler("Operação", mock_logger, reraise=False):
+        raise RuntimeError("falhou")
+    assert mock_logger.error_calls == ["Operação failed: falhou"]
+
+def test_error_handler_ignora_base_exceptions(mock_logger):
+    with pytest.raises(KeyboardInterrupt):
+        with error_handler("Operação", mock_logger, reraise=False):
+            raise KeyboardInterrupt()
+    assert mock_logger.error_calls == []
+
+def test_modulos_compartilham_o_nucleo():
+    import file_ops, hash_ops, search_ops, stats_ops, sync_ops, zip_ops, monitor_ops, temp_file_utils
+    for modulo in (file_ops, hash_ops, search_ops, stats_ops, sync_ops, zip_ops, monitor_ops, temp_file_utils):
+        assert modulo.get_logger is get_logger
+        assert modulo.error_handler is error_handler
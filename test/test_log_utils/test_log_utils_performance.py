@@ -0,0 +1,80 @@
+"""
+Benchmark do custo por chamada do núcleo de logging.
+
+Executar com: pytest test_log_utils_performance.py -m performance -s
+"""
+
+import os
+import time
+import logging
+import pytest
+from contextlib import contextmanager
+from logging_metrics import configure_basic_logging
+
+from log_utils import get_logger, error_handler, log_debug
+from file_ops import file_exists
+
+pytestmark = pytest.mark.performance
+
+N = 20000
+
+@pytest.fixture(autouse=True)
+def niveis_restaurados():
+    """Os benchmarks mudam níveis de loggers compartilhados; devolve os originais."""
+    loggers = [get_logger(), logging.getLogger("file_toolkit_bench")]
+    niveis = [logger.level for logger in loggers]
+    yield
+    for logger, nivel in zip(loggers, niveis):
+        logger.setLevel(nivel)
+
+def _por_chamada(func, n=N):
+    """Custo médio por chamada em microssegundos."""
+    inicio = time.perf_counter()
+    for _ in range(n):
+        func()
+    return (time.perf_counter() - inicio) / n * 1e6
+
+@contextmanager
+def _error_handler_gerador(operation, logger=None, reraise=True):
+    try:
+        yield
+    except Exception as e:
+        logger.error(f"{operation} failed: {str(e)}")
+        if reraise:
+            raise
+
+def test_get_logger_em_cache_vs_reconfigurar():
+    reconfigurar = _por_chamada(configure_basic_logging, n=2000)
+    cache = _por_chamada(get_logger)
+    print(f"\nconfigure_basic_logging {reconfigurar:.2f} us/chamada, get_logger {cache:.3f} us/chamada")
+    assert cache < reconfigurar
+
+def test_error_handler_classe_vs_gerador():
+    logger = get_logger()
+    def com_classe():
+        with error_handler("op", logger):
+            pass
+    def com_gerador():
+        with _error_handler_gerador("op", logger):
+            pass
+    classe, gerador = _por_chamada(com_classe), _por_chamada(com_gerador)
+    print(f"\nerror_handler classe {classe:.3f} us, contextmanager {gerador:.3f} us")
+    assert classe < gerador
+
+def test_log_debug_desabilitado_vs_fstring():
+    logger = logging.getLogger("file_toolkit_bench")
+    logger.setLevel(logging.INFO)
+    caminho, erro = "/dados/particao=1/arquivo.parquet", OSError(2, "No such file or directory")
+    lazy = _por_chamada(lambda: log_debug(logger, "Error getting size of %s: %s", caminho, erro))
+    fstring = _por_chamada(lambda: logger.debug(f"Error getting size of {caminho}: {str(erro)}"))
+    print(f"\nlog_debug {lazy:.3f} us, f-string {fstring:.3f} us")
+    assert lazy < fstring
+
+def test_file_exists_em_loop(tmp_path):
+    alvo = tmp_path / "a.txt"
+    alvo.write_text("x")
+    get_logger().setLevel(logging.INFO)
+    custo = _por_chamada(lambda: file_exists(str(alvo)))
+    stat = _por_chamada(lambda: os.path.isfile(str(alvo)))
+    print(f"\nfile_exists {custo:.2f} us/chamada (os.path.isfile {stat:.2f} us)")
+    assert custo < stat + 20
@@ -0,0 +1,57 @@
+"""
+Configurações compartilhadas para todos os testes do rate_limit.
+"""
+
+import sys
+import os
+import pytest
+import tempfile
+import shutil
+from types import SimpleNamespace
+
+# Testa os módulos de src/file_toolkit, não cópias locais
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "src", "file_toolkit"))
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from rate_limit import clear_io_limits
+
+@pytest.fixture
+def temp_dir():
+    d = tempfile.mkdtemp()
+    yield d
+    shutil.rmtree(d)
+
+@pytest.fixture(autouse=True)
+def sem_limites():
+    clear_io_limits()
+    yield
+    clear_io_limits()
+
+@pytest.fixture
+def relogio(monkeypatch):
+    """Relógio falso: sleep avança o tempo sem esperar."""
+    import rate_limit
+
+    class Relogio:
+        agora = 1000.0
+        dormido = []
+
+        def monotonic(self):
+            return self.agora
+
+        def sleep(self, segundos):
+            self.dormido.append(segundos)
+            self.agora += segundos
+
+    falso = Relogio()
+    falso.dormido = []
+    monkeypatch.setattr(rate_limit, "time", SimpleNamespace(monotonic=falso.monotonic, sleep=falso.sleep))
+    return falso
+
+@pytest.fixture
+def arquivo(temp_dir):
+    file_path = os.path.join(temp_dir, "dados.bin")
+    with open(file_path, "wb") as f:
+        f.write(os.urandom(256 * 1024))
+    return file_path
@@ -0,0 +1,208 @@
+import os
+import threading
+import zipfile
+import pytest
+from rate_limit import TokenBucket, IOThrottle, set_io_limit, clear_io_limits, get_io_throttle
+from hash_ops import get_file_hash
+import file_ops
+from file_ops import copy_file, copy_files, copy_directory, copy_directory_parallel, move_directory
+from backup_ops import BackupRepository
+from zip_ops import zip_file, unzip_file
+from sync_ops import sync_directories
+
+def test_token_bucket_consome_rajada_sem_esperar(relogio):
+    bucket = TokenBucket(100, capacity=50)
+    assert bucket.acquire(50) == 0
+    assert relogio.dormido == []
+
+def test_token_bucket_espera_pela_divida(relogio):
+    bucket = TokenBucket(100, capacity=50)
+    bucket.acquire(50)
+    assert bucket.acquire(25) == pytest.approx(0.25)
+    # Pedido maior que a capacidade é atendido com espera proporcional
+    assert bucket.acquire(200) == pytest.approx(2.0)
+    assert relogio.dormido == [pytest.approx(0.25), pytest.approx(2.0)]
+
+def test_token_bucket_reabastece_ate_capacidade(relogio):
+    bucket = TokenBucket(100, capacity=50)
+    bucket.acquire(50)
+    relogio.agora += 10
+    assert bucket.acquire(50) == 0
+    assert bucket.acquire(10) == pytest.approx(0.1)
+
+def test_token_bucket_parametros_invalidos():
+    with pytest.raises(ValueError):
+        TokenBucket(0)
+    with pytest.raises(ValueError):
+        TokenBucket(10, capacity=0)
+    with pytest.raises(ValueError):
+        IOThrottle()
+
+def test_io_throttle_bytes_e_operacoes(relogio):
+    throttle = IOThrottle(bytes_per_sec=1000, ops_per_sec=10)
+    throttle.acquire(1000, ops=10)
+    # A espera é a do orçamento mais lento
+    assert throttle.acquire(100, ops=5) == pytest.approx(0.5)
+    recebidos = []
+    throttle.wrap(recebidos.append)(500)
+    assert recebidos == [500]
+
+def test_io_throttle_compartilhado_entre_threads():
+    import time
+    throttle = IOThrottle(bytes_per_sec=1_000_000, burst=0.1)
+    def trabalhador():
+        for _ in range(5):
+            throttle.acquire(20_000)
+    threads = [threading.Thread(target=trabalhador) for _ in range(4)]
+    inicio = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    # 400 KB contra um único orçamento de 1 MB/s com 100 KB de rajada: ao menos 0,3 s no total
+    assert time.perf_counter() - inicio >= 0.28
+
+def test_get_io_throttle_sem_limites():
+    assert get_io_throttle("/qualquer/caminho") is None
+
+def test_get_io_throttle_global_caminho_e_dispositivo(temp_dir):
+    global_ = set_io_limit(bytes_per_sec=10_000_000)
+    assert get_io_throttle("/outro") is global_
+
+    nas = os.path.join(temp_dir, "nas")
+    do_caminho = set_io_limit(bytes_per_sec=1_000_000, path=nas)
+    combinado = get_io_throttle(os.path.join(nas, "a", "b.bin"))
+    assert combinado.bytes_per_sec == 1_000_000
+    assert len(combinado._byte_buckets) == 2
+
+    set_io_limit(path=nas)
+    assert get_io_throttle(os.path.join(nas, "a")) is global_
+
+    set_io_limit(path=None)
+    do_dispositivo = set_io_limit(ops_per_sec=50, path=temp_dir, per_device=True)
+    assert get_io_throttle(os.path.join(temp_dir, "inexistente", "x")) is do_dispositivo
+    clear_io_limits()
+    assert get_io_throttle(temp_dir) is None
+    assert do_caminho is not None
+
+def test_set_io_limit_por_dispositivo_exige_caminho():
+    with pytest.raises(ValueError):
+        set_io_limit(bytes_per_sec=1, per_device=True)
+
+def test_get_file_hash_consome_orcamento(arquivo, relogio):
+    throttle = set_io_limit(bytes_per_sec=64 * 1024, ops_per_sec=100, path=os.path.dirname(arquivo))
+    get_file_hash(arquivo, chunk_size=64 * 1024)
+    # 256 KB a 64 KB/s com 64 KB de rajada: 3 s de espera
+    assert sum(relogio.dormido) == pytest.approx(3.0)
+    assert throttle._op_buckets[0]._tokens == pytest.approx(99)
+
+def test_copy_file_consome_orcamento(arquivo, temp_dir, relogio):
+    set_io_limit(bytes_per_sec=128 * 1024, path=os.path.join(temp_dir, "destino"))
+    seen = []
+    copied = copy_file(arquivo, os.path.join(temp_dir, "destino"), progress_callback=seen.append, buffer_size=64 * 1024)
+    with open(copied, "rb") as f, open(arquivo, "rb") as g:
+        assert f.read() == g.read()
+    assert sum(seen) == 256 * 1024
+    assert sum(relogio.dormido) == pytest.approx(1.0)
+
+def test_zip_e_unzip_consomem_orcamento(arquivo, temp_dir, relogio):
+    set_io_limit(ops_per_sec=1, burst=1.0)
+    origem = os.path.join(temp_dir, "origem")
+    os.makedirs(origem)
+    for i in range(3):
+        with open(os.path.join(origem, f"{i}.txt"), "w") as f:
+            f.write("x" * 100)
+    zip_path = zip_file(origem, os.path.join(temp_dir, "saida.zip"))
+    assert sum(relogio.dormido) == pytest.approx(2.0)
+    unzip_file(zip_path, os.path.join(temp_dir, "extraido"))
+    assert sum(relogio.dormido) == pytest.approx(5.0)
+    assert sorted(zipfile.ZipFile(zip_path).namelist()) == ["origem/0.txt", "origem/1.txt", "origem/2.txt"]
+
+@pytest.mark.parametrize("paralelo", [False, True])
+def test_copy_directory_consome_orcamento_por_bloco(temp_dir, relogio, paralelo):
+    origem = os.path.join(temp_dir, "origem")
+    os.makedirs(origem)
+    with open(os.path.join(origem, "grande.bin"), "wb") as f:
+        f.write(os.urandom(4 * 1024 * 1024))
+    set_io_limit(bytes_per_sec=1024 * 1024)
+    destino = os.path.join(temp_dir, "destino")
+    if paralelo:
+        copy_directory_parallel(origem, destino, workers=2)
+    else:
+        copy_directory(origem, destino)
+    # 4 MB a 1 MB/s com 1 MB de rajada, descontados bloco a bloco durante a cópia
+    assert sum(relogio.dormido) == pytest.approx(3.0)
+    assert len(relogio.dormido) > 1
+
+def test_copy_files_consome_orcamento(temp_dir, relogio):
+    origens = []
+    for i in range(2):
+        caminho = os.path.join(temp_dir, f"{i}.bin")
+        with open(caminho, "wb") as f:
+            f.write(os.urandom(1024 * 1024))
+        origens.append(caminho)
+    throttle = set_io_limit(bytes_per_sec=1024 * 1024, ops_per_sec=100)
+    destino = os.path.join(temp_dir, "destino")
+    resultados = copy_files([(origem, destino) for origem in origens], workers=2)
+    assert [r["status"] for r in resultados] == ["copied", "copied"]
+    # 2 MB a 1 MB/s com 1 MB de rajada, descontados bloco a bloco
+    assert sum(relogio.dormido) == pytest.approx(1.0)
+    assert len(relogio.dormido) > 1
+    assert throttle._op_buckets[0]._tokens == pytest.approx(98)
+
+def test_move_directory_entre_dispositivos_consome_orcamento(temp_dir, relogio, monkeypatch):
+    monkeypatch.setattr(file_ops, "_same_device", lambda a, b: False)
+    origem = os.path.join(temp_dir, "origem")
+    os.makedirs(origem)
+    with open(os.path.join(origem, "grande.bin"), "wb") as f:
+        f.write(os.urandom(2 * 1024 * 1024))
+    set_io_limit(bytes_per_sec=1024 * 1024)
+    move_directory(origem, os.path.join(temp_dir, "destino"), verify="size")
+    assert os.path.getsize(os.path.join(temp_dir, "destino", "grande.bin")) == 2 * 1024 * 1024
+    assert sum(relogio.dormido) == pytest.approx(1.0)
+
+def test_backup_repository_consome_orcamento_ao_guardar(arquivo, temp_dir, relogio):
+    repo = BackupRepository(os.path.join(temp_dir, "repo"))
+    set_io_limit(bytes_per_sec=64 * 1024, path=repo.root)
+    repo.backup(arquivo)
+    # Só a cópia para o repositório é limitada: 256 KB a 64 KB/s com 64 KB de rajada
+    assert sum(relogio.dormido) == pytest.approx(3.0)
+
+def test_zip_e_unzip_consomem_bytes_por_bloco(arquivo, temp_dir, relogio):
+    set_io_limit(bytes_per_sec=64 * 1024)
+    zip_path = zip_file(arquivo, os.path.join(temp_dir, "saida.zip"), compression_level=1)
+    # 256 KB a 64 KB/s com 64 KB de rajada
+    assert sum(relogio.dormido) == pytest.approx(3.0)
+    assert len(relogio.dormido) == 3
+    unzip_file(zip_path, os.path.join(temp_dir, "extraido"))
+    assert sum(relogio.dormido) == pytest.approx(7.0)
+    with open(arquivo, "rb") as f, open(os.path.join(temp_dir, "extraido", "dados.bin"), "rb") as g:
+        assert f.read() == g.read()
+    info = zipfile.ZipFile(zip_path).getinfo("dados.bin")
+    assert info.compress_type == zipfile.ZIP_DEFLATED and info.file_size == 256 * 1024
+
+def test_unzip_com_limite_nao_escapa_do_destino(temp_dir, relogio):
+    zip_path = os.path.join(temp_dir, "malicioso.zip")
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        # Passa na checagem por prefixo: <temp>/out2 começa com <temp>/out
+        zf.writestr("../out2/pwned.txt", "x")
+    set_io_limit(bytes_per_sec=64 * 1024)
+    destino = os.path.join(temp_dir, "out")
+    unzip_file(zip_path, destino)
+    # Mesmo saneamento de ZipFile.extract: '..' é descartado
+    assert not os.path.exists(os.path.join(temp_dir, "out2"))
+    with open(os.path.join(destino, "out2", "pwned.txt")) as f:
+        assert f.read() == "x"
+
+def test_sync_directories_consome_orcamento(temp_dir, relogio):
+    origem = os.path.join(temp_dir, "origem")
+    destino = os.path.join(temp_dir, "destino")
+    os.makedirs(os.path.join(origem, "sub"))
+    for nome in ("a.bin", os.path.join("sub", "b.bin")):
+        with open(os.path.join(origem, nome), "wb") as f:
+            f.write(os.urandom(100 * 1024))
+    set_io_limit(bytes_per_sec=100 * 1024, path=destino)
+    stats = sync_directories(origem, destino)
+    assert stats["copied"] == 2
+    # 200 KB a 100 KB/s com 100 KB de rajada
+    assert sum(relogio.dormido) == pytest.approx(1.0, rel=0.05)
@@ -0,0 +1,46 @@
+"""
+Benchmark do limite de vazão compartilhado entre threads.
+
+Executar com: pytest test_rate_limit_performance.py -m performance -s
+"""
+
+import os
+import time
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+
+from rate_limit import set_io_limit
+from hash_ops import get_file_hash
+
+pytestmark = pytest.mark.performance
+
+LIMITE = 32 * 1024 * 1024
+RAJADA = 0.25
+
+def test_hash_paralelo_respeita_limite_global(temp_dir):
+    arquivos = []
+    for i in range(8):
+        file_path = os.path.join(temp_dir, f"{i}.bin")
+        with open(file_path, "wb") as f:
+            f.write(os.urandom(8 * 1024 * 1024))
+        arquivos.append(file_path)
+    total = 8 * 8 * 1024 * 1024
+
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(get_file_hash, arquivos))
+    livre = time.perf_counter() - inicio
+
+    set_io_limit(bytes_per_sec=LIMITE, burst=RAJADA)
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(get_file_hash, arquivos))
+    limitado = time.perf_counter() - inicio
+
+    vazao = total / limitado
+    print(f"\nsem limite: {total / livre / 1024 ** 2:.0f} MB/s, "
+          f"com limite de {LIMITE // 1024 ** 2} MB/s: {vazao / 1024 ** 2:.1f} MB/s")
+    # Só a rajada inicial (0,25 s de orçamento) passa sem espera
+    minimo = (total - LIMITE * RAJADA) / LIMITE
+    assert limitado >= minimo * 0.95
+    assert limitado <= minimo * 1.5 + livre